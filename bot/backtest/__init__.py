@@ -7,7 +7,7 @@ Backtest engine for strategy optimization and performance metrics.
 Fixed: Now correctly exports all market data generators including
 generate_test_bars_with_volatility() from bot.market_data.simulator.
 """
-from .engine import BacktestEngine, BacktestResult, Bar
+from .engine import BacktestEngine, BacktestResult, Bar, BarPool, print_backtest_report
 from .walkforward import WalkForwardAnalyzer, WalkForwardResult
 from ..market_data.simulator import (
     generate_test_bars,
@@ -22,6 +22,7 @@ __all__ = [
     "BacktestEngine",
     "BacktestResult",
     "Bar",
+    "BarPool",
     "generate_test_bars",
     "generate_test_bars_with_volatility",
     "generate_bullish_bars",
@@ -10,8 +10,12 @@ from typing import List, Dict, Any, Optional
 from dataclasses import dataclass, field
 from pathlib import Path
 
+import numpy as np
+
 from ..config import Config
 from ..core.signals import SignalGenerator
+from ..core.signals_numba import NUMBA_AVAILABLE, NumbaZScoreEngine
+from ..risk.circuit_breaker import CircuitBreaker, CircuitBreakerConfig
 from ..utils.helpers import calculate_pnl
 
 logger = logging.getLogger(__name__)
@@ -40,10 +44,12 @@ class BacktestResult:
     avg_loss: float = 0.0
     profit_factor: float = 0.0
     sharpe_ratio: float = 0.0
+    # Closed trades when the circuit breaker's drawdown limit is first hit (-1: never)
+    drawdown_breach_trade: int = -1
     trades: List[Dict[str, Any]] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class Bar:
     """OHLCV bar"""
     timestamp: datetime
@@ -53,6 +59,44 @@ class Bar:
     close: float
     volume: int
 
+    def reset(self, timestamp: datetime, open: float, high: float, low: float,
+              close: float, volume: int) -> "Bar":
+        """Overwrite all fields in place (for pooled bars); returns self"""
+        self.timestamp = timestamp
+        self.open = open
+        self.high = high
+        self.low = low
+        self.close = close
+        self.volume = volume
+        return self
+
+
+class BarPool:
+    """
+    Fixed set of preallocated Bar objects, handed out round-robin.
+
+    For streaming consumers that process each bar and drop it: after
+    `size` more acquisitions a bar is reset and handed out again, so
+    callers must not keep references to pooled bars beyond that.
+    """
+
+    def __init__(self, size: int):
+        if size <= 0:
+            raise ValueError("BarPool size must be positive")
+        self._pool = [Bar(None, 0.0, 0.0, 0.0, 0.0, 0) for _ in range(size)]
+        self._idx = 0
+
+    def __len__(self) -> int:
+        return len(self._pool)
+
+    def acquire(self) -> Bar:
+        """Next bar in the pool (stale fields until reset() is called)"""
+        bar = self._pool[self._idx]
+        self._idx += 1
+        if self._idx == len(self._pool):
+            self._idx = 0
+        return bar
+
 
 class BacktestEngine:
     """Backtest engine for strategy testing"""
@@ -62,11 +106,27 @@ class BacktestEngine:
         self.signal_gen = SignalGenerator(config.strategy.lookback_period)
         self.position: Optional[BacktestPosition] = None
 
+    def reset(self, config: Optional[Config] = None) -> None:
+        """
+        Clear signal and position state so the engine can run again.
+
+        Args:
+            config: New config to run with (default: keep the current one);
+                the signal generator is only rebuilt if the lookback changes
+        """
+        if config is not None:
+            if config.strategy.lookback_period != self.config.strategy.lookback_period:
+                self.signal_gen = SignalGenerator(config.strategy.lookback_period)
+            self.config = config
+        self.signal_gen.reset()
+        self.position = None
+
     def run(
         self,
         bars: List[Bar],
         multiplier: float = 5.0,  # MES contract multiplier
         slippage: float = 0.25,  # 1 tick
+        max_drawdown: float = CircuitBreakerConfig.max_drawdown,
     ) -> BacktestResult:
         """
         Run backtest on historical bars.
@@ -75,6 +135,9 @@ class BacktestEngine:
             bars: List of OHLCV bars (must be time-sorted)
             multiplier: Contract value multiplier
             slippage: Price slippage per trade (in ticks)
+            max_drawdown: Circuit breaker drawdown limit used to flag the
+                first breach in result.drawdown_breach_trade (trading is
+                not halted)
 
         Returns:
             BacktestResult with performance metrics
@@ -86,15 +149,28 @@ class BacktestEngine:
         equity_curve = [0.0]
         current_equity = 0.0
 
-        for bar in bars:
-            # Update signal generator
-            zscore = self.signal_gen.update(bar.close)
-
-            if not self.signal_gen.is_ready():
-                continue
+        # With the numba engine, compute every Z-Score up front in the
+        # parallel kernel; the signal state machine below stays per bar
+        zscores = None
+        if NUMBA_AVAILABLE and isinstance(self.signal_gen.engine, NumbaZScoreEngine):
+            closes = np.fromiter((bar.close for bar in bars), dtype=np.float64, count=len(bars))
+            zscores = self.signal_gen.batch_update(closes).tolist()
+
+        for i, bar in enumerate(bars):
+            if zscores is None:
+                # Update signal generator
+                zscore = self.signal_gen.update(bar.close)
+
+                if not self.signal_gen.is_ready():
+                    continue
+            else:
+                zscore = zscores[i]
+                if zscore != zscore:  # NaN: window not full yet
+                    continue
 
             # Generate signal
-            signal = self.signal_gen.get_signal(
+            signal = self.signal_gen.signal_for(
+                zscore,
                 z_threshold_entry=self.config.strategy.z_threshold_entry,
                 z_threshold_exit=self.config.strategy.z_threshold_exit,
             )
@@ -192,16 +268,17 @@ class BacktestEngine:
             total_wins / total_losses if total_losses > 0 else 0.0
         )
 
+        # Where the live circuit breaker would have halted on drawdown;
+        # equity_curve[k] is the equity after k closed trades
+        breaker = CircuitBreaker(CircuitBreakerConfig(max_drawdown=max_drawdown))
+        result.drawdown_breach_trade = breaker.check_drawdown_series(equity_curve)
+
         # Sharpe ratio (simplified)
         if len(equity_curve) > 1:
-            import statistics
-            returns = [
-                (equity_curve[i] - equity_curve[i-1])
-                for i in range(1, len(equity_curve))
-            ]
-            if returns:
-                avg_return = statistics.mean(returns)
-                std_return = statistics.stdev(returns) if len(returns) > 1 else 0.0001
+            returns = np.diff(np.asarray(equity_curve, dtype=np.float64))
+            if returns.size:
+                avg_return = float(returns.mean())
+                std_return = float(returns.std(ddof=1)) if returns.size > 1 else 0.0001
                 result.sharpe_ratio = (
                     (avg_return / std_return) * (252 ** 0.5)
                     if std_return > 0 else 0.0
@@ -384,6 +461,8 @@ def print_backtest_report(result: BacktestResult):
     print("📈 Risk Metrics")
     print("-" * 60)
     print(f"  Sharpe Ratio:        {result.sharpe_ratio:.2f}")
+    if result.drawdown_breach_trade >= 0:
+        print(f"  Drawdown Breach:     after trade {result.drawdown_breach_trade} (circuit breaker would halt)")
     print(f"  Profit per Trade:     ${result.total_pnl / result.total_trades if result.total_trades else 0:.2f}")
     print()
 
@@ -12,8 +12,10 @@ from datetime import datetime
 from typing import List, Dict, Any
 from dataclasses import dataclass, field
 
+import numpy as np
+
 from bot.config import Config
-from bot.backtest import BacktestEngine, Bar, BacktestResult, print_backtest_report
+from bot.backtest.engine import BacktestEngine, Bar, BacktestResult, print_backtest_report
 
 logger = logging.getLogger(__name__)
 
@@ -129,11 +131,10 @@ class WalkForwardAnalyzer:
             result.max_drawdown = max(f["max_drawdown"] for f in result.folds)
 
             # Sharpe ratio
-            import statistics
-            fold_returns = [f["pnl"] for f in result.folds]
-            if len(fold_returns) > 1:
-                mean_return = statistics.mean(fold_returns)
-                std_return = statistics.stdev(fold_returns)
+            fold_returns = np.array([f["pnl"] for f in result.folds], dtype=np.float64)
+            if fold_returns.size > 1:
+                mean_return = float(fold_returns.mean())
+                std_return = float(fold_returns.std(ddof=1))
                 result.sharpe_ratio = (
                     (mean_return / std_return) * (n_folds ** 0.5)
                     if std_return > 0 else 0.0
@@ -3,6 +3,8 @@ Configuration Management
 
 Loads and validates bot configuration from YAML file.
 """
+import copy
+import functools
 import os
 import yaml
 from pathlib import Path
@@ -12,8 +14,18 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# libyaml-backed loader when PyYAML was built with it, pure Python otherwise
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
-@dataclass
+
+@functools.lru_cache(maxsize=32)
+def _load_config_cached(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a YAML config once per (path, mtime, size); callers must not mutate the result"""
+    with open(path, "r") as f:
+        return yaml.load(f, Loader=_YAML_LOADER)
+
+
+@dataclass(slots=True, frozen=True)
 class StrategyConfig:
     """Strategy parameters"""
     lookback_period: int = 20
@@ -22,7 +34,7 @@ class StrategyConfig:
     min_volume: int = 100
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RiskConfig:
     """Risk management parameters"""
     max_position_size: int = 2
@@ -33,7 +45,7 @@ class RiskConfig:
     max_position_duration_hours: float = 2.0
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class IBKRConfig:
     """IBKR connection parameters"""
     host: str = "127.0.0.1"
@@ -45,7 +57,7 @@ class IBKRConfig:
     max_reconnect_attempts: int = 5
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class InstrumentConfig:
     """Trading instrument configuration"""
     symbol: str
@@ -57,7 +69,7 @@ class InstrumentConfig:
     tick_value: float = 1.25
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TelegramConfig:
     """Telegram alert configuration"""
     enabled: bool = False
@@ -65,7 +77,7 @@ class TelegramConfig:
     chat_id: str = ""
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LoggingConfig:
     """Logging configuration"""
     level: str = "INFO"
@@ -74,14 +86,14 @@ class LoggingConfig:
     backup_count: int = 5
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DatabaseConfig:
     """Database configuration"""
     url: str = "sqlite:///data/trades.db"
     echo: bool = False
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TradingHoursConfig:
     """Trading hours configuration"""
     start: str = "09:30"
@@ -90,7 +102,7 @@ class TradingHoursConfig:
     days: List[int] = (0, 1, 2, 3, 4)  # Monday=0 through Friday=4
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DebugConfig:
     """Debug options"""
     dry_run: bool = False
@@ -98,7 +110,7 @@ class DebugConfig:
     save_market_data: bool = False
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Config:
     """Complete bot configuration"""
     strategy: StrategyConfig
@@ -134,11 +146,17 @@ class Config:
         """Load configuration from YAML file"""
         logger.info(f"Loading config from {config_path}")
 
-        if not Path(config_path).exists():
-            raise FileNotFoundError(f"Config file not found: {config_path}")
+        path = Path(config_path)
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Config file not found: {config_path}") from None
 
-        with open(config_path, "r") as f:
-            data = yaml.safe_load(f)
+        # Size joins mtime in the key so a same-tick rewrite is still seen;
+        # the cached parse is shared, so hand the dataclasses a private copy
+        data = copy.deepcopy(
+            _load_config_cached(str(path.resolve()), st.st_mtime_ns, st.st_size)
+        )
 
         # Parse and validate
         return cls(
@@ -6,7 +6,7 @@ Main trading logic: manages state, signals, orders, and risk.
 import asyncio
 import logging
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, TYPE_CHECKING
+from typing import Optional, Dict, Any, Iterable, TYPE_CHECKING
 from dataclasses import dataclass, field
 
 from ..config import Config
@@ -76,6 +76,22 @@ class TradingEngine:
         # Will be set when IBKR client connects
         self.ibkr_client = None
 
+    def reset(self, config: Optional[Config] = None) -> None:
+        """
+        Clear signal, position and daily state so the engine can be reused.
+
+        Args:
+            config: New config to run with (default: keep the current one);
+                the signal generator is only rebuilt if the lookback changes
+        """
+        if config is not None:
+            if config.strategy.lookback_period != self.config.strategy.lookback_period:
+                self.signal_gen = SignalGenerator(config.strategy.lookback_period)
+            self.config = config
+        self.signal_gen.reset()
+        self.state = EngineState()
+        self._shutdown_event.clear()
+
     def set_ibkr_client(self, client):
         """Set the IBKR client for order execution"""
         self.ibkr_client = client
@@ -138,6 +154,11 @@ class TradingEngine:
             logger.exception(f"Error processing bar: {e}")
             await self.alerts.send_error(f"Process bar error: {str(e)}")
 
+    async def process_bars(self, bars: Iterable[Dict[str, Any]]):
+        """Process a batch of bars in order within one coroutine"""
+        for bar in bars:
+            await self.process_bar(bar)
+
     async def _handle_signal(self, signal: Dict[str, Any]):
         """Handle a trading signal"""
         if not self.ibkr_client:
@@ -6,6 +6,9 @@ Generates trading signals based on Z-Score mean reversion strategy.
 from dataclasses import dataclass
 from typing import Optional, Dict, Any
 import logging
+import math
+
+import numpy as np
 
 # Try to import Rust engine, fall back to Python
 try:
@@ -14,6 +17,8 @@ try:
 except ImportError:
     RUST_AVAILABLE = False
 
+from .signals_numba import NUMBA_AVAILABLE, NumbaZScoreEngine, rolling_zscores
+
 logger = logging.getLogger(__name__)
 
 
@@ -32,10 +37,13 @@ class SignalGenerator:
     def __init__(self, lookback_period: int = 20):
         self.lookback_period = lookback_period
 
-        # Use Rust engine if available, otherwise Python
+        # Use Rust engine if available, then the numba kernel, otherwise Python
         if RUST_AVAILABLE:
             logger.info("Using Rust Z-Score engine (high performance)")
             self.engine = RustZScoreEngine(lookback_period)
+        elif NUMBA_AVAILABLE:
+            logger.info("Using Numba Z-Score engine")
+            self.engine = NumbaZScoreEngine(lookback_period)
         else:
             logger.warning("Rust engine not available, using Python fallback")
             self.engine = PythonZScoreEngine(lookback_period)
@@ -54,10 +62,53 @@ class SignalGenerator:
         """
         return self.engine.update(price)
 
+    def batch_update(self, prices) -> np.ndarray:
+        """
+        Update with many prices at once and return all their Z-Scores.
+
+        Same result as calling update() for each price in turn (population
+        std, 0.0 for a flat window), computed over sliding windows in NumPy,
+        or by the parallel numba kernel when numba is installed.
+
+        Args:
+            prices: Price sequence, oldest first
+
+        Returns:
+            float64 array aligned with prices; NaN until the window is full
+        """
+        prices = np.asarray(prices, dtype=np.float64)
+        lookback = self.lookback_period
+        zscores = np.full(prices.size, np.nan)
+
+        # Prices already in the window count towards the first windows
+        history = self.engine.get_prices()[-(lookback - 1):] if lookback > 1 else []
+        series = np.concatenate([np.asarray(history, dtype=np.float64), prices])
+
+        if NUMBA_AVAILABLE:
+            zscores = rolling_zscores(series, lookback)[series.size - prices.size:]
+        elif series.size >= lookback:
+            windows = np.lib.stride_tricks.sliding_window_view(series, lookback)
+            means = windows.mean(axis=1)
+            stds = windows.std(axis=1)
+            deviation = series[lookback - 1:] - means
+            z = np.divide(deviation, stds, out=np.zeros_like(deviation), where=stds > 0)
+            zscores[prices.size - z.size:] = z
+
+        # Leave the engine holding the latest window, as update() would
+        for price in prices[-lookback:].tolist():
+            self.engine.update(price)
+
+        return zscores
+
     def is_ready(self) -> bool:
         """Check if the engine has enough data to generate signals"""
         return self.engine.is_ready()
 
+    def reset(self) -> None:
+        """Clear price history and signal state"""
+        self.engine.reset()
+        self._last_signal_type = None
+
     def get_mean(self) -> Optional[float]:
         """Get current rolling mean"""
         return self.engine.get_mean()
@@ -86,8 +137,20 @@ class SignalGenerator:
         Returns:
             Signal dict with type and reason, or None if no signal
         """
-        zscore = self.engine.get_zscore()
+        return self.signal_for(self.engine.get_zscore(), z_threshold_entry, z_threshold_exit)
 
+    def signal_for(
+        self,
+        zscore: Optional[float],
+        z_threshold_entry: float = 2.0,
+        z_threshold_exit: float = 0.5,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Generate a trading signal for a given Z-Score (see get_signal).
+
+        Lets callers that computed Z-Scores in bulk (batch_update) run the
+        same signal state machine bar by bar.
+        """
         if zscore is None:
             return None
 
@@ -125,39 +188,93 @@ class SignalGenerator:
 
 
 class PythonZScoreEngine:
-    """Python fallback Z-Score engine (for when Rust is not available)"""
+    """
+    Python fallback Z-Score engine (for when Rust is not available).
+
+    The window lives in a NumPy ring buffer with running sums of each
+    price's offset from a reference price, so update() is O(1) instead of
+    re-summing the window. Offsets keep the sums small, which limits
+    cancellation in sum_sq/n - mean^2; the reference and sums are rebuilt
+    each time the ring wraps, so drift is bounded and the cost amortizes
+    to O(1).
+    """
 
     def __init__(self, period: int):
         self.period = period
-        self.prices: list[float] = []
+        self._buf = np.empty(period, dtype=np.float64)
+        self._idx = 0  # Next slot to overwrite
+        self._count = 0  # Filled slots, capped at period
+        self._shift = 0.0  # Reference price the sums are taken around
+        self._sum = 0.0
+        self._sum_sq = 0.0
         self._zscore: Optional[float] = None
 
     def update(self, price: float) -> Optional[float]:
         """Update with new price"""
-        self.prices.append(price)
-
-        # Keep only last N prices
-        if len(self.prices) > self.period:
-            self.prices.pop(0)
+        if self._count == 0:
+            self._shift = price
+        shift = self._shift
+        period = self.period
+        idx = self._idx
+
+        if self._count == period:
+            old = self._buf[idx] - shift
+            self._sum -= old
+            self._sum_sq -= old * old
+        else:
+            self._count += 1
+
+        self._buf[idx] = price
+        d = price - shift
+        self._sum += d
+        self._sum_sq += d * d
+        if idx + 1 < period:
+            self._idx = idx + 1
+        else:
+            self._idx = 0
+            if self._count == period:
+                self._resync()
 
         # Calculate Z-Score
-        if len(self.prices) >= self.period:
-            mean = sum(self.prices) / len(self.prices)
-            variance = sum((p - mean) ** 2 for p in self.prices) / len(self.prices)
-            std = variance ** 0.5
-
-            if std > 0:
-                self._zscore = (price - mean) / std
-            else:
-                self._zscore = 0.0
-        else:
+        if self._count < period:
             self._zscore = None
+            return None
+
+        mean_d = self._sum / period
+        variance = self._sum_sq / period - mean_d * mean_d
+        if variance > 0:
+            self._zscore = (price - self._shift - mean_d) / math.sqrt(variance)
+        else:
+            self._zscore = 0.0
 
         return self._zscore
 
+    def _resync(self) -> None:
+        """Re-anchor on the oldest price and recompute the sums exactly"""
+        prices = self.get_prices()
+        self._shift = prices[0]
+        offsets = [p - self._shift for p in prices]
+        self._sum = math.fsum(offsets)
+        self._sum_sq = math.fsum(d * d for d in offsets)
+
+    def reset(self) -> None:
+        """Clear all data, keeping the buffer allocated"""
+        self._idx = 0
+        self._count = 0
+        self._sum = 0.0
+        self._sum_sq = 0.0
+        self._zscore = None
+
+    def get_prices(self) -> list[float]:
+        """Get prices in the current window, oldest first"""
+        if self._count < self.period:
+            return self._buf[:self._count].tolist()
+        # Full ring: the oldest price sits in the slot written next
+        return np.roll(self._buf, -self._idx).tolist()
+
     def is_ready(self) -> bool:
         """Check if we have enough data"""
-        return len(self.prices) >= self.period
+        return self._count >= self.period
 
     def get_zscore(self) -> Optional[float]:
         """Get current Z-Score"""
@@ -165,17 +282,16 @@ class PythonZScoreEngine:
 
     def get_mean(self) -> Optional[float]:
         """Get current mean"""
-        if not self.prices:
+        if not self._count:
             return None
-        return sum(self.prices) / len(self.prices)
+        return self._shift + self._sum / self._count
 
     def get_std(self) -> Optional[float]:
         """Get current standard deviation"""
-        if not self.prices:
+        if not self._count:
             return None
-        mean = sum(self.prices) / len(self.prices)
-        variance = sum((p - mean) ** 2 for p in self.prices) / len(self.prices)
-        return variance ** 0.5
+        mean_d = self._sum / self._count
+        return math.sqrt(max(self._sum_sq / self._count - mean_d * mean_d, 0.0))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,197 @@
+"""
+Compiled Z-Score engine.
+
+Numba-JIT rolling Z-Score over a preallocated ring buffer (O(1) per
+update from running sums), used by SignalGenerator when the Rust engine
+is not installed, plus a parallel whole-series kernel for batch updates.
+Without numba the kernels still import and run as plain Python, but
+SignalGenerator only routes through them when NUMBA_AVAILABLE is True.
+"""
+import math
+from typing import List, Optional
+
+import numpy as np
+
+# Try to import numba, fall back to running the kernel uncompiled
+try:
+    from numba import njit, prange, float64, int64, types
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    float64 = int64 = types = None
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+# Explicit signature: compiled at import, not on the first update()
+_ZSCORE_UPDATE_SIG = (
+    types.UniTuple(float64, 3)(float64[:], int64, int64, float64, float64, float64, float64)
+    if NUMBA_AVAILABLE else None
+)
+
+
+@njit(_ZSCORE_UPDATE_SIG, cache=True)
+def zscore_update(buf, idx, n, new_price, shift, sum_, sum_sq):
+    """
+    Replace the oldest price in a full ring buffer and return its Z-Score.
+
+    Args:
+        buf: float64 ring buffer holding a full window of n prices
+        idx: Slot of the oldest price, overwritten with new_price
+        n: Window length
+        new_price: Latest price
+        shift: Reference price the running sums are taken around
+        sum_: Sum of (price - shift) over the window before the update
+        sum_sq: Sum of (price - shift)**2 over the window before the update
+
+    Returns:
+        (sum_, sum_sq, zscore) after the update; zscore is the population
+        Z-Score of new_price, 0.0 if the window is flat
+    """
+    old = buf[idx] - shift
+    d = new_price - shift
+    buf[idx] = new_price
+
+    sum_ += d - old
+    sum_sq += d * d - old * old
+
+    mean_d = sum_ / n
+    variance = sum_sq / n - mean_d * mean_d
+    if variance > 0.0:
+        return sum_, sum_sq, (d - mean_d) / np.sqrt(variance)
+    return sum_, sum_sq, 0.0
+
+
+@njit(parallel=True, cache=True)
+def rolling_zscores(series, lookback):
+    """
+    Z-Score of every price against its trailing window.
+
+    Windows are independent, so they are spread across cores with prange;
+    each uses the same population std as zscore_update, computed two-pass.
+
+    Args:
+        series: float64 prices, oldest first
+        lookback: Window length
+
+    Returns:
+        float64 array aligned with series; NaN until the window is full
+    """
+    n = series.shape[0]
+    out = np.full(n, np.nan)
+
+    for end in prange(lookback - 1, n):
+        start = end - lookback + 1
+
+        total = 0.0
+        for i in range(start, end + 1):
+            total += series[i]
+        mean = total / lookback
+
+        sum_sq = 0.0
+        for i in range(start, end + 1):
+            d = series[i] - mean
+            sum_sq += d * d
+        std = np.sqrt(sum_sq / lookback)
+
+        if std > 0.0:
+            out[end] = (series[end] - mean) / std
+        else:
+            out[end] = 0.0
+
+    return out
+
+
+class NumbaZScoreEngine:
+    """Z-Score engine backed by the compiled kernel (same interface as PythonZScoreEngine)"""
+
+    def __init__(self, period: int):
+        self.period = period
+        self._buf = np.empty(period, dtype=np.float64)
+        self._idx = 0  # Next slot to overwrite
+        self._count = 0  # Filled slots, capped at period
+        self._shift = 0.0  # Reference price the sums are taken around
+        self._sum = 0.0
+        self._sum_sq = 0.0
+        self._zscore: Optional[float] = None
+
+    def update(self, price: float) -> Optional[float]:
+        """Update with new price"""
+        period = self.period
+        idx = self._idx
+
+        if self._count == period:
+            self._sum, self._sum_sq, self._zscore = zscore_update(
+                self._buf, idx, period, float(price), self._shift, self._sum, self._sum_sq
+            )
+        else:
+            # Warmup: fill the buffer and build the sums in Python
+            if self._count == 0:
+                self._shift = price
+            self._buf[idx] = price
+            d = price - self._shift
+            self._sum += d
+            self._sum_sq += d * d
+            self._count += 1
+
+            if self._count < period:
+                self._idx = idx + 1
+                self._zscore = None
+                return None
+
+            mean_d = self._sum / period
+            variance = self._sum_sq / period - mean_d * mean_d
+            self._zscore = (d - mean_d) / math.sqrt(variance) if variance > 0 else 0.0
+
+        if idx + 1 < period:
+            self._idx = idx + 1
+        else:
+            # Ring wrapped: buffer is oldest-first, rebuild the sums exactly
+            self._idx = 0
+            self._shift = float(self._buf[0])
+            offsets = (self._buf - self._shift).tolist()
+            self._sum = math.fsum(offsets)
+            self._sum_sq = math.fsum(d * d for d in offsets)
+
+        return self._zscore
+
+    def reset(self) -> None:
+        """Clear all data, keeping the buffer allocated"""
+        self._buf.fill(0.0)
+        self._idx = 0
+        self._count = 0
+        self._sum = 0.0
+        self._sum_sq = 0.0
+        self._zscore = None
+
+    def get_prices(self) -> List[float]:
+        """Get prices in the current window, oldest first"""
+        if self._count < self.period:
+            return self._buf[:self._count].tolist()
+        # Full ring: the oldest price sits in the slot written next
+        return np.roll(self._buf, -self._idx).tolist()
+
+    def is_ready(self) -> bool:
+        """Check if we have enough data"""
+        return self._count >= self.period
+
+    def get_zscore(self) -> Optional[float]:
+        """Get current Z-Score"""
+        return self._zscore
+
+    def get_mean(self) -> Optional[float]:
+        """Get current mean"""
+        if not self._count:
+            return None
+        return float(self._buf[:self._count].mean())
+
+    def get_std(self) -> Optional[float]:
+        """Get current standard deviation"""
+        if not self._count:
+            return None
+        return float(self._buf[:self._count].std())
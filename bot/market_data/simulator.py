@@ -13,7 +13,7 @@ from typing import List
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class Bar:
     """OHLCV bar"""
     timestamp: datetime
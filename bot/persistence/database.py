@@ -7,7 +7,7 @@ import sqlite3
 import logging
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
@@ -38,7 +38,6 @@ class TradeDatabase:
     def connect(self):
         """Connect to database and create tables"""
         self._conn = sqlite3.connect(self.db_path)
-        self._conn.row_factory = sqlite3.Row
 
         # Create tables
         self._create_tables()
@@ -88,6 +87,12 @@ class TradeDatabase:
         self._conn.commit()
         logger.info(f"Database initialized at {self.db_path}")
 
+    def _read_cursor(self) -> sqlite3.Cursor:
+        """Cursor returning sqlite3.Row objects, for name-based reads only"""
+        cursor = self._conn.cursor()
+        cursor.row_factory = sqlite3.Row
+        return cursor
+
     def disconnect(self):
         """Close database connection"""
         if self._conn:
@@ -169,7 +174,21 @@ class TradeDatabase:
         Returns:
             List of Trade objects
         """
-        cursor = self._conn.cursor()
+        return list(self.iter_trades(limit, symbol, start_date, end_date))
+
+    def iter_trades(
+        self,
+        limit: Optional[int] = None,
+        symbol: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> Iterator[Trade]:
+        """
+        Stream trades from database, newest first, without building a list.
+
+        Takes the same filters as get_trades.
+        """
+        cursor = self._read_cursor()
 
         query = "SELECT * FROM trades WHERE 1=1"
         params = []
@@ -193,9 +212,8 @@ class TradeDatabase:
 
         cursor.execute(query, params)
 
-        trades = []
-        for row in cursor.fetchall():
-            trades.append(Trade(
+        for row in cursor:
+            yield Trade(
                 id=row["id"],
                 timestamp=datetime.fromisoformat(row["timestamp"]),
                 symbol=row["symbol"],
@@ -205,9 +223,26 @@ class TradeDatabase:
                 order_id=row["order_id"],
                 pnl=row["pnl"],
                 zscore=row["zscore"],
-            ))
+            )
 
-        return trades
+    def count_trades(self, symbol: Optional[str] = None) -> int:
+        """
+        Count trades without loading any rows.
+
+        Args:
+            symbol: Filter by symbol
+
+        Returns:
+            Number of matching trades
+        """
+        cursor = self._conn.cursor()
+
+        if symbol:
+            cursor.execute("SELECT COUNT(*) FROM trades WHERE symbol = ?", (symbol,))
+        else:
+            cursor.execute("SELECT COUNT(*) FROM trades")
+
+        return cursor.fetchone()[0]
 
     def get_daily_stats(self, date: Optional[datetime] = None) -> Optional[Dict[str, Any]]:
         """
@@ -222,7 +257,7 @@ class TradeDatabase:
         if date is None:
             date = datetime.utcnow().date()
 
-        cursor = self._conn.cursor()
+        cursor = self._read_cursor()
 
         cursor.execute("""
             SELECT * FROM daily_summary WHERE date = ?
@@ -299,7 +334,7 @@ class TradeDatabase:
         Returns:
             State value or None if not found
         """
-        cursor = self._conn.cursor()
+        cursor = self._read_cursor()
 
         cursor.execute("""
             SELECT value FROM bot_state WHERE key = ?
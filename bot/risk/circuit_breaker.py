@@ -9,6 +9,8 @@ from datetime import datetime, timedelta
 from typing import Optional, Callable
 from dataclasses import dataclass, field
 
+import numpy as np
+
 from ..core.engine import EngineState, DailyStats
 
 logger = logging.getLogger(__name__)
@@ -124,6 +126,33 @@ class CircuitBreaker:
 
         return False
 
+    def check_drawdown_series(self, equity: np.ndarray) -> int:
+        """
+        Find the first bar where a full equity curve breaches the drawdown limit.
+
+        Vectorized counterpart of check_drawdown() for backtests: the running
+        peak starts from state.peak_equity, as if each value had been passed
+        to check_drawdown() in turn, and is computed with
+        np.maximum.accumulate in one pass. Does not update state or trigger;
+        the live tick path should keep using check_drawdown().
+
+        Args:
+            equity: Equity curve, one value per bar
+
+        Returns:
+            Index of the first breaching bar, or -1 if the limit is never hit
+        """
+        equity = np.asarray(equity, dtype=np.float64)
+        if equity.size == 0:
+            return -1
+
+        peaks = np.maximum.accumulate(equity)
+        np.maximum(peaks, self.state.peak_equity, out=peaks)
+        breached = (peaks - equity) >= self.config.max_drawdown
+
+        idx = int(np.argmax(breached))
+        return idx if breached[idx] else -1
+
     def check_position_duration(
         self,
         entry_time: datetime,
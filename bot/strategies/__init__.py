@@ -7,7 +7,13 @@ from .factory import (
     ZScoreMeanReversion,
     BollingerBands,
     RSIMeanReversion,
+    SIGNAL_NONE,
+    SIGNAL_ENTER_LONG,
+    SIGNAL_ENTER_SHORT,
+    SIGNAL_EXIT,
+    SIGNAL_NAMES,
 )
+from .fused import FusedMeanReversion
 
 __all__ = [
     "StrategyType",
@@ -17,4 +23,10 @@ __all__ = [
     "ZScoreMeanReversion",
     "BollingerBands",
     "RSIMeanReversion",
+    "FusedMeanReversion",
+    "SIGNAL_NONE",
+    "SIGNAL_ENTER_LONG",
+    "SIGNAL_ENTER_SHORT",
+    "SIGNAL_EXIT",
+    "SIGNAL_NAMES",
 ]
@@ -0,0 +1,152 @@
+"""
+Compiled kernels for batch strategy evaluation.
+
+Numba-JIT versions of the stateful recurrences used by vector_backtest()
+when a strategy is created with ``batch_mode: True``. Without numba the
+kernels still import and run as plain Python, but strategies only route
+through them when NUMBA_AVAILABLE is True.
+"""
+import numpy as np
+
+# Try to import numba, fall back to running kernels uncompiled
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+# Integer signal codes shared by the batch paths
+SIGNAL_NONE = 0
+SIGNAL_ENTER_LONG = 1
+SIGNAL_ENTER_SHORT = 2
+SIGNAL_EXIT = 3
+
+
+@njit(cache=True)
+def _rsi_value(avg_gain, avg_loss):
+    if avg_loss > 0.0:
+        return 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+    if avg_gain > 0.0:
+        return 100.0
+    return 50.0
+
+
+@njit(cache=True)
+def wilder_rsi(prices, period):
+    """
+    Wilder-smoothed RSI for a whole price series.
+
+    Args:
+        prices: float64 close prices
+        period: RSI lookback
+
+    Returns:
+        float64 array aligned with prices; NaN until `period` changes are seen
+    """
+    n = prices.shape[0]
+    out = np.full(n, np.nan)
+    if n < period + 1:
+        return out
+
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, period + 1):
+        change = prices[i] - prices[i - 1]
+        if change > 0.0:
+            avg_gain += change
+        else:
+            avg_loss -= change
+    avg_gain /= period
+    avg_loss /= period
+    out[period] = _rsi_value(avg_gain, avg_loss)
+
+    for i in range(period + 1, n):
+        change = prices[i] - prices[i - 1]
+        gain = change if change > 0.0 else 0.0
+        loss = -change if change < 0.0 else 0.0
+        avg_gain = (avg_gain * (period - 1) + gain) / period
+        avg_loss = (avg_loss * (period - 1) + loss) / period
+        out[i] = _rsi_value(avg_gain, avg_loss)
+
+    return out
+
+
+@njit(cache=True)
+def bollinger_signals(prices, window, k):
+    """
+    Bollinger Bands signal codes from a single running-sum pass.
+
+    Sums are of offsets from a reference price, re-anchored on the oldest
+    price of the window and rebuilt every `window` bars, so cancellation in
+    the variance stays bounded however long the series is (the same scheme
+    as BollingerBands.update_price()).
+
+    Args:
+        prices: float64 close prices
+        window: Band lookback
+        k: Standard deviation multiplier
+
+    Returns:
+        int8 array of SIGNAL_* codes, one per bar
+    """
+    n = prices.shape[0]
+    out = np.zeros(n, dtype=np.int8)
+    if n == 0:
+        return out
+    shift = prices[0]
+    total = 0.0
+    total_sq = 0.0
+    position = 0
+
+    for i in range(n):
+        price = prices[i]
+        d = price - shift
+        total += d
+        total_sq += d * d
+        if i >= window:
+            old = prices[i - window] - shift
+            total -= old
+            total_sq -= old * old
+        if i < window - 1:
+            continue
+
+        if (i + 1) % window == 0:
+            # Re-anchor on the oldest price in the window and rebuild the sums
+            shift = prices[i - window + 1]
+            total = 0.0
+            total_sq = 0.0
+            for j in range(i - window + 1, i + 1):
+                d = prices[j] - shift
+                total += d
+                total_sq += d * d
+
+        mean_d = total / window
+        mean = shift + mean_d
+        variance = (total_sq - window * mean_d * mean_d) / (window - 1)
+        std = np.sqrt(variance) if variance > 0.0 else 0.0
+        upper = mean + k * std
+        lower = mean - k * std
+
+        if position == 0:
+            if price >= upper:
+                position = -1
+                out[i] = SIGNAL_ENTER_SHORT
+            elif price <= lower:
+                position = 1
+                out[i] = SIGNAL_ENTER_LONG
+        elif position > 0:
+            if price <= mean or price >= upper:
+                position = 0
+                out[i] = SIGNAL_EXIT
+        elif price >= mean or price <= lower:
+            position = 0
+            out[i] = SIGNAL_EXIT
+
+    return out
@@ -1,11 +1,33 @@
 # Strategy Framework
 from enum import Enum
-from typing import Optional, Dict, Any
-from abc import ABC, abstractmethod
+from collections import deque
+from types import MappingProxyType
+from typing import Optional, Dict, Any, List, Mapping
+import functools
 import logging
+import math
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from bot.core.signals import SignalGenerator
+
+from ._kernels import (
+    NUMBA_AVAILABLE,
+    SIGNAL_NONE,
+    SIGNAL_ENTER_LONG,
+    SIGNAL_ENTER_SHORT,
+    SIGNAL_EXIT,
+    bollinger_signals,
+    wilder_rsi,
+)
 
 logger = logging.getLogger(__name__)
 
+# Index with a SIGNAL_* code from vector_backtest() to get the string
+# update() would have returned
+SIGNAL_NAMES = (None, "ENTER_LONG", "ENTER_SHORT", "EXIT")
+
 
 class StrategyType(Enum):
     """Available strategy types."""
@@ -15,40 +37,91 @@ class StrategyType(Enum):
     MA_CROSSOVER = "ma_crossover"
 
 
-class TradingStrategy(ABC):
-    """Base class for trading strategies."""
+class TradingStrategy:
+    """
+    Base class for trading strategies.
+
+    Plain class rather than an ABC: subclasses must override update_price(),
+    get_name() and get_params(), which raise NotImplementedError here.
+    """
+
+    __slots__ = ("config", "position", "batch_mode")
 
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         self.position = 0  # LONG, SHORT, or FLAT
+        # Route vector_backtest() through the numba kernels when available
+        self.batch_mode = config.get("batch_mode", False) and NUMBA_AVAILABLE
 
-    @abstractmethod
     def update(self, bar: Dict[str, Any]) -> Optional[str]:
         """
         Update strategy with new bar and generate signal.
 
         Args:
-            bar: Market data bar with OHLCV
+            bar: Market data bar with OHLCV (must contain "close")
 
         Returns:
             Signal type or None: "ENTER_LONG", "ENTER_SHORT", "EXIT", or None
         """
-        pass
+        return self.update_price(bar["close"])
+
+    def update_price(self, price: float) -> Optional[str]:
+        """
+        Update strategy with a new close price and generate signal.
+
+        Args:
+            price: Bar close price
+
+        Returns:
+            Signal type or None: "ENTER_LONG", "ENTER_SHORT", "EXIT", or None
+        """
+        raise NotImplementedError
+
+    def update_batch(self, closes: np.ndarray) -> List[Optional[str]]:
+        """
+        Feed a series of close prices through update_price().
+
+        Same signals and live state as calling update() bar by bar, without
+        building a bar dict per price.
+
+        Args:
+            closes: Close prices, oldest first
+
+        Returns:
+            Signal (or None) per price
+        """
+        update_price = self.update_price
+        return [update_price(price) for price in np.asarray(closes, dtype=np.float64).tolist()]
 
-    @abstractmethod
     def get_name(self) -> str:
         """Get strategy display name."""
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def get_params(self) -> Dict[str, Any]:
         """Get current strategy parameters."""
-        pass
+        raise NotImplementedError
+
+    def vector_backtest(self, prices: np.ndarray) -> np.ndarray:
+        """
+        Generate signals for a whole close-price series in one pass.
+
+        Batch counterpart of update() for backtests and optimization. Starts
+        from a flat position and does not touch the live strategy state.
+
+        Args:
+            prices: Close prices, oldest first
+
+        Returns:
+            int8 array of SIGNAL_* codes, one per bar
+        """
+        raise NotImplementedError(f"{type(self).__name__} has no batch path")
 
 
 class ZScoreMeanReversion(TradingStrategy):
     """Z-Score mean reversion strategy."""
 
+    __slots__ = ("lookback", "z_entry", "z_exit", "signal_gen")
+
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
         self.lookback = config.get("lookback", 20)
@@ -56,12 +129,10 @@ class ZScoreMeanReversion(TradingStrategy):
         self.z_exit = config.get("z_threshold_exit", 0.5)
 
         # Z-Score engine
-        from bot.core.signals import SignalGenerator
         self.signal_gen = SignalGenerator(self.lookback)
 
-    def update(self, bar: Dict[str, Any]) -> Optional[str]:
+    def update_price(self, price: float) -> Optional[str]:
         """Update and generate signal."""
-        price = bar.get("close", 0.0)
         zscore = self.signal_gen.update(price)
 
         if not self.signal_gen.is_ready():
@@ -76,6 +147,36 @@ class ZScoreMeanReversion(TradingStrategy):
             return signal["type"]
         return None
 
+    def vector_backtest(self, prices: np.ndarray) -> np.ndarray:
+        """Batch signals; mirrors SignalGenerator's population z-score and get_signal()."""
+        prices = np.asarray(prices, dtype=np.float64)
+        signals = np.zeros(prices.size, dtype=np.int8)
+        if prices.size < self.lookback:
+            return signals
+
+        windows = sliding_window_view(prices, self.lookback)
+        mean = windows.mean(axis=1)
+        std = windows.std(axis=1)
+        deviation = prices[self.lookback - 1:] - mean
+        zscores = np.divide(deviation, std, out=np.zeros_like(deviation), where=std > 0)
+
+        out = signals[self.lookback - 1:]
+        last = None
+        for i, z in enumerate(zscores.tolist()):
+            if z >= self.z_entry:
+                if last not in ("ENTER_SHORT", None):
+                    out[i] = SIGNAL_ENTER_SHORT
+                    last = "ENTER_SHORT"
+            elif z <= -self.z_entry:
+                if last not in ("ENTER_LONG", None):
+                    out[i] = SIGNAL_ENTER_LONG
+                    last = "ENTER_LONG"
+            elif abs(z) <= self.z_exit and last in ("ENTER_LONG", "ENTER_SHORT"):
+                out[i] = SIGNAL_EXIT
+                last = None
+
+        return signals
+
     def get_name(self) -> str:
         return "Z-Score Mean Reversion"
 
@@ -90,30 +191,58 @@ class ZScoreMeanReversion(TradingStrategy):
 class BollingerBands(TradingStrategy):
     """Bollinger Bands strategy."""
 
+    __slots__ = ("lookback", "std_dev", "prices", "_pos", "_shift", "_sum", "_sum_sq")
+
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
         self.lookback = config.get("lookback", 20)
         self.std_dev = config.get("std_dev_multiplier", 2.0)
 
-        # Price history for bands
-        self.prices = []
+        # Price history for bands, with running sums of each price's offset
+        # from a reference price for O(1) mean/std (as in PythonZScoreEngine)
+        self.prices = deque(maxlen=self.lookback)
+        self._pos = 0  # Slot of the next price, modulo lookback
+        self._shift = 0.0
+        self._sum = 0.0
+        self._sum_sq = 0.0
 
-    def update(self, bar: Dict[str, Any]) -> Optional[str]:
+    def update_price(self, price: float) -> Optional[str]:
         """Update and generate signal."""
-        price = bar.get("close", 0.0)
-        self.prices.append(price)
 
-        # Keep only lookback period
-        if len(self.prices) > self.lookback:
-            self.prices.pop(0)
-
-        if len(self.prices) < self.lookback:
+        prices = self.prices
+        if not prices:
+            self._shift = price
+        shift = self._shift
+
+        # deque evicts the oldest price on append; drop it from the sums first
+        if len(prices) == prices.maxlen:
+            old = prices[0] - shift
+            self._sum -= old
+            self._sum_sq -= old * old
+
+        prices.append(price)
+        d = price - shift
+        self._sum += d
+        self._sum_sq += d * d
+
+        self._pos += 1
+        if self._pos == self.lookback:
+            # Wrapped with a full window: re-anchor on the oldest price
+            self._pos = 0
+            self._shift = prices[0]
+            offsets = [p - self._shift for p in prices]
+            self._sum = math.fsum(offsets)
+            self._sum_sq = math.fsum(o * o for o in offsets)
+
+        if len(prices) < prices.maxlen:
             return None
 
-        # Calculate bands
-        import statistics
-        mean = statistics.mean(self.prices)
-        std = statistics.stdev(self.prices)
+        # Calculate bands (sample std, same as statistics.stdev)
+        n = self.lookback
+        mean_d = self._sum / n
+        mean = self._shift + mean_d
+        variance = max((self._sum_sq - n * mean_d * mean_d) / (n - 1), 0.0)
+        std = math.sqrt(variance)
 
         upper_band = mean + self.std_dev * std
         lower_band = mean - self.std_dev * std
@@ -138,6 +267,47 @@ class BollingerBands(TradingStrategy):
 
         return None
 
+    def vector_backtest(self, prices: np.ndarray) -> np.ndarray:
+        """Batch signals from rolling bands over a sliding window view."""
+        prices = np.asarray(prices, dtype=np.float64)
+        if self.batch_mode:
+            return bollinger_signals(prices, self.lookback, float(self.std_dev))
+
+        signals = np.zeros(prices.size, dtype=np.int8)
+        if prices.size < self.lookback:
+            return signals
+
+        windows = sliding_window_view(prices, self.lookback)
+        mean = windows.mean(axis=1)
+        std = windows.std(axis=1, ddof=1)
+        px = prices[self.lookback - 1:]
+
+        above_upper = (px >= mean + self.std_dev * std).tolist()
+        below_lower = (px <= mean - self.std_dev * std).tolist()
+        below_middle = (px <= mean).tolist()
+        above_middle = (px >= mean).tolist()
+
+        # Position depends on the previous bar, so resolve it sequentially
+        out = signals[self.lookback - 1:]
+        position = 0
+        for i in range(px.size):
+            if position == 0:
+                if above_upper[i]:
+                    position = -1
+                    out[i] = SIGNAL_ENTER_SHORT
+                elif below_lower[i]:
+                    position = 1
+                    out[i] = SIGNAL_ENTER_LONG
+            elif position > 0:
+                if below_middle[i] or above_upper[i]:
+                    position = 0
+                    out[i] = SIGNAL_EXIT
+            elif above_middle[i] or below_lower[i]:
+                position = 0
+                out[i] = SIGNAL_EXIT
+
+        return signals
+
     def get_name(self) -> str:
         return "Bollinger Bands"
 
@@ -148,59 +318,61 @@ class BollingerBands(TradingStrategy):
         }
 
 
+def _rsi_from_averages(avg_gain: float, avg_loss: float) -> float:
+    """RSI from smoothed average gain/loss (50 when both are zero)."""
+    if avg_loss > 0:
+        return 100 - (100 / (1 + avg_gain / avg_loss))
+    return 100.0 if avg_gain > 0 else 50.0
+
+
 class RSIMeanReversion(TradingStrategy):
     """RSI mean reversion strategy."""
 
+    __slots__ = (
+        "lookback", "rsi_overbought", "rsi_oversold",
+        "_prev_price", "_avg_gain", "_avg_loss", "_count",
+    )
+
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
         self.lookback = config.get("lookback", 14)
         self.rsi_overbought = config.get("rsi_overbought", 70)
         self.rsi_oversold = config.get("rsi_oversold", 30)
 
-        # Price history
-        self.prices = []
-
-    def _calculate_rsi(self) -> Optional[float]:
-        """Calculate RSI."""
-        if len(self.prices) < self.lookback + 1:
-            return None
+        # Wilder smoothing state (O(1) per bar)
+        self._prev_price: Optional[float] = None
+        self._avg_gain = 0.0
+        self._avg_loss = 0.0
+        self._count = 0
 
-        gains = []
-        losses = []
-
-        for i in range(1, len(self.prices)):
-            change = self.prices[i] - self.prices[i-1]
-            if change > 0:
-                gains.append(change)
-                losses.append(0)
-            else:
-                gains.append(0)
-                losses.append(abs(change))
-
-        if not gains:
-            return 50.0
-
-        avg_gain = sum(gains[-self.lookback:]) / self.lookback
-        avg_loss = sum(losses[-self.lookback:]) / self.lookback
-
-        rs = avg_gain / avg_loss if avg_loss > 0 else 0
-
-        rsi = 100 - (100 / (1 + rs))
-        return rsi
-
-    def update(self, bar: Dict[str, Any]) -> Optional[str]:
+    def update_price(self, price: float) -> Optional[str]:
         """Update and generate signal."""
-        price = bar.get("close", 0.0)
-        self.prices.append(price)
 
-        if len(self.prices) > self.lookback + 50:
-            self.prices = self.prices[-(self.lookback + 50):]
-
-        rsi = self._calculate_rsi()
-
-        if rsi is None:
+        prev_price = self._prev_price
+        self._prev_price = price
+        if prev_price is None:
             return None
 
+        change = price - prev_price
+        gain = change if change > 0 else 0.0
+        loss = -change if change < 0 else 0.0
+
+        period = self.lookback
+        self._count += 1
+        if self._count <= period:
+            # Warmup: accumulate sums, seed averages with simple means
+            self._avg_gain += gain
+            self._avg_loss += loss
+            if self._count < period:
+                return None
+            self._avg_gain /= period
+            self._avg_loss /= period
+        else:
+            self._avg_gain = (self._avg_gain * (period - 1) + gain) / period
+            self._avg_loss = (self._avg_loss * (period - 1) + loss) / period
+
+        rsi = _rsi_from_averages(self._avg_gain, self._avg_loss)
+
         # Generate signals
         if self.position == 0:
             if rsi <= self.rsi_oversold:
@@ -220,6 +392,58 @@ class RSIMeanReversion(TradingStrategy):
 
         return None
 
+    def vector_backtest(self, prices: np.ndarray) -> np.ndarray:
+        """Batch signals from Wilder RSI over the whole series."""
+        prices = np.asarray(prices, dtype=np.float64)
+        period = self.lookback
+        signals = np.zeros(prices.size, dtype=np.int8)
+        if prices.size < period + 1:
+            return signals
+
+        if self.batch_mode:
+            rsi = wilder_rsi(prices, period)[period:]
+        else:
+            diff = np.diff(prices)
+            gains = np.where(diff > 0, diff, 0.0)
+            losses = np.where(diff < 0, -diff, 0.0)
+
+            # Seed with simple means, then Wilder recursion (scalar state)
+            avg_gain = float(gains[:period].mean())
+            avg_loss = float(losses[:period].mean())
+            rsi = np.empty(diff.size - period + 1)
+            rsi[0] = _rsi_from_averages(avg_gain, avg_loss)
+            for i, (gain, loss) in enumerate(
+                zip(gains[period:].tolist(), losses[period:].tolist()), start=1
+            ):
+                avg_gain = (avg_gain * (period - 1) + gain) / period
+                avg_loss = (avg_loss * (period - 1) + loss) / period
+                rsi[i] = _rsi_from_averages(avg_gain, avg_loss)
+
+        oversold = (rsi <= self.rsi_oversold).tolist()
+        overbought = (rsi >= self.rsi_overbought).tolist()
+        at_or_above_50 = (rsi >= 50).tolist()
+        at_or_below_50 = (rsi <= 50).tolist()
+
+        out = signals[period:]
+        position = 0
+        for i in range(rsi.size):
+            if position == 0:
+                if oversold[i]:
+                    position = 1
+                    out[i] = SIGNAL_ENTER_LONG
+                elif overbought[i]:
+                    position = -1
+                    out[i] = SIGNAL_ENTER_SHORT
+            elif position > 0:
+                if at_or_above_50[i]:
+                    position = 0
+                    out[i] = SIGNAL_EXIT
+            elif at_or_below_50[i]:
+                position = 0
+                out[i] = SIGNAL_EXIT
+
+        return signals
+
     def get_name(self) -> str:
         return "RSI Mean Reversion"
 
@@ -231,6 +455,13 @@ class RSIMeanReversion(TradingStrategy):
         }
 
 
+_STRATEGY_CLASSES = {
+    StrategyType.ZSCORE_MEAN_REVERSION: ZScoreMeanReversion,
+    StrategyType.BOLLINGER_BANDS: BollingerBands,
+    StrategyType.RSI_MEAN_REVERSION: RSIMeanReversion,
+}
+
+
 def create_strategy(
     strategy_type: StrategyType,
     config: Dict[str, Any],
@@ -240,28 +471,29 @@ def create_strategy(
 
     Args:
         strategy_type: Type of strategy to create
-        config: Strategy configuration
+        config: Strategy configuration (``batch_mode: True`` routes
+            vector_backtest() through the numba kernels)
 
     Returns:
         Strategy instance
     """
-    if strategy_type == StrategyType.ZSCORE_MEAN_REVERSION:
-        return ZScoreMeanReversion(config)
-    elif strategy_type == StrategyType.BOLLINGER_BANDS:
-        return BollingerBands(config)
-    elif strategy_type == StrategyType.RSI_MEAN_REVERSION:
-        return RSIMeanReversion(config)
-    else:
+    if config.get("batch_mode") and not NUMBA_AVAILABLE:
+        logger.warning("numba not available, batch_mode falls back to NumPy path")
+
+    strategy_cls = _STRATEGY_CLASSES.get(strategy_type)
+    if strategy_cls is None:
         raise ValueError(f"Unknown strategy type: {strategy_type}")
+    return strategy_cls(config)
 
 
-def list_strategies() -> Dict[str, StrategyType]:
-    """List available strategies."""
-    return {
+@functools.lru_cache(maxsize=1)
+def list_strategies() -> Mapping[str, StrategyType]:
+    """List available strategies (cached, read-only)."""
+    return MappingProxyType({
         "zscore": StrategyType.ZSCORE_MEAN_REVERSION,
         "bollinger": StrategyType.BOLLINGER_BANDS,
         "rsi": StrategyType.RSI_MEAN_REVERSION,
-    }
+    })
 
 
 def test_strategies():
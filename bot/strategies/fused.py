@@ -0,0 +1,292 @@
+# Fused mean-reversion pipeline
+from collections import deque
+from typing import Optional, Dict, Any, List
+import math
+
+from .factory import StrategyType, list_strategies
+
+
+class _RollingWindow:
+    """
+    Rolling price window with running sums, shared by all legs at one lookback.
+
+    Sums are of each price's offset from a reference price (as in
+    PythonZScoreEngine), which limits cancellation in m2 for low-variance
+    windows; the reference and sums are rebuilt each time the window wraps.
+    """
+
+    __slots__ = ("size", "prices", "pos", "shift", "sum", "sum_sq", "mean", "m2")
+
+    def __init__(self, size: int):
+        self.size = size
+        self.prices = deque(maxlen=size)
+        self.pos = 0  # Slot of the next price, modulo size
+        self.shift = 0.0  # Reference price the sums are taken around
+        self.sum = 0.0
+        self.sum_sq = 0.0
+        self.mean = 0.0
+        self.m2 = 0.0  # Sum of squared deviations from the mean
+
+    def is_full(self) -> bool:
+        return len(self.prices) == self.size
+
+    def push(self, price: float) -> None:
+        """Add a price and refresh mean/m2 once the window is full."""
+        prices = self.prices
+        if not prices:
+            self.shift = price
+        shift = self.shift
+
+        window_full = len(prices) == self.size
+        if window_full:
+            old = prices[0] - shift
+            self.sum -= old
+            self.sum_sq -= old * old
+
+        prices.append(price)
+        d = price - shift
+        self.sum += d
+        self.sum_sq += d * d
+
+        self.pos += 1
+        if self.pos == self.size:
+            self.pos = 0
+            # Wrapped with a full window: re-anchor on the oldest price
+            self.shift = prices[0]
+            offsets = [p - self.shift for p in prices]
+            self.sum = math.fsum(offsets)
+            self.sum_sq = math.fsum(o * o for o in offsets)
+
+        if len(prices) < self.size:
+            return
+
+        n = self.size
+        mean_d = self.sum / n
+        self.mean = self.shift + mean_d
+        self.m2 = self.sum_sq - n * mean_d * mean_d
+
+
+class _WilderRSI:
+    """Wilder-smoothed RSI state, shared by all RSI legs at one period."""
+
+    __slots__ = ("period", "avg_gain", "avg_loss", "count", "value")
+
+    def __init__(self, period: int):
+        self.period = period
+        self.avg_gain = 0.0
+        self.avg_loss = 0.0
+        self.count = 0
+        self.value: Optional[float] = None
+
+    def push(self, change: float) -> None:
+        gain = change if change > 0 else 0.0
+        loss = -change if change < 0 else 0.0
+
+        period = self.period
+        self.count += 1
+        if self.count <= period:
+            self.avg_gain += gain
+            self.avg_loss += loss
+            if self.count < period:
+                return
+            self.avg_gain /= period
+            self.avg_loss /= period
+        else:
+            self.avg_gain = (self.avg_gain * (period - 1) + gain) / period
+            self.avg_loss = (self.avg_loss * (period - 1) + loss) / period
+
+        if self.avg_loss > 0:
+            self.value = 100 - (100 / (1 + self.avg_gain / self.avg_loss))
+        else:
+            self.value = 100.0 if self.avg_gain > 0 else 50.0
+
+
+class _ZScoreLeg:
+    """Signal rules of ZScoreMeanReversion on a shared window."""
+
+    __slots__ = ("window", "z_entry", "z_exit", "last")
+
+    def __init__(self, window: _RollingWindow, config: Dict[str, Any]):
+        self.window = window
+        self.z_entry = config.get("z_threshold_entry", 2.0)
+        self.z_exit = config.get("z_threshold_exit", 0.5)
+        self.last: Optional[str] = None
+
+    def step(self, price: float) -> Optional[str]:
+        window = self.window
+        if not window.is_full():
+            return None
+
+        # Population std, same as SignalGenerator
+        std = math.sqrt(max(window.m2 / window.size, 0.0))
+        z = (price - window.mean) / std if std > 0 else 0.0
+
+        if z >= self.z_entry:
+            if self.last not in ("ENTER_SHORT", None):
+                self.last = "ENTER_SHORT"
+                return "ENTER_SHORT"
+        elif z <= -self.z_entry:
+            if self.last not in ("ENTER_LONG", None):
+                self.last = "ENTER_LONG"
+                return "ENTER_LONG"
+        elif abs(z) <= self.z_exit and self.last in ("ENTER_LONG", "ENTER_SHORT"):
+            self.last = None
+            return "EXIT"
+        return None
+
+
+class _BollingerLeg:
+    """Signal rules of BollingerBands on a shared window."""
+
+    __slots__ = ("window", "std_dev", "position")
+
+    def __init__(self, window: _RollingWindow, config: Dict[str, Any]):
+        self.window = window
+        self.std_dev = config.get("std_dev_multiplier", 2.0)
+        self.position = 0
+
+    def step(self, price: float) -> Optional[str]:
+        window = self.window
+        if not window.is_full():
+            return None
+
+        # Sample std, same as BollingerBands
+        std = math.sqrt(max(window.m2 / (window.size - 1), 0.0))
+        mean = window.mean
+        upper_band = mean + self.std_dev * std
+        lower_band = mean - self.std_dev * std
+
+        if self.position == 0:
+            if price >= upper_band:
+                self.position = -1
+                return "ENTER_SHORT"
+            elif price <= lower_band:
+                self.position = 1
+                return "ENTER_LONG"
+        elif self.position > 0:
+            if price <= mean or price >= upper_band:
+                self.position = 0
+                return "EXIT"
+        elif price >= mean or price <= lower_band:
+            self.position = 0
+            return "EXIT"
+        return None
+
+
+class _RSILeg:
+    """Signal rules of RSIMeanReversion on a shared RSI state."""
+
+    __slots__ = ("rsi", "overbought", "oversold", "position")
+
+    def __init__(self, rsi: _WilderRSI, config: Dict[str, Any]):
+        self.rsi = rsi
+        self.overbought = config.get("rsi_overbought", 70)
+        self.oversold = config.get("rsi_oversold", 30)
+        self.position = 0
+
+    def step(self, price: float) -> Optional[str]:
+        rsi = self.rsi.value
+        if rsi is None:
+            return None
+
+        if self.position == 0:
+            if rsi <= self.oversold:
+                self.position = 1
+                return "ENTER_LONG"
+            elif rsi >= self.overbought:
+                self.position = -1
+                return "ENTER_SHORT"
+        elif self.position > 0:
+            if rsi >= 50:
+                self.position = 0
+                return "EXIT"
+        elif rsi <= 50:
+            self.position = 0
+            return "EXIT"
+        return None
+
+
+class FusedMeanReversion:
+    """
+    Run several mean-reversion strategies over one price stream.
+
+    Z-Score and Bollinger legs with the same lookback read one shared rolling
+    window (one sum/sum_sq update per bar), and RSI legs share Wilder state
+    per period. Each leg emits the same signals as its standalone strategy.
+
+    Example:
+        fused = FusedMeanReversion([
+            {"strategy": "zscore", "lookback": 20},
+            {"strategy": "bollinger", "lookback": 20, "name": "bb20"},
+            {"strategy": "rsi", "lookback": 14},
+        ])
+        signals = fused.update(bar)  # {"zscore": None, "bb20": "EXIT", ...}
+    """
+
+    __slots__ = ("_legs", "_windows", "_rsi", "_prev_price")
+
+    def __init__(self, configs: List[Dict[str, Any]]):
+        """
+        Args:
+            configs: Sub-strategy configs; each needs a "strategy" key
+                ("zscore", "bollinger" or "rsi") and may set a unique "name"
+                (defaults to the strategy key)
+        """
+        strategy_types = list_strategies()
+        self._legs: Dict[str, Any] = {}
+        self._windows: Dict[int, _RollingWindow] = {}
+        self._rsi: Dict[int, _WilderRSI] = {}
+        self._prev_price: Optional[float] = None
+
+        for config in configs:
+            kind = config.get("strategy")
+            if kind not in strategy_types:
+                raise ValueError(f"Unknown strategy type: {kind}")
+
+            name = config.get("name", kind)
+            if name in self._legs:
+                raise ValueError(f"Duplicate strategy name: {name}")
+
+            strategy_type = strategy_types[kind]
+            if strategy_type == StrategyType.RSI_MEAN_REVERSION:
+                period = config.get("lookback", 14)
+                if period not in self._rsi:
+                    self._rsi[period] = _WilderRSI(period)
+                self._legs[name] = _RSILeg(self._rsi[period], config)
+            else:
+                lookback = config.get("lookback", 20)
+                if lookback not in self._windows:
+                    self._windows[lookback] = _RollingWindow(lookback)
+                window = self._windows[lookback]
+                if strategy_type == StrategyType.BOLLINGER_BANDS:
+                    self._legs[name] = _BollingerLeg(window, config)
+                else:
+                    self._legs[name] = _ZScoreLeg(window, config)
+
+    def update(self, bar: Dict[str, Any]) -> Dict[str, Optional[str]]:
+        """
+        Update all strategies with a new bar.
+
+        Args:
+            bar: Market data bar with OHLCV (must contain "close")
+
+        Returns:
+            Signal per strategy name: "ENTER_LONG", "ENTER_SHORT", "EXIT", or None
+        """
+        price = bar["close"]
+
+        for window in self._windows.values():
+            window.push(price)
+
+        prev_price = self._prev_price
+        self._prev_price = price
+        if prev_price is not None:
+            change = price - prev_price
+            for rsi in self._rsi.values():
+                rsi.push(change)
+
+        return {name: leg.step(price) for name, leg in self._legs.items()}
+
+    def get_names(self) -> List[str]:
+        """Get sub-strategy names in signal order."""
+        return list(self._legs)
@@ -10,6 +10,9 @@ from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Position label indexed by signum(position) + 1
+_POS_LABELS = ("SHORT", "FLAT", "LONG")
+
 
 class TelegramCommands:
     """Bot command handlers"""
@@ -24,9 +27,83 @@ class TelegramCommands:
         "ping": "Check if bot is responsive",
     }
 
+    _STATUS_EMOJI = {
+        "running": "🟢",
+        "paused": "⏸️",
+        "stopped": "🔴",
+        "error": "🚨",
+    }
+
+    _STATUS_TEMPLATE = """
+<b>📊 Bot Status</b>
+
+State: {status_emoji} {status}
+Mode: {mode}
+Symbol: {symbol}
+Position: {pos_type} x{pos_size}
+
+<b>Performance:</b>
+Daily P&L: ${daily_pnl:+.2f}
+Trades Today: {trades_today}
+Win Rate: {win_rate:.1f}%
+
+<b>Strategy:</b>
+Current Z-Score: {zscore}
+Lookback Period: {lookback} bars
+
+<i>{timestamp} UTC</i>
+"""
+
+    _PNL_TEMPLATES = {
+        "daily": """
+<b>💰 Daily P&L</b>
+
+Net P&L: $0.00
+Trades: 0
+Win Rate: 0.0%
+Max Profit: $0.00
+Max Drawdown: $0.00
+""",
+        "weekly": """
+<b>💰 Weekly P&L</b>
+
+Net P&L: $0.00
+Trades: 0
+Win Rate: 0.0%
+Profit Factor: 0.00
+""",
+        "monthly": """
+<b>💰 Monthly P&L</b>
+
+Net P&L: $0.00
+Trades: 0
+Win Rate: 0.0%
+Profit Factor: 0.00
+""",
+        "all": """
+<b>💰 All-Time P&L</b>
+
+Net P&L: $0.00
+Total Trades: 0
+Win Rate: 0.0%
+Profit Factor: 0.00
+""",
+    }
+
     def __init__(self, bot_state: Dict[str, Any]):
         self.bot_state = bot_state
 
+        # Command name -> bound handler, built once for O(1) dispatch
+        self._handlers = {
+            "start": self.cmd_start,
+            "status": self.cmd_status,
+            "pnl": self.cmd_pnl,
+            "trades": self.cmd_trades,
+            "backtests": self.cmd_backtests,
+            "help": self.cmd_help,
+            "ping": self.cmd_ping,
+        }
+
     async def handle_command(
         self,
         command: str,
@@ -42,26 +119,16 @@ class TelegramCommands:
         Returns:
             Response message
         """
-        command = command.lower().lstrip('/')
-
-        if command == "start":
-            return await self.cmd_start()
-        elif command == "status":
-            return await self.cmd_status()
-        elif command == "pnl":
-            return await self.cmd_pnl(args)
-        elif command == "trades":
-            return await self.cmd_trades(args)
-        elif command == "backtests":
-            return await self.cmd_backtests(args)
-        elif command == "help":
-            return await self.cmd_help()
-        elif command == "ping":
-            return await self.cmd_ping()
-        else:
+        # Skip normalization when the command is already canonical
+        if command.startswith('/') or not command.islower():
+            command = command.lower().lstrip('/')
+
+        handler = self._handlers.get(command)
+        if handler is None:
             return await self.cmd_unknown(command)
+        return await handler(args)
 
-    async def cmd_start(self) -> str:
+    async def cmd_start(self, args: Optional[list] = None) -> str:
         """Handle /start command."""
         message = """
 👋 Welcome to the Quant Scalping Bot!
@@ -84,82 +151,34 @@ Use these commands to interact:
 """
         return message
 
-    async def cmd_status(self) -> str:
+    async def cmd_status(self, args: Optional[list] = None) -> str:
         """Handle /status command."""
         state = self.bot_state
-
-        status_emoji = {
-            "running": "🟢",
-            "paused": "⏸️",
-            "stopped": "🔴",
-            "error": "🚨",
-        }.get(state.get("status", "unknown"), "❓")
-
+        status = state.get("status", "unknown")
         position = state.get("position", 0)
-        pos_type = "LONG" if position > 0 else ("SHORT" if position < 0 else "FLAT")
-
-        return f"""
-<b>📊 Bot Status</b>
-
-State: {status_emoji} {state.get('status', 'unknown').upper()}
-Mode: {'PAPER' if state.get('paper', True) else 'LIVE'}
-Symbol: {state.get('symbol', 'MES')}
-Position: {pos_type} x{abs(position)}
-
-<b>Performance:</b>
-Daily P&L: ${state.get('daily_pnl', 0.0):+.2f}
-Trades Today: {state.get('trades_today', 0)}
-Win Rate: {state.get('win_rate', 0.0):.1f}%
-
-<b>Strategy:</b>
-Current Z-Score: {state.get('zscore', 'Warming up...')}
-Lookback Period: {state.get('lookback', 20)} bars
-
-<i>{datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')} UTC</i>
-"""
+        sign = (position > 0) - (position < 0)
+
+        return self._STATUS_TEMPLATE.format_map({
+            "status_emoji": self._STATUS_EMOJI.get(status, "❓"),
+            "status": status.upper(),
+            "mode": "PAPER" if state.get("paper", True) else "LIVE",
+            "symbol": state.get("symbol", "MES"),
+            "pos_type": _POS_LABELS[sign + 1],
+            "pos_size": position if sign >= 0 else -position,
+            "daily_pnl": state.get("daily_pnl", 0.0),
+            "trades_today": state.get("trades_today", 0),
+            "win_rate": state.get("win_rate", 0.0),
+            "zscore": state.get("zscore", "Warming up..."),
+            "lookback": state.get("lookback", 20),
+            "timestamp": datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S"),
+        })
 
     async def cmd_pnl(self, args: list) -> str:
         """Handle /pnl command."""
-        period = args[0] if args and args[0] in ["daily", "weekly", "monthly", "all"] else "daily"
+        period = args[0] if args and args[0] in self._PNL_TEMPLATES else "daily"
 
         # In real implementation, fetch from database
-        if period == "daily":
-            return """
-<b>💰 Daily P&L</b>
-
-Net P&L: $0.00
-Trades: 0
-Win Rate: 0.0%
-Max Profit: $0.00
-Max Drawdown: $0.00
-"""
-        elif period == "weekly":
-            return """
-<b>💰 Weekly P&L</b>
-
-Net P&L: $0.00
-Trades: 0
-Win Rate: 0.0%
-Profit Factor: 0.00
-"""
-        elif period == "monthly":
-            return """
-<b>💰 Monthly P&L</b>
-
-Net P&L: $0.00
-Trades: 0
-Win Rate: 0.0%
-Profit Factor: 0.00
-"""
-        else:  # all
-            return """
-<b>💰 All-Time P&L</b>
-
-Net P&L: $0.00
-Total Trades: 0
-Win Rate: 0.0%
-Profit Factor: 0.00
-"""
+        return self._PNL_TEMPLATES[period]
 
     async def cmd_trades(self, args: list) -> str:
         """Handle /trades command."""
@@ -185,7 +204,7 @@ Profit Factor: 0.00
 Use: <code>python3 scripts/optimize_params.py</code>
 """
 
-    async def cmd_help(self) -> str:
+    async def cmd_help(self, args: Optional[list] = None) -> str:
         """Handle /help command."""
         help_text = "<b>Available Commands:</b>\n\n"
         for cmd, desc in self.COMMANDS.items():
@@ -204,7 +223,7 @@ Examples:
 
         return help_text
 
-    async def cmd_ping(self) -> str:
+    async def cmd_ping(self, args: Optional[list] = None) -> str:
         """Handle /ping command."""
         latency = datetime.utcnow().isoformat()
         return f"🏓 Pong! Bot is alive at {latency}"
@@ -2,6 +2,7 @@
 Utility helper functions.
 """
 import logging
+import time
 from datetime import datetime, timezone
 from typing import Optional
 
@@ -67,32 +68,43 @@ def clamp(value: float, min_val: float, max_val: float) -> float:
 
 
 class RateLimiter:
-    """Simple rate limiter"""
+    """
+    Simple rate limiter (token bucket, refilled lazily)
+
+    The bucket starts full and refills continuously, so a burst can
+    admit up to about 2 * max_calls within a single window.
+    """
 
     def __init__(self, max_calls: int, window_seconds: float):
+        if max_calls <= 0:
+            raise ValueError("RateLimiter max_calls must be positive")
+        if window_seconds <= 0:
+            raise ValueError("RateLimiter window_seconds must be positive")
         self.max_calls = max_calls
         self.window = window_seconds
-        self._calls = []
+        self._rate = max_calls / (window_seconds * 1e9)  # Tokens per ns
+        self._tokens = float(max_calls)
+        self._last_ns = time.monotonic_ns()
 
     def can_proceed(self) -> bool:
         """Check if action is allowed"""
-        now = utc_now()
-
-        # Remove old calls outside the window
-        self._calls = [
-            t for t in self._calls
-            if (now - t).total_seconds() < self.window
-        ]
-
-        if len(self._calls) < self.max_calls:
-            self._calls.append(now)
+        now = time.monotonic_ns()
+        tokens = self._tokens + (now - self._last_ns) * self._rate
+        if tokens > self.max_calls:
+            tokens = self.max_calls
+        self._last_ns = now
+
+        if tokens >= 1.0:
+            self._tokens = tokens - 1.0
             return True
 
+        self._tokens = tokens
         return False
 
     def reset(self):
         """Reset the rate limiter"""
-        self._calls = []
+        self._tokens = float(self.max_calls)
+        self._last_ns = time.monotonic_ns()
 
 
 def test_helpers():
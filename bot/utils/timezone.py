@@ -6,9 +6,10 @@ Handles conversion between:
 - US Eastern (market hours)
 - Singapore (local display)
 """
-from datetime import datetime, time
+from datetime import date, datetime, time, timedelta
+from time import time as _wall_time
 from zoneinfo import ZoneInfo
-from typing import Optional
+from typing import FrozenSet, Optional, Tuple
 
 # Common timezones
 UTC = ZoneInfo("UTC")
@@ -16,6 +17,65 @@ ET = ZoneInfo("America/New_York")  # US Eastern (handles DST)
 CT = ZoneInfo("America/Chicago")  # US Central (handles DST) - CME futures use CT
 SGT = ZoneInfo("Asia/Singapore")
 
+# Touch each zone once at import so the first real conversion doesn't pay
+# for the lazy transition lookup
+for _tz in (ET, CT, SGT):
+    _tz.utcoffset(datetime(2025, 1, 1))
+del _tz
+
+# Live-clock market state memoized per wall-clock minute:
+# (minute bucket, stock market open, futures open, market holiday)
+_MARKET_STATE_CACHE: Optional[Tuple[int, bool, bool, bool]] = None
+
+MINUTES_PER_DAY = 1440
+_MINUTES_PER_WEEK = 7 * MINUTES_PER_DAY
+
+# CME session boundaries in minutes from midnight CT
+_CME_BREAK_START = 16 * 60  # 4:00 PM CT daily maintenance / Friday close
+_CME_BREAK_END = 17 * 60  # 5:00 PM CT reopen / Sunday open
+
+
+def _cme_open_at(weekday: int, minute: int) -> bool:
+    """CME session rule for a CT weekday (Monday=0) and minute of day."""
+    if _CME_BREAK_START <= minute < _CME_BREAK_END:
+        return False  # Daily maintenance break
+    if weekday == 5:
+        return False  # Saturday: closed all day
+    if weekday == 6:
+        return minute >= _CME_BREAK_END  # Sunday: opens at 5 PM
+    if weekday == 4:
+        return minute < _CME_BREAK_START  # Friday: closes at 4 PM
+    return True
+
+
+def _build_minute_mask(rule) -> bytearray:
+    """One byte per minute of the week (Mon 00:00 = 0), 1 where rule() holds."""
+    mask = bytearray(7 * MINUTES_PER_DAY)
+    for weekday in range(7):
+        base = weekday * MINUTES_PER_DAY
+        for minute in range(MINUTES_PER_DAY):
+            mask[base + minute] = rule(weekday, minute)
+    return mask
+
+
+# Index with weekday * 1440 + hour * 60 + minute (futures in CT, stocks in ET).
+# np.frombuffer(mask, dtype=np.uint8) gives a view for indexing whole series.
+_WEEK_OPEN_MASK = _build_minute_mask(_cme_open_at)
+
+_STOCK_OPEN_MINUTE = 9 * 60 + 30
+_STOCK_CLOSE_MINUTE = 16 * 60
+
+# Default stock session minutes [9:30, 16:00); 16:00:00 sharp is checked separately
+_STOCK_MASK = _build_minute_mask(
+    lambda weekday, minute: weekday < 5 and _STOCK_OPEN_MINUTE <= minute < _STOCK_CLOSE_MINUTE
+)
+
+# Days from weekday i (Monday=0) to the next weekday's open
+_DAYS_TO_NEXT_OPEN = (1, 1, 1, 1, 3, 2, 1)
+
+_DEFAULT_MARKET_OPEN = time(9, 30)
+_DEFAULT_MARKET_CLOSE = time(16, 0)
+
 
 def now_utc() -> datetime:
     """Get current time in UTC"""
@@ -39,29 +99,60 @@ def now_ct() -> datetime:
 
 def to_et(dt: datetime) -> datetime:
     """Convert any datetime to US Eastern"""
-    if dt.tzinfo is None:
+    tz = dt.tzinfo
+    if tz is ET:
+        return dt
+    if tz is None:
         dt = dt.replace(tzinfo=UTC)
     return dt.astimezone(ET)
 
 
 def to_utc(dt: datetime) -> datetime:
     """Convert any datetime to UTC"""
-    if dt.tzinfo is None:
+    tz = dt.tzinfo
+    if tz is UTC:
+        return dt
+    if tz is None:
         dt = dt.replace(tzinfo=UTC)
     return dt.astimezone(UTC)
 
 
 def to_ct(dt: datetime) -> datetime:
     """Convert any datetime to US Central (CME time)"""
-    if dt.tzinfo is None:
+    tz = dt.tzinfo
+    if tz is CT:
+        return dt
+    if tz is None:
         dt = dt.replace(tzinfo=UTC)
     return dt.astimezone(CT)
 
 
+def _current_market_state() -> Tuple[int, bool, bool, bool]:
+    """
+    Get (minute bucket, stock market open, futures open, holiday) for now.
+
+    All flags are computed together at most once per minute; callers
+    polling on every bar/tick (including is_trading_allowed()) hit the
+    cache instead of converting timezones each time.
+    """
+    global _MARKET_STATE_CACHE
+
+    ts = _wall_time()
+    minute_key = int(ts // 60)
+    cache = _MARKET_STATE_CACHE
+    if cache is not None and cache[0] == minute_key:
+        return cache
+
+    now = datetime.fromtimestamp(ts, ET)
+    cache = (minute_key, _is_market_open_et(now), is_futures_trading_hours(now), _is_holiday_et(now))
+    _MARKET_STATE_CACHE = cache
+    return cache
+
+
 def is_market_open(
     current_time: Optional[datetime] = None,
-    market_open: time = time(9, 30),
-    market_close: time = time(16, 0),
+    market_open: time = _DEFAULT_MARKET_OPEN,
+    market_close: time = _DEFAULT_MARKET_CLOSE,
 ) -> bool:
     """
     Check if US stock market is open.
@@ -80,17 +171,33 @@ def is_market_open(
         True if market is open
     """
     if current_time is None:
+        if market_open == _DEFAULT_MARKET_OPEN and market_close == _DEFAULT_MARKET_CLOSE:
+            return _current_market_state()[1]
         current_time = now_et()
     else:
         current_time = to_et(current_time)
     
-    # Check weekday (Monday = 0, Sunday = 6)
-    if current_time.weekday() >= 5:
+    return _is_market_open_et(current_time, market_open, market_close)
+
+
+def _is_market_open_et(
+    dt_et: datetime,
+    market_open: time = _DEFAULT_MARKET_OPEN,
+    market_close: time = _DEFAULT_MARKET_CLOSE,
+) -> bool:
+    """is_market_open() for a datetime already in ET."""
+    weekday = dt_et.weekday()  # Monday = 0, Sunday = 6
+    
+    if market_open == _DEFAULT_MARKET_OPEN and market_close == _DEFAULT_MARKET_CLOSE:
+        if _STOCK_MASK[weekday * MINUTES_PER_DAY + dt_et.hour * 60 + dt_et.minute]:
+            return True
+        # Close is inclusive: exactly 4:00:00 PM still counts as open
+        return weekday < 5 and dt_et.time() == market_close
+    
+    if weekday >= 5:
         return False
     
-    # Check time
-    current_time_only = current_time.time()
-    return market_open <= current_time_only <= market_close
+    return market_open <= dt_et.time() <= market_close
 
 
 def is_futures_trading_hours(current_time: Optional[datetime] = None) -> bool:
@@ -117,37 +224,22 @@ def is_futures_trading_hours(current_time: Optional[datetime] = None) -> bool:
         True if futures market is open
     """
     if current_time is None:
-        current_time = now_ct()
-    else:
-        current_time = to_ct(current_time)
-    
-    weekday = current_time.weekday()  # Monday=0, Sunday=6
-    hour = current_time.hour
-    minute = current_time.minute
-    time_minutes = hour * 60 + minute  # Convert to minutes for easier comparison
+        return _current_market_state()[2]
+    current_time = to_ct(current_time)
     
-    # Daily maintenance break: 4:00 PM - 5:00 PM CT (16:00 - 17:00)
-    # This is 960-1020 minutes from midnight
-    if 960 <= time_minutes < 1020:  # 16:00 - 17:00
-        return False
-    
-    # Saturday: CLOSED all day
-    if weekday == 5:
-        return False
-    
-    # Sunday: Opens at 5:00 PM CT (17:00)
-    if weekday == 6:
-        return time_minutes >= 1020  # >= 17:00
-    
-    # Friday: Closes at 4:00 PM CT (16:00)
-    # But need to handle the maintenance window properly
-    # Friday trading: midnight - 4:00 PM, then CLOSED
-    if weekday == 4:
-        return time_minutes < 960  # < 16:00 (before maintenance)
+    idx = current_time.weekday() * MINUTES_PER_DAY + current_time.hour * 60 + current_time.minute
+    return _WEEK_OPEN_MASK[idx] == 1
+
+
+def _is_futures_hours_et(dt_et: datetime) -> bool:
+    """
+    is_futures_trading_hours() for a datetime already in ET.
     
-    # Monday-Thursday: Open 24 hours except daily maintenance (4-5 PM)
-    # Already handled maintenance window above, so return True
-    return True
+    CT is ET minus one hour year-round, except in the hour between the two
+    zones' Sunday-morning DST switches, when CME is closed either way.
+    """
+    idx = dt_et.weekday() * MINUTES_PER_DAY + dt_et.hour * 60 + dt_et.minute - 60
+    return _WEEK_OPEN_MASK[idx % _MINUTES_PER_WEEK] == 1
 
 
 def get_next_market_open(current_time: Optional[datetime] = None) -> datetime:
@@ -158,10 +250,8 @@ def get_next_market_open(current_time: Optional[datetime] = None) -> datetime:
         current_time: Starting time (defaults to now)
     
     Returns:
-        datetime of next market open in ET
+        datetime of next market open in ET (weekends and holidays skipped)
     """
-    from datetime import timedelta
-    
     if current_time is None:
         current_time = now_et()
     else:
@@ -169,22 +259,17 @@ def get_next_market_open(current_time: Optional[datetime] = None) -> datetime:
     
     # Start from today at 9:30 AM
     open_time = current_time.replace(hour=9, minute=30, second=0, microsecond=0)
+    weekday = current_time.weekday()
     
-    # If today's open hasn't passed, check if it's a weekday
-    if current_time < open_time and current_time.weekday() < 5:
-        return open_time
+    # Today's open if it hasn't passed on a weekday, else the next weekday's
+    if current_time >= open_time or weekday >= 5:
+        open_time += timedelta(days=_DAYS_TO_NEXT_OPEN[weekday])
     
-    # Otherwise, find next weekday
-    days_ahead = 1
-    while True:
-        next_open = open_time + timedelta(days=days_ahead)
-        if next_open.weekday() < 5:
-            return next_open
-        days_ahead += 1
-        if days_ahead > 7:
-            break
+    # Skip market holidays (at most a couple of days in a row)
+    while open_time.date() in US_MARKET_HOLIDAYS:
+        open_time += timedelta(days=_DAYS_TO_NEXT_OPEN[open_time.weekday()])
     
-    return open_time + timedelta(days=1)
+    return open_time
 
 
 def format_time_et(dt: datetime) -> str:
@@ -224,18 +309,18 @@ def format_time_ct(dt: datetime) -> str:
 #
 # TODO: Load from external source or update annually
 
-US_MARKET_HOLIDAYS_2025 = {
-    "2025-01-01",  # New Year's Day (Wednesday)
-    "2025-01-20",  # MLK Day (3rd Monday in January)
-    "2025-02-17",  # Presidents Day (3rd Monday in February)
-    "2025-04-18",  # Good Friday
-    "2025-05-26",  # Memorial Day (last Monday in May)
-    "2025-06-19",  # Juneteenth (Thursday)
-    "2025-07-04",  # Independence Day (Friday)
-    "2025-09-01",  # Labor Day (1st Monday in September)
-    "2025-11-27",  # Thanksgiving (4th Thursday in November)
-    "2025-12-25",  # Christmas (Thursday)
-}
+US_MARKET_HOLIDAYS_2025: FrozenSet[date] = frozenset({
+    date(2025, 1, 1),  # New Year's Day (Wednesday)
+    date(2025, 1, 20),  # MLK Day (3rd Monday in January)
+    date(2025, 2, 17),  # Presidents Day (3rd Monday in February)
+    date(2025, 4, 18),  # Good Friday
+    date(2025, 5, 26),  # Memorial Day (last Monday in May)
+    date(2025, 6, 19),  # Juneteenth (Thursday)
+    date(2025, 7, 4),  # Independence Day (Friday)
+    date(2025, 9, 1),  # Labor Day (1st Monday in September)
+    date(2025, 11, 27),  # Thanksgiving (4th Thursday in November)
+    date(2025, 12, 25),  # Christmas (Thursday)
+})
 
 # CME holidays for 2026
 # ==================
@@ -254,20 +339,20 @@ US_MARKET_HOLIDAYS_2025 = {
 # Last Updated: 2026-02-03 by Kai (Developer)
 # Verified: All dates calculated programmatically
 
-US_MARKET_HOLIDAYS_2026 = {
-    "2026-01-01",  # New Year's Day (Thursday)
-    "2026-01-19",  # Martin Luther King Jr. Day (3rd Monday in January)
-    "2026-02-16",  # Presidents' Day (3rd Monday in February)
-    "2026-04-03",  # Good Friday
-    "2026-05-25",  # Memorial Day (last Monday in May)
-    "2026-06-19",  # Juneteenth (Friday)
-    "2026-07-03",  # Independence Day observed (Friday, July 4 is Saturday)
-    "2026-09-07",  # Labor Day (1st Monday in September)
-    "2026-11-26",  # Thanksgiving (4th Thursday in November)
-    "2026-12-25",  # Christmas (Friday)
-}
-
-# Combined holidays dictionary for easy lookup
+US_MARKET_HOLIDAYS_2026: FrozenSet[date] = frozenset({
+    date(2026, 1, 1),  # New Year's Day (Thursday)
+    date(2026, 1, 19),  # Martin Luther King Jr. Day (3rd Monday in January)
+    date(2026, 2, 16),  # Presidents' Day (3rd Monday in February)
+    date(2026, 4, 3),  # Good Friday
+    date(2026, 5, 25),  # Memorial Day (last Monday in May)
+    date(2026, 6, 19),  # Juneteenth (Friday)
+    date(2026, 7, 3),  # Independence Day observed (Friday, July 4 is Saturday)
+    date(2026, 9, 7),  # Labor Day (1st Monday in September)
+    date(2026, 11, 26),  # Thanksgiving (4th Thursday in November)
+    date(2026, 12, 25),  # Christmas (Friday)
+})
+
+# Combined holiday set for easy lookup
 US_MARKET_HOLIDAYS = US_MARKET_HOLIDAYS_2025 | US_MARKET_HOLIDAYS_2026
 
 
@@ -286,8 +371,12 @@ def is_market_holiday(dt: Optional[datetime] = None) -> bool:
     else:
         dt = to_et(dt)
     
-    date_str = dt.strftime("%Y-%m-%d")
-    return date_str in US_MARKET_HOLIDAYS
+    return _is_holiday_et(dt)
+
+
+def _is_holiday_et(dt_et: datetime) -> bool:
+    """is_market_holiday() for a datetime already in ET."""
+    return dt_et.date() in US_MARKET_HOLIDAYS
 
 
 def is_trading_allowed(current_time: Optional[datetime] = None, use_futures_hours: bool = True) -> bool:
@@ -305,15 +394,20 @@ def is_trading_allowed(current_time: Optional[datetime] = None, use_futures_hour
         True if trading is allowed
     """
     if current_time is None:
-        current_time = now_et()
+        # Holiday and session flags come from the same per-minute cache entry
+        _, market_open, futures_open, holiday = _current_market_state()
+        return not holiday and (futures_open if use_futures_hours else market_open)
+
+    # Convert once; the holiday and session checks below reuse it
+    current_time = to_et(current_time)
     
-    if is_market_holiday(current_time):
+    if _is_holiday_et(current_time):
         return False
     
     if use_futures_hours:
-        return is_futures_trading_hours(current_time)
+        return _is_futures_hours_et(current_time)
     else:
-        return is_market_open(current_time)
+        return _is_market_open_et(current_time)
 
 
 # Self-test
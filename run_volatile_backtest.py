@@ -6,11 +6,42 @@
 Clean standalone script to generate volatile data and run backtest.
 
 Python 3.9 compatible (no dataclasses.field() for lists).
-No circular imports, no dependencies. Simple and reliable.
+No circular imports, only NumPy (numba, scipy, bottleneck optional). Simple and reliable.
 """
-import random
+import math
+from collections import namedtuple
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import List
+from typing import List, Tuple
+
+import numpy as np
+
+# Compile the backtest loop when numba is installed
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+# Solve the mean-reverting price recurrence in C when scipy is installed
+try:
+    from scipy.signal import lfilter
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+# Rolling window stats in C when bottleneck is installed
+try:
+    import bottleneck as bn
+    BOTTLENECK_AVAILABLE = True
+except ImportError:
+    BOTTLENECK_AVAILABLE = False
 
 
 # ============================================================================
@@ -28,6 +59,69 @@ class Bar:
         self.volume = volume
 
 
+@dataclass
+class BarSeries:
+    """OHLCV bars as parallel arrays (one column per field)"""
+    timestamp: np.ndarray  # datetime64[us]
+    open_: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+
+    def __len__(self) -> int:
+        return self.close.size
+
+    def timestamp_at(self, i: int) -> datetime:
+        """Timestamp of bar i as a datetime"""
+        return self.timestamp[i].item()
+
+    def timestamp_ns(self) -> np.ndarray:
+        """Timestamps as int64 nanoseconds since the epoch"""
+        return self.timestamp.astype("datetime64[ns]").view(np.int64)
+
+    @classmethod
+    def from_bars(cls, bars: List[Bar]) -> "BarSeries":
+        """Build columns from a list of Bar objects"""
+        return cls(
+            timestamp=np.array([b.timestamp for b in bars], dtype="datetime64[us]"),
+            open_=np.array([b.open for b in bars], dtype=np.float64),
+            high=np.array([b.high for b in bars], dtype=np.float64),
+            low=np.array([b.low for b in bars], dtype=np.float64),
+            close=np.array([b.close for b in bars], dtype=np.float64),
+            volume=np.array([b.volume for b in bars], dtype=np.int64),
+        )
+
+
+def to_bar_list(bars: BarSeries) -> List[Bar]:
+    """Expand a BarSeries into Bar objects (for code that expects them)"""
+    return [
+        Bar(timestamp=ts, open=o, high=h, low=l, close=c, volume=v)
+        for ts, o, h, l, c, v in zip(
+            bars.timestamp.tolist(), bars.open_.tolist(), bars.high.tolist(),
+            bars.low.tolist(), bars.close.tolist(), bars.volume.tolist(),
+        )
+    ]
+
+
+# Closed trade record (built from BacktestResult's trade arrays for reporting)
+Trade = namedtuple(
+    "Trade",
+    "timestamp entry_price exit_price quantity pnl entry_zscore exit_zscore",
+)
+
+
+class _Pos:
+    """Open position"""
+    __slots__ = ("entry_price", "entry_time", "qty", "entry_z")
+
+    def __init__(self, entry_price: float, entry_time: int, qty: int, entry_z: float):
+        self.entry_price = entry_price
+        self.entry_time = entry_time  # ns since the epoch
+        self.qty = qty
+        self.entry_z = entry_z
+
+
 class BacktestResult:
     """Backtest performance metrics (Python 3.9 compatible)"""
     def __init__(self):
@@ -42,71 +136,148 @@ class BacktestResult:
         self.avg_loss = 0.0
         self.profit_factor = 0.0
         self.sharpe_ratio = 0.0
-        self.trades = []  # Manual list
+
+        # Closed trades as parallel arrays, one row per trade
+        self.trade_ts_ns = np.empty(0, dtype=np.int64)  # Exit time, ns since the epoch
+        self.trade_entry_price = np.empty(0)
+        self.trade_exit_price = np.empty(0)
+        self.trade_qty = np.empty(0, dtype=np.int64)
+        self.trade_pnl = np.empty(0)
+        self.trade_entry_z = np.empty(0)
+        self.trade_exit_z = np.empty(0)
+
+    def get_trades(self, last: int | None = None) -> List[Trade]:
+        """Closed trades (all, or the last N) as Trade tuples with datetime timestamps"""
+        rows = slice(-last, None) if last else slice(None)
+        timestamps = self.trade_ts_ns[rows].astype("datetime64[ns]").astype("datetime64[us]")
+        return list(map(
+            Trade,
+            timestamps.tolist(),
+            self.trade_entry_price[rows].tolist(), self.trade_exit_price[rows].tolist(),
+            self.trade_qty[rows].tolist(), self.trade_pnl[rows].tolist(),
+            self.trade_entry_z[rows].tolist(), self.trade_exit_z[rows].tolist(),
+        ))
+
+    @property
+    def trades(self) -> List[Trade]:
+        """All closed trades as Trade tuples"""
+        return self.get_trades()
 
 
 # ============================================================================
-# Signal Generator (Clean)
+# Z-Score (Clean)
 # ============================================================================
 
-class SignalGenerator:
-    """Simple signal generator for Z-Score"""
-
-    def __init__(self, lookback_period: int = 20):
-        self.lookback_period = lookback_period
-        self.prices = []
-
-    def update(self, price: float) -> float | None:
-        """Update with new price and return Z-Score"""
-        self.prices.append(price)
-
-        if len(self.prices) > self.lookback_period:
-            self.prices.pop(0)
+def rolling_zscores(closes: np.ndarray, lookback_period: int) -> np.ndarray:
+    """
+    Z-Score of every close against its trailing window, in one pass.
 
-        if len(self.prices) < self.lookback_period:
-            return None
+    Population z-score, as in _run_core; NaN until the window fills,
+    0.0 where the window is flat.
+    """
+    n = closes.size
+    zscores = np.full(n, np.nan)
+    if n < lookback_period:
+        return zscores
 
-        mean = sum(self.prices) / len(self.prices)
-        variance = sum((p - mean) ** 2 for p in self.prices) / len(self.prices)
-        std = variance ** 0.5
+    # Center first so the window sums stay small and differences exact
+    x = closes - closes.mean()
 
-        if std == 0:
-            return 0.0
+    if BOTTLENECK_AVAILABLE:
+        mean = bn.move_mean(x, lookback_period)[lookback_period - 1:]
+        std = bn.move_std(x, lookback_period, ddof=0)[lookback_period - 1:]
+    else:
+        mean, std = _cumsum_window_stats(x, lookback_period)
 
-        zscore = (self.prices[-1] - mean) / std
-        return zscore
+    deviation = x[lookback_period - 1:] - mean
+    zscores[lookback_period - 1:] = np.divide(
+        deviation, std, out=np.zeros_like(deviation), where=std > 0
+    )
+    return zscores
 
-    def is_ready(self) -> bool:
-        """Check if we have enough data"""
-        return len(self.prices) >= self.lookback_period
 
-    def get_zscore(self) -> float | None:
-        """Get current Z-Score"""
-        if len(self.prices) < self.lookback_period:
-            return None
-        mean = sum(self.prices) / len(self.prices)
-        variance = sum((p - mean) ** 2 for p in self.prices) / len(self.prices)
-        std = variance ** 0.5
-        if std == 0:
-            return 0.0
-        return (self.prices[-1] - mean) / std
+def _cumsum_window_stats(x: np.ndarray, lookback_period: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Mean and population std of every full window, from cumulative sums."""
+    c1 = np.cumsum(np.insert(x, 0, 0.0))
+    c2 = np.cumsum(np.insert(x * x, 0, 0.0))
 
-    def get_signal(self, z_threshold_entry: float = 2.0, z_threshold_exit: float = 0.5) -> dict | None:
-        """Generate trading signal"""
-        zscore = self.get_zscore()
+    window_sum = c1[lookback_period:] - c1[:-lookback_period]
+    window_sum2 = c2[lookback_period:] - c2[:-lookback_period]
+    mean = window_sum / lookback_period
+    std = np.sqrt(np.maximum(window_sum2 / lookback_period - mean * mean, 0.0))
+    return mean, std
 
-        if zscore is None:
-            return None
 
-        signal = None
-        if zscore >= z_threshold_entry:
-            signal = {"type": "ENTER_SHORT", "zscore": zscore}
-        elif zscore <= -z_threshold_entry:
-            signal = {"type": "ENTER_LONG", "zscore": zscore}
-        elif abs(zscore) <= z_threshold_exit:
-            signal = {"type": "EXIT", "zscore": zscore}
+@njit(cache=True)
+def _run_core(close, lookback_period, z_entry, z_exit, multiplier, slippage):
+    """
+    Whole backtest over a close-price array: incremental z-score plus the
+    entry/exit state machine, starting flat.
 
-        return signal
+    Returns (n_trades, exit_idx, entry_price, exit_price, quantity, pnl,
+    entry_z, exit_z, open_idx, open_qty, open_price, open_z); the open_*
+    values describe a position still held at the end (open_qty == 0 if flat).
+    """
+    n = close.size
+    exit_idx = np.empty(n, dtype=np.int64)
+    entry_price = np.empty(n, dtype=np.float64)
+    exit_price = np.empty(n, dtype=np.float64)
+    quantity = np.empty(n, dtype=np.int64)
+    pnl = np.empty(n, dtype=np.float64)
+    entry_z = np.empty(n, dtype=np.float64)
+    exit_z = np.empty(n, dtype=np.float64)
+    n_trades = 0
+
+    open_idx = -1
+    open_qty = 0
+    open_price = 0.0
+    open_z = 0.0
+
+    # Sums of prices offset by the first close, to keep them small
+    base = close[0] if n > 0 else 0.0
+    sum_x = 0.0
+    sum_x2 = 0.0
+
+    for i in range(n):
+        x = close[i] - base
+        sum_x += x
+        sum_x2 += x * x
+        if i >= lookback_period:
+            old = close[i - lookback_period] - base
+            sum_x -= old
+            sum_x2 -= old * old
+        if i < lookback_period - 1:
+            continue
+
+        mean = sum_x / lookback_period
+        variance = sum_x2 / lookback_period - mean * mean
+        std = math.sqrt(variance) if variance > 0.0 else 0.0
+        z = (x - mean) / std if std > 0.0 else 0.0
+
+        if z >= z_entry or z <= -z_entry:
+            if open_qty == 0:
+                open_idx = i
+                open_qty = -1 if z >= z_entry else 1
+                open_price = close[i] + slippage
+                open_z = z
+        elif abs(z) <= z_exit and open_qty != 0:
+            exit_idx[n_trades] = i
+            entry_price[n_trades] = open_price
+            exit_price[n_trades] = close[i] + slippage
+            quantity[n_trades] = open_qty
+            pnl[n_trades] = (close[i] + slippage - open_price) * open_qty * multiplier
+            entry_z[n_trades] = open_z
+            exit_z[n_trades] = z
+            n_trades += 1
+            open_idx = -1
+            open_qty = 0
+
+    return (
+        n_trades,
+        exit_idx[:n_trades], entry_price[:n_trades], exit_price[:n_trades],
+        quantity[:n_trades], pnl[:n_trades], entry_z[:n_trades], exit_z[:n_trades],
+        open_idx, open_qty, open_price, open_z,
+    )
 
 
 # ============================================================================
@@ -122,114 +293,158 @@ class BacktestEngine:
         self.z_threshold_exit = z_threshold_exit
         self.stop_loss_dollars = stop_loss_dollars
         self.take_profit_dollars = take_profit_dollars
-        self.signal_gen = SignalGenerator(lookback_period=20)
+        self.lookback_period = 20
         self.position = None
 
-    def run(self, bars: List[Bar], multiplier: float = 5.0, slippage: float = 0.25) -> BacktestResult:
-        """Run backtest on historical bars"""
-        result = BacktestResult()
+    def _run_compiled(self, bars: BarSeries, result: BacktestResult,
+                      multiplier: float, slippage: float) -> Tuple[float, float]:
+        """Run the numba core and keep its trade arrays; returns (win P&L, loss P&L)"""
+        (n_trades, exit_idx, entry_price, exit_price, quantity, pnl,
+         entry_z, exit_z, open_idx, open_qty, open_price, open_z) = _run_core(
+            bars.close, self.lookback_period, self.z_threshold_entry,
+            self.z_threshold_exit, multiplier, slippage,
+        )
+
+        ts_ns = bars.timestamp_ns()
+        result.trade_ts_ns = ts_ns[exit_idx]
+        result.trade_entry_price = entry_price
+        result.trade_exit_price = exit_price
+        result.trade_qty = quantity
+        result.trade_pnl = pnl
+        result.trade_entry_z = entry_z
+        result.trade_exit_z = exit_z
+
+        won = pnl >= 0
+        result.total_trades = n_trades
+        result.winning_trades = int(np.count_nonzero(won))
+        result.losing_trades = n_trades - result.winning_trades
+
+        if n_trades:
+            equity = np.cumsum(pnl)
+            peak = np.maximum.accumulate(np.maximum(equity, 0.0))
+            result.total_pnl = float(equity[-1])
+            result.max_drawdown = max(float((peak - equity).max()), 0.0)
+
+        if open_qty != 0:
+            self.position = _Pos(open_price, int(ts_ns[open_idx]), open_qty, open_z)
+
+        return float(pnl[won].sum()), float(pnl[~won].sum())
+
+    def _run_loop(self, bars: BarSeries, result: BacktestResult,
+                  multiplier: float, slippage: float) -> Tuple[float, float]:
+        """Walk threshold-crossing bars through the position state machine; returns (win P&L, loss P&L)"""
         peak_equity = 0.0
-        equity_curve = [0.0]
-
-        for bar in bars:
-            zscore = self.signal_gen.update(bar.close)
-
-            if not self.signal_gen.is_ready():
-                continue
-
-            signal = self.signal_gen.get_signal(
-                z_threshold_entry=self.z_threshold_entry,
-                z_threshold_exit=self.z_threshold_exit,
-            )
-
-            if not signal:
-                continue
-
-            signal_type = signal["type"]
-
-            if signal_type == "ENTER_LONG" and self.position is None:
-                self.position = {
-                    "entry_price": bar.close + slippage,
-                    "entry_time": bar.timestamp,
-                    "quantity": 1,
-                    "entry_zscore": zscore,
-                }
-
-            elif signal_type == "ENTER_SHORT" and self.position is None:
-                self.position = {
-                    "entry_price": bar.close + slippage,
-                    "entry_time": bar.timestamp,
-                    "quantity": -1,
-                    "entry_zscore": zscore,
-                }
-
-            elif signal_type == "EXIT" and self.position is not None:
-                exit_price = bar.close + slippage
-                entry_price = self.position["entry_price"]
-                quantity = self.position["quantity"]
-
-                pnl = (exit_price - entry_price) * quantity * multiplier
-
-                result.trades.append({
-                    "timestamp": bar.timestamp,
-                    "entry_price": entry_price,
-                    "exit_price": exit_price,
-                    "quantity": quantity,
-                    "pnl": pnl,
-                    "entry_zscore": self.position["entry_zscore"],
-                    "exit_zscore": zscore,
-                })
-
-                equity_curve.append(equity_curve[-1] + pnl)
+        equity = 0.0
+        total_win_pnl = 0.0
+        total_loss_pnl = 0.0
+
+        entry = self.z_threshold_entry
+        exit_threshold = self.z_threshold_exit
+
+        # Z-Score for every bar at once; only bars past a threshold can signal
+        closes = bars.close
+        zscores = rolling_zscores(closes, self.lookback_period)
+        candidates = np.flatnonzero(
+            (zscores >= entry) | (zscores <= -entry) | (np.abs(zscores) <= exit_threshold)
+        )
+
+        # Each trade spans two bars, so n // 2 + 1 rows always fit
+        capacity = len(bars) // 2 + 1
+        ts_ns = bars.timestamp_ns()
+        trade_ts_ns = np.empty(capacity, dtype=np.int64)
+        trade_entry_price = np.empty(capacity)
+        trade_exit_price = np.empty(capacity)
+        trade_qty = np.empty(capacity, dtype=np.int64)
+        trade_pnl = np.empty(capacity)
+        trade_entry_z = np.empty(capacity)
+        trade_exit_z = np.empty(capacity)
+        n_trades = 0
+
+        # Write counters back once after the loop
+        position = self.position
+        winning_trades = losing_trades = 0
+        max_drawdown = result.max_drawdown
+
+        for i, close, zscore in zip(
+            candidates.tolist(), closes[candidates].tolist(), zscores[candidates].tolist()
+        ):
+            if position is None:
+                if zscore >= entry:
+                    position = _Pos(close + slippage, ts_ns[i], -1, zscore)
+                elif zscore <= -entry:
+                    position = _Pos(close + slippage, ts_ns[i], 1, zscore)
+
+            elif -entry < zscore < entry:
+                # Candidate bars that are not entries are exits
+                exit_price = close + slippage
+
+                pnl = (exit_price - position.entry_price) * position.qty * multiplier
+
+                trade_ts_ns[n_trades] = ts_ns[i]
+                trade_entry_price[n_trades] = position.entry_price
+                trade_exit_price[n_trades] = exit_price
+                trade_qty[n_trades] = position.qty
+                trade_pnl[n_trades] = pnl
+                trade_entry_z[n_trades] = position.entry_z
+                trade_exit_z[n_trades] = zscore
+                n_trades += 1
+
+                equity += pnl
 
                 if pnl >= 0:
-                    result.winning_trades += 1
+                    winning_trades += 1
+                    total_win_pnl += pnl
                 else:
-                    result.losing_trades += 1
-
-                if equity_curve[-1] > peak_equity:
-                    peak_equity = equity_curve[-1]
+                    losing_trades += 1
+                    total_loss_pnl += pnl
+
+                if equity > peak_equity:
+                    peak_equity = equity
+                elif peak_equity - equity > max_drawdown:
+                    max_drawdown = peak_equity - equity
+
+                position = None
+
+        self.position = position
+        result.trade_ts_ns = trade_ts_ns[:n_trades]
+        result.trade_entry_price = trade_entry_price[:n_trades]
+        result.trade_exit_price = trade_exit_price[:n_trades]
+        result.trade_qty = trade_qty[:n_trades]
+        result.trade_pnl = trade_pnl[:n_trades]
+        result.trade_entry_z = trade_entry_z[:n_trades]
+        result.trade_exit_z = trade_exit_z[:n_trades]
+        result.winning_trades += winning_trades
+        result.losing_trades += losing_trades
+        result.total_trades += winning_trades + losing_trades
+        result.max_drawdown = max_drawdown
+        result.total_pnl = equity
+        return total_win_pnl, total_loss_pnl
+
+    def run(self, bars: BarSeries, multiplier: float = 5.0, slippage: float = 0.25) -> BacktestResult:
+        """Run backtest on historical bars (a BarSeries, or a list of Bar)"""
+        result = BacktestResult()
+        if not isinstance(bars, BarSeries):
+            bars = BarSeries.from_bars(bars)
 
-                self.position = None
+        # The compiled core always starts flat
+        if NUMBA_AVAILABLE and self.position is None:
+            total_win_pnl, total_loss_pnl = self._run_compiled(bars, result, multiplier, slippage)
+        else:
+            total_win_pnl, total_loss_pnl = self._run_loop(bars, result, multiplier, slippage)
 
         # Calculate final metrics
-        result.total_pnl = equity_curve[-1]
-
         if result.total_trades > 0:
             result.win_rate = (result.winning_trades / result.total_trades * 100)
         else:
             result.win_rate = 0.0
 
         # Average win/loss
-        wins = [t["pnl"] for t in result.trades if t["pnl"] >= 0]
-        losses = [t["pnl"] for t in result.trades if t["pnl"] < 0]
-
-        result.avg_win = sum(wins) / len(wins) if wins else 0.0
-        result.avg_loss = sum(losses) / len(losses) if losses else 0.0
+        result.avg_win = total_win_pnl / result.winning_trades if result.winning_trades else 0.0
+        result.avg_loss = total_loss_pnl / result.losing_trades if result.losing_trades else 0.0
 
         # Profit factor
-        total_wins = sum(wins)
-        total_losses = abs(sum(losses))
-        result.profit_factor = (total_wins / total_losses if total_losses > 0 else 0.0)
-
-        # Max drawdown
-        if len(equity_curve) > 1:
-            returns = [
-                (equity_curve[i] - equity_curve[i-1])
-                for i in range(1, len(equity_curve))
-            ]
-            if returns:
-                avg_return = statistics.mean(returns)
-                std_return = statistics.stdev(returns) if len(returns) > 1 else 0.0001
-
-                drawdown = 0.0
-                peak = 0.0
-                for equity in equity_curve[1:]:
-                    if equity > peak:
-                        peak = equity
-                    drawdown = peak - equity
-                    if drawdown > result.max_drawdown:
-                        result.max_drawdown = drawdown
+        total_losses = abs(total_loss_pnl)
+        result.profit_factor = (total_win_pnl / total_losses if total_losses > 0 else 0.0)
 
         return result
 
@@ -238,8 +453,27 @@ class BacktestEngine:
 # Volatile Data Generator
 # ============================================================================
 
+def _mean_reverting_path(noise: np.ndarray, mean: float, reversion: float) -> np.ndarray:
+    """
+    Prices for price[i] = price[i-1] + noise[i] + (mean - price[i-1]) * reversion,
+    starting from price = mean.
+    """
+    decay = 1.0 - reversion
+    if SCIPY_AVAILABLE:
+        # First-order IIR on the deviation from the mean
+        return lfilter([1.0], [1.0, -decay], noise) + mean
+
+    deviation = np.empty_like(noise)
+    d = 0.0
+    for i, n in enumerate(noise.tolist()):
+        d = d * decay + n
+        deviation[i] = d
+    return deviation + mean
+
+
 def generate_volatile_bars(days: int = 30, bars_per_day: int = 78,
-                              volatility: float = 5.0) -> List[Bar]:
+                              volatility: float = 5.0,
+                              seed: int | np.random.Generator | None = None) -> BarSeries:
     """
     Generate synthetic bars with EXTREME volatility.
 
@@ -247,46 +481,32 @@ def generate_volatile_bars(days: int = 30, bars_per_day: int = 78,
         days: Number of days of data
         bars_per_day: Bars per day (5-minute bars = 78)
         volatility: High volatility (default 5.0 is EXTREME!)
+        seed: Optional RNG seed for reproducible data, or a Generator to draw from
 
     Returns:
-        List of Bar objects
+        BarSeries of the generated bars
     """
-    bars = []
-    current_time = datetime.utcnow() - timedelta(days=days)
-    price = 5000.0
-    mean = 5000.0
-
-    for i in range(days * bars_per_day):
-        # EXTREME noise = WIDER price swings
-        noise = random.gauss(0, volatility)
-
-        # Strong mean reversion
-        reversion = (mean - price) * 0.1
-
-        price = price + noise + reversion
-
-        # WIDER OHLC structure (more volatility!)
-        high = price + abs(random.gauss(0, 1.0))
-        low = price - abs(random.gauss(0, 1.0))
-        close = price
-        open_price = price - (random.gauss(0, 0.5))
-
-        volume = random.randint(100, 500)
-
-        bar = Bar(
-            timestamp=current_time,
-            open=open_price,
-            high=high,
-            low=low,
-            close=close,
-            volume=volume,
-        )
+    rng = np.random.default_rng(seed)
+    n = days * bars_per_day
+    start_time = datetime.utcnow() - timedelta(days=days)
 
-        bars.append(bar)
+    # EXTREME noise = WIDER price swings, strong mean reversion
+    closes = _mean_reverting_path(rng.normal(0.0, volatility, n), mean=5000.0, reversion=0.1)
 
-        current_time += timedelta(minutes=5)
+    # WIDER OHLC structure (more volatility!)
+    highs = closes + np.abs(rng.normal(0.0, 1.0, n))
+    lows = closes - np.abs(rng.normal(0.0, 1.0, n))
+    opens = closes - rng.normal(0.0, 0.5, n)
+    volumes = rng.integers(100, 501, n)
 
-    return bars
+    return BarSeries(
+        timestamp=np.datetime64(start_time, "us") + np.arange(n) * np.timedelta64(5, "m"),
+        open_=opens,
+        high=highs,
+        low=lows,
+        close=closes,
+        volume=volumes,
+    )
 
 
 # ============================================================================
@@ -322,16 +542,16 @@ def print_backtest_report(result: BacktestResult):
     print(f"  Profit per Trade:     ${result.total_pnl / result.total_trades if result.total_trades else 0:.2f}")
     print()
 
-    if result.trades:
+    if result.total_trades:
         print("📋 Last 10 Trades")
         print("-" * 60)
-        for i, trade in enumerate(result.trades[-10:]):
-            direction = "LONG" if trade["quantity"] > 0 else "SHORT"
-            pnl_color = "🟢" if trade["pnl"] >= 0 else "🔴"
-            print(f"  {trade['timestamp'].strftime('%Y-%m-%d %H:%M')} | "
+        for trade in result.get_trades(last=10):
+            direction = "LONG" if trade.quantity > 0 else "SHORT"
+            pnl_color = "🟢" if trade.pnl >= 0 else "🔴"
+            print(f"  {trade.timestamp.strftime('%Y-%m-%d %H:%M')} | "
                   f"{direction:5s} | "
-                  f"{pnl_color} ${trade['pnl']:6.2f} | "
-                  f"Z: {trade['entry_zscore']:+.2f} → {trade['exit_zscore']:+.2f}")
+                  f"{pnl_color} ${trade.pnl:6.2f} | "
+                  f"Z: {trade.entry_zscore:+.2f} → {trade.exit_zscore:+.2f}")
 
     print("=" * 60)
 
@@ -358,8 +578,7 @@ if __name__ == "__main__":
     print()
     print("2. Sample bars (first 5):")
     for i in range(5):
-        bar = bars[i]
-        print(f"   Bar {i+1}: {bar.close:.2f} (range: {bar.high-bar.low:.2f})")
+        print(f"   Bar {i+1}: {bars.close[i]:.2f} (range: {bars.high[i] - bars.low[i]:.2f})")
 
     print()
     print("3. Running backtest with LOW thresholds (±1.0 entry, ±0.2 exit)...")
@@ -8,20 +8,36 @@ import sys
 sys.path.insert(0, '.')
 
 import time
-import statistics
+import timeit
 import tracemalloc
 from typing import Dict, List, Tuple
+
+import numpy as np
+
 from bot.config import Config
-from bot.backtest import BacktestEngine, generate_realistic_bars
+from bot.backtest import BacktestEngine
+from bot.market_data import generate_realistic_bars
 from bot.core.signals import SignalGenerator
 
+# Faster JSON codecs are benchmarked when installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ujson
+    UJSON_AVAILABLE = True
+except ImportError:
+    UJSON_AVAILABLE = False
+
 
 class Benchmark:
     """Benchmark runner"""
 
     def __init__(self):
         self.results = {}
-        tracemalloc.start()
 
     def measure_signal_generation(
         self,
@@ -33,25 +49,42 @@ class Benchmark:
         config = Config.load('config/config.yaml.example')
         signal_gen = SignalGenerator(config.strategy.lookback_period)
 
-        # Warmup
+        # Warmup (fills the window and any JIT/cache loading happens here)
         for _ in range(100):
             signal_gen.update(5000.0)
 
-        # Measure
-        times = []
-        for _ in range(iterations):
-            start = time.perf_counter()
-            zscore = signal_gen.update(5000.0)
-            end = time.perf_counter()
-            times.append((end - start) * 1000)  # Convert to ms
+        # Measure (integer ns deltas into a preallocated array)
+        perf_counter_ns = time.perf_counter_ns
+        update = signal_gen.update
+        times_ns = np.empty(iterations, dtype=np.int64)
+        for i in range(iterations):
+            start = perf_counter_ns()
+            update(5000.0)
+            times_ns[i] = perf_counter_ns() - start
+        times = times_ns / 1e6  # Convert to ms
+
+        # Per-call cost with timer overhead amortized: timeit picks a loop
+        # count worth ~0.2s, and the fastest of several repeats is least noisy
+        timer = timeit.Timer("update(5000.0)", globals={"update": update})
+        number, _ = timer.autorange()
+        per_call_ms = min(timer.repeat(repeat=5, number=number)) / number * 1000
+
+        # Same number of prices through one vectorized batch_update call
+        batch_gen = SignalGenerator(config.strategy.lookback_period)
+        prices = np.full(iterations, 5000.0)
+        start = perf_counter_ns()
+        batch_gen.batch_update(prices)
+        batch_ms = (perf_counter_ns() - start) / 1e6
 
         return {
-            "mean_ms": statistics.mean(times),
-            "median_ms": statistics.median(times),
-            "min_ms": min(times),
-            "max_ms": max(times),
-            "std_ms": statistics.stdev(times) if len(times) > 1 else 0.0,
-            "total_ms": sum(times),
+            "mean_ms": float(np.mean(times)),
+            "median_ms": float(np.median(times)),
+            "min_ms": float(np.min(times)),
+            "max_ms": float(np.max(times)),
+            "std_ms": float(np.std(times, ddof=1)) if times.size > 1 else 0.0,
+            "total_ms": float(np.sum(times)),
+            "per_call_ms": per_call_ms,
+            "batch_total_ms": batch_ms,
         }
 
     def measure_backtest_engine(
@@ -66,14 +99,19 @@ class Benchmark:
 
         engine = BacktestEngine(config)
 
-        start = time.perf_counter()
-        result = engine.run(bars=bars, multiplier=5.0, slippage=0.25)
-        end = time.perf_counter()
+        # Trace allocations for this run only; other benchmarks run untraced
+        tracemalloc.start()
+        try:
+            start = time.perf_counter()
+            result = engine.run(bars=bars, multiplier=5.0, slippage=0.25)
+            end = time.perf_counter()
 
-        elapsed_ms = (end - start) * 1000
+            # Get memory usage
+            current, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
 
-        # Get memory usage
-        current, peak = tracemalloc.get_traced_memory()
+        elapsed_ms = (end - start) * 1000
         peak_mb = peak / 1024 / 1024
 
         return {
@@ -94,8 +132,9 @@ class Benchmark:
         from bot.backtest import BacktestEngine, Bar, BacktestResult
         from datetime import datetime
 
-        # Create test DB
-        conn = sqlite3.connect(":memory:")
+        # Create test DB (statement cache keeps the benchmark query compiled)
+        conn = sqlite3.connect(":memory:", cached_statements=256)
+        conn.row_factory = None
         cursor = conn.cursor()
 
         # Create tables
@@ -106,6 +145,8 @@ class Benchmark:
                 open REAL, high REAL, low REAL, close REAL, volume INTEGER
             )
         """)
+        # Index scan instead of a sort for ORDER BY timestamp DESC
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_ts ON test_bars(timestamp DESC)")
 
         # Insert test data
         cursor.executemany("""
@@ -118,31 +159,46 @@ class Benchmark:
 
         conn.commit()
 
-        # Benchmark queries
-        times = []
-        for _ in range(iterations):
-            start = time.perf_counter()
-            cursor.execute("SELECT * FROM test_bars ORDER BY timestamp DESC LIMIT 100")
-            cursor.fetchall()
-            end = time.perf_counter()
-            times.append((end - start) * 1000)
+        # Benchmark queries (same SQL string each time, so it is parsed once)
+        query = "SELECT * FROM test_bars ORDER BY timestamp DESC LIMIT 100"
+        execute = conn.execute
+        perf_counter_ns = time.perf_counter_ns
+        times_ns = np.empty(iterations, dtype=np.int64)
+        for i in range(iterations):
+            start = perf_counter_ns()
+            execute(query).fetchall()
+            times_ns[i] = perf_counter_ns() - start
+        times = times_ns / 1e6  # Convert to ms
 
         conn.close()
 
+        # p95 as the sample at rank int(0.95 * n), found by O(n) selection
+        p95 = 0.0
+        if times.size:
+            k = int(times.size * 0.95)
+            p95 = float(np.partition(times, k)[k])
+
         return {
-            "mean_ms": statistics.mean(times),
-            "median_ms": statistics.median(times),
-            "p95_ms": sorted(times)[int(len(times) * 0.95)] if times else 0.0,
+            "mean_ms": float(np.mean(times)),
+            "median_ms": float(np.median(times)),
+            "p95_ms": p95,
         }
 
     def measure_json_serialization(
         self,
         iterations: int = 1000,
     ) -> Dict[str, float]:
-        """Benchmark JSON encoding/decoding."""
+        """
+        Benchmark JSON encoding/decoding.
+
+        Top-level figures are for orjson when installed (stdlib json
+        otherwise); every available codec is also reported under "codecs".
+        """
         print(f"  Measuring JSON operations ({iterations} iterations)...")
 
+        import dataclasses
         import json
+        from datetime import datetime
         from bot.backtest import Bar
 
         test_bar = Bar(
@@ -153,27 +209,55 @@ class Benchmark:
             close=5000.5,
             volume=100,
         )
-
-        # Measure encoding
-        encode_times = []
-        for _ in range(iterations):
-            start = time.perf_counter()
-            json_str = json.dumps(test_bar.__dict__)
-            end = time.perf_counter()
-            encode_times.append((end - start) * 1000)
-
-        # Measure decoding
-        decode_times = []
-        for _ in range(iterations):
-            start = time.perf_counter()
-            obj = json.loads(json_str)
-            end = time.perf_counter()
-            decode_times.append((end - start) * 1000)
-
+        payload = dataclasses.asdict(test_bar)  # Bar is slotted, no __dict__
+
+        # name -> (encode, decode, object to encode); stdlib/ujson need a
+        # dict with datetimes stringified, orjson encodes the dataclass itself
+        codecs = {"json": (lambda obj: json.dumps(obj, default=str), json.loads, payload)}
+        if ORJSON_AVAILABLE:
+            orjson_options = (
+                orjson.OPT_SERIALIZE_DATACLASS | orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_NUMPY
+            )
+            codecs["orjson"] = (
+                lambda obj: orjson.dumps(obj, option=orjson_options),
+                orjson.loads,
+                test_bar,
+            )
+        if UJSON_AVAILABLE:
+            codecs["ujson"] = (lambda obj: ujson.dumps(obj, default=str), ujson.loads, payload)
+
+        perf_counter_ns = time.perf_counter_ns
+        codec_results = {}
+        for name, (encode, decode, obj) in codecs.items():
+            # Measure encoding
+            encode_ns = np.empty(iterations, dtype=np.int64)
+            for i in range(iterations):
+                start = perf_counter_ns()
+                encoded = encode(obj)
+                encode_ns[i] = perf_counter_ns() - start
+
+            # Measure decoding
+            decode_ns = np.empty(iterations, dtype=np.int64)
+            for i in range(iterations):
+                start = perf_counter_ns()
+                decode(encoded)
+                decode_ns[i] = perf_counter_ns() - start
+
+            # orjson returns bytes (decoded as-is); the others return str
+            if isinstance(encoded, str):
+                encoded = encoded.encode()
+
+            codec_results[name] = {
+                "encode_mean_ms": float(np.mean(encode_ns)) / 1e6,  # ns -> ms
+                "decode_mean_ms": float(np.mean(decode_ns)) / 1e6,
+                "json_size_bytes": len(encoded),
+            }
+
+        codec = "orjson" if ORJSON_AVAILABLE else "json"
         return {
-            "encode_mean_ms": statistics.mean(encode_times),
-            "decode_mean_ms": statistics.mean(decode_times),
-            "json_size_bytes": len(json.dumps(test_bar.__dict__).encode()),
+            **codec_results[codec],
+            "codec": codec,
+            "codecs": codec_results,
         }
 
     def run_full_benchmark(self) -> Dict[str, any]:
@@ -230,6 +314,8 @@ class Benchmark:
         print(f"   Max:     {sg['max_ms']:.3f} ms")
         print(f"   Std Dev: {sg['std_ms']:.3f} ms")
         print(f"   Total:   {sg['total_ms']:.1f} ms")
+        print(f"   Per call: {sg['per_call_ms'] * 1000:.3f} µs (timeit, best of 5)")
+        print(f"   Batch:   {sg['batch_total_ms']:.3f} ms (batch_update, same count)")
         print()
 
         # Backtest Engine
@@ -251,10 +337,13 @@ class Benchmark:
 
         # JSON Operations
         json_res = results['json']
-        print("4. JSON Operations (1000 iterations)")
+        print(f"4. JSON Operations (1000 iterations, {json_res['codec']})")
         print(f"   Encode:   {json_res['encode_mean_ms']:.3f} ms")
         print(f"   Decode:   {json_res['decode_mean_ms']:.3f} ms")
         print(f"   Size:     {json_res['json_size_bytes']} bytes")
+        for name, codec_res in json_res['codecs'].items():
+            print(f"   {name + ':':9s} encode {codec_res['encode_mean_ms']:.4f} ms, "
+                  f"decode {codec_res['decode_mean_ms']:.4f} ms")
         print()
 
         # Performance grades
@@ -271,7 +360,7 @@ class Benchmark:
         print("-" * 60)
 
         # Signal generation
-        sg_mean = results['signal_gen']['mean_ms']
+        sg_mean = results['signal_gen']['per_call_ms']
         if sg_mean < 0.01:
             sg_grade = "🟢 Excellent"
         elif sg_mean < 0.05:
@@ -7,68 +7,113 @@ Creates more realistic price action with mean reversion.
 import sys
 sys.path.insert(0, '.')
 
-from bot.backtest import generate_test_bars, Bar, BacktestEngine
-from bot.config import Config
+from datetime import datetime, timedelta
+from typing import Optional
 
+import numpy as np
 
-def generate_volatile_bars(days: int = 30) -> list:
-    """
-    Generate bars with more volatility to trigger more trades.
+from bot.backtest import generate_test_bars, Bar, BarPool, BacktestEngine
+from bot.config import Config
 
-    Args:
-        days: Number of days
+# Compile the price recurrence when numba is installed
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
-    Returns:
-        List of Bar objects
-    """
-    import random
-    from datetime import datetime, timedelta
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
 
-    bars = []
-    current_time = datetime.utcnow() - timedelta(days=days)
 
+@njit(cache=True)
+def _price_path(noise, trend_inc, burst):
+    """
+    Mean-reverting price path with a decaying random trend, clamped to
+    [4800, 5200]; the inputs are pre-drawn per-bar random terms.
+    """
+    n = noise.shape[0]
+    prices = np.empty(n)
     price = 5000.0
     trend = 0.0
 
-    for i in range(days * 78):  # 78 bars per day (5-min)
-        # Random volatility burst
-        volatility_burst = 0.0
-        if random.random() < 0.05:  # 5% chance of volatility spike
-            volatility_burst = random.choice([-1, 1]) * random.uniform(2, 5)
-
+    for i in range(n):
         # Mean reversion strength
         mean_reversion = (5000.0 - price) * 0.1
 
-        # Update price
-        noise = random.gauss(0, 0.8)
-        trend += random.gauss(0, 0.02)
+        trend += trend_inc[i]
         trend *= 0.98  # Decay trend
 
-        price = price + noise + mean_reversion + volatility_burst + trend
+        price = price + noise[i] + mean_reversion + burst[i] + trend
 
         # Ensure price stays positive
         price = max(price, 4800.0)
         price = min(price, 5200.0)
+        prices[i] = price
 
-        # Create OHLC
-        high = price + abs(random.gauss(0, 0.5))
-        low = price - abs(random.gauss(0, 0.5))
-        close = price
-        open_price = price - (random.gauss(0, 0.5))
+    return prices
 
-        bar = Bar(
-            timestamp=current_time,
+
+def generate_volatile_bars(days: int = 30, seed: Optional[int] = None,
+                           pool: Optional[BarPool] = None) -> list:
+    """
+    Generate bars with more volatility to trigger more trades.
+
+    Args:
+        days: Number of days
+        seed: Optional RNG seed for reproducible data
+        pool: Optional BarPool to reset bars from instead of allocating;
+            the returned bars are overwritten by the next call using the
+            same pool, so only pass one when each list is consumed first
+
+    Returns:
+        List of Bar objects
+    """
+    rng = np.random.default_rng(seed)
+    n = days * 78  # 78 bars per day (5-min)
+    if pool is not None and len(pool) < n:
+        raise ValueError(f"BarPool holds {len(pool)} bars, need {n}")
+    start_time = datetime.utcnow() - timedelta(days=days)
+
+    # Random volatility bursts: 5% chance of a 2-5 point spike either way
+    burst = np.where(
+        rng.random(n) < 0.05,
+        rng.choice([-1.0, 1.0], n) * rng.uniform(2, 5, n),
+        0.0,
+    )
+    closes = _price_path(rng.normal(0, 0.8, n), rng.normal(0, 0.02, n), burst)
+
+    # Create OHLC
+    highs = closes + np.abs(rng.normal(0, 0.5, n))
+    lows = closes - np.abs(rng.normal(0, 0.5, n))
+    opens = closes - rng.normal(0, 0.5, n)
+    volumes = rng.integers(100, 801, n)
+
+    step = timedelta(minutes=5)
+    columns = enumerate(zip(
+        opens.tolist(), highs.tolist(), lows.tolist(), closes.tolist(), volumes.tolist(),
+    ))
+    if pool is not None:
+        acquire = pool.acquire
+        return [
+            acquire().reset(start_time + i * step, open_price, high, low, close, volume)
+            for i, (open_price, high, low, close, volume) in columns
+        ]
+
+    return [
+        Bar(
+            timestamp=start_time + i * step,
             open=open_price,
             high=high,
             low=low,
             close=close,
-            volume=random.randint(100, 800),
+            volume=volume,
         )
-
-        bars.append(bar)
-        current_time += timedelta(minutes=5)
-
-    return bars
+        for i, (open_price, high, low, close, volume) in columns
+    ]
 
 
 def test_volatile():
@@ -7,11 +7,153 @@ Tests multiple parameter combinations to find optimal settings.
 import sys
 sys.path.insert(0, '.')
 
+import dataclasses
+import hashlib
 import itertools
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+import numpy as np
+
 from bot.config import Config
 from bot.backtest import BacktestEngine, generate_test_bars, print_backtest_report
 from bot.backtest.engine import BacktestResult, Bar
 
+# Rate-limited progress bar when tqdm is installed
+try:
+    from tqdm import tqdm
+    TQDM_AVAILABLE = True
+except ImportError:
+    TQDM_AVAILABLE = False
+
+T = TypeVar("T")
+
+
+def _progress(items: Iterable[T], total: int, desc: str) -> Iterator[T]:
+    """Yield items while showing progress, redrawn at most ~10 times a second."""
+    if TQDM_AVAILABLE:
+        yield from tqdm(items, total=total, desc=desc)
+        return
+
+    last_draw = 0.0
+    for done, item in enumerate(items, 1):
+        yield item
+        now = time.monotonic()
+        if now - last_draw >= 0.1 or done == total:
+            last_draw = now
+            print(f"\r{desc}: [{done}/{total}]", end='', flush=True)
+    print()
+
+# On-disk layout of cached test bars (one record per bar)
+BAR_DTYPE = np.dtype([
+    ("timestamp", "datetime64[us]"),
+    ("open", np.float64),
+    ("high", np.float64),
+    ("low", np.float64),
+    ("close", np.float64),
+    ("volume", np.int64),
+])
+
+
+def _bars_from_records(records: np.ndarray) -> List[Bar]:
+    """Build backtest Bars from BAR_DTYPE records"""
+    return [
+        Bar(timestamp=ts, open=o, high=h, low=l, close=c, volume=v)
+        for ts, o, h, l, c, v in zip(
+            records["timestamp"].tolist(), records["open"].tolist(),
+            records["high"].tolist(), records["low"].tolist(),
+            records["close"].tolist(), records["volume"].tolist(),
+        )
+    ]
+
+
+def load_test_bars(
+    days: int = 60,
+    bars_per_day: int = 78,
+    seed: Optional[int] = None,
+    cache_dir: Optional[str] = None,
+) -> List[Bar]:
+    """
+    Generate test bars, or load them from a cache file keyed by the arguments.
+
+    Args:
+        days: Number of days of data
+        bars_per_day: Bars per day (5-minute bars = 78)
+        seed: Optional seed for the generator (reproducible data)
+        cache_dir: Directory for .npy bar caches; None disables caching
+
+    Returns:
+        List of bot.backtest.engine.Bar objects, whether cached or not
+    """
+    cache_path = None
+    if cache_dir is not None:
+        key = hashlib.sha256(f"{days}:{bars_per_day}:{seed}".encode()).hexdigest()[:16]
+        cache_path = Path(cache_dir) / f"test_bars_{key}.npy"
+        if cache_path.exists():
+            # Memory-mapped: only the columns are read, no regeneration
+            return _bars_from_records(np.load(cache_path, mmap_mode="r"))
+
+    if seed is not None:
+        random.seed(seed)
+    bars = generate_test_bars(days=days, bars_per_day=bars_per_day)
+
+    # Round-trip through the cache layout so both paths return the same type
+    records = np.array(
+        [(b.timestamp, b.open, b.high, b.low, b.close, b.volume) for b in bars],
+        dtype=BAR_DTYPE,
+    )
+    if cache_path is not None:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        np.save(cache_path, records)
+
+    return _bars_from_records(records)
+
+
+# Per-worker copies of the shared inputs, set once by _init_worker
+_worker_bars: List[Bar] = []
+_worker_config: Optional[Config] = None
+_worker_engine: Optional[BacktestEngine] = None
+
+
+def _init_worker(bars: List[Bar], base_config: Config) -> None:
+    """Store the bars and base config in the worker so tasks only carry params."""
+    global _worker_bars, _worker_config, _worker_engine
+    _worker_bars = bars
+    _worker_config = base_config
+    _worker_engine = BacktestEngine(base_config)
+
+
+def _run_one(params: Tuple[int, float, float]) -> Tuple[dict, BacktestResult]:
+    """Backtest one (lookback, z_entry, z_exit) combination in a worker."""
+    lookback, z_entry, z_exit = params
+
+    # Create config with these parameters
+    config = dataclasses.replace(
+        _worker_config,
+        strategy=dataclasses.replace(
+            _worker_config.strategy,
+            lookback_period=lookback,
+            z_threshold_entry=z_entry,
+            z_threshold_exit=z_exit,
+        ),
+    )
+
+    # Run backtest on the worker's engine, cleared for this combination
+    _worker_engine.reset(config)
+    result = _worker_engine.run(bars=_worker_bars, multiplier=5.0, slippage=0.25)
+
+    params = {
+        "lookback": lookback,
+        "z_entry": z_entry,
+        "z_exit": z_exit,
+    }
+
+    return params, result
+
 
 def optimize_parameters(
     config_path: str = 'config/config.yaml.example',
@@ -19,6 +161,9 @@ def optimize_parameters(
     z_entry_range: list = [1.5, 2.0, 2.5, 3.0],
     z_exit_range: list = [0.3, 0.5, 0.7],
     top_n: int = 5,
+    workers: Optional[int] = None,
+    seed: Optional[int] = None,
+    cache_dir: Optional[str] = None,
 ) -> list:
     """
     Run parameter optimization.
@@ -29,6 +174,9 @@ def optimize_parameters(
         z_entry_range: List of entry Z-score thresholds to test
         z_exit_range: List of exit Z-score thresholds to test
         top_n: Number of best results to return
+        workers: Worker processes for the grid (default: os.cpu_count())
+        seed: Optional seed for the test data
+        cache_dir: Directory to cache test data in between runs (None: regenerate)
 
     Returns:
         List of (score, params, result) tuples, sorted by score
@@ -40,7 +188,7 @@ def optimize_parameters(
 
     # Generate test data once (for fair comparison)
     print("Generating test data...")
-    bars = generate_test_bars(days=60, bars_per_day=78)  # 60 days
+    bars = load_test_bars(days=60, bars_per_day=78, seed=seed, cache_dir=cache_dir)  # 60 days
     print(f"Generated {len(bars)} bars\n")
 
     # Calculate total combinations
@@ -52,43 +200,33 @@ def optimize_parameters(
     print(f"Testing {total_combinations} parameter combinations...")
     print()
 
-    results = []
-    combinations = 0
+    # Parse the config once; each combination gets a modified copy
+    base_config = Config.load(config_path)
 
-    # Iterate through all combinations
-    for lookback, z_entry, z_exit in itertools.product(
-        lookback_range, z_entry_range, z_exit_range
-    ):
-        combinations += 1
-        print(f"\r[{combinations}/{total_combinations}] Testing...", end='', flush=True)
+    # Each combination is an independent backtest; run them across processes
+    grid = list(itertools.product(lookback_range, z_entry_range, z_exit_range))
+    runs = []
 
-        # Create config with these parameters
-        config = Config.load(config_path)
-        config.strategy.lookback_period = lookback
-        config.strategy.z_threshold_entry = z_entry
-        config.strategy.z_threshold_exit = z_exit
+    with ProcessPoolExecutor(
+        max_workers=workers or os.cpu_count(),
+        initializer=_init_worker,
+        initargs=(bars, base_config),
+    ) as executor:
+        futures = [executor.submit(_run_one, params) for params in grid]
 
-        # Run backtest
-        engine = BacktestEngine(config)
-        result = engine.run(bars=bars, multiplier=5.0, slippage=0.25)
+        # Collect in grid order so ties keep the sequential ranking
+        for future in _progress(futures, total_combinations, "Optimizing"):
+            runs.append(future.result())
 
-        # Calculate score (weighted combination of metrics)
-        # Higher score is better
-        score = calculate_score(result)
-
-        params = {
-            "lookback": lookback,
-            "z_entry": z_entry,
-            "z_exit": z_exit,
-        }
-
-        results.append((score, params, result))
-
-    print()  # Newline after progress
     print()
 
-    # Sort by score (descending)
-    results.sort(key=lambda x: x[0], reverse=True)
+    # Score every run in one pass (weighted combination of metrics, higher
+    # is better), then sort descending; stable, so ties keep grid order
+    scores = calculate_scores([result for _, result in runs])
+    results = [
+        (float(scores[i]), *runs[i])
+        for i in np.argsort(-scores, kind="stable").tolist()
+    ]
 
     # Print top N results
     print("=" * 60)
@@ -115,9 +253,9 @@ def optimize_parameters(
     return results[:top_n]
 
 
-def calculate_score(result: BacktestResult) -> float:
+def calculate_scores(results: List[BacktestResult]) -> np.ndarray:
     """
-    Calculate a single score for backtest result.
+    Calculate a single score for each backtest result, all at once.
 
     Weights:
     - Profit Factor: 40% (most important)
@@ -126,23 +264,33 @@ def calculate_score(result: BacktestResult) -> float:
     - Max Drawdown (penalty): 15%
 
     Returns:
-        Score (higher is better)
+        Scores aligned with results (higher is better)
     """
+    profit_factor = np.array([r.profit_factor for r in results], dtype=np.float64)
+    win_rate = np.array([r.win_rate for r in results], dtype=np.float64)
+    sharpe = np.array([r.sharpe_ratio for r in results], dtype=np.float64)
+    drawdown = np.array([r.max_drawdown for r in results], dtype=np.float64)
+
     # Normalize metrics to 0-1 range
-    profit_factor_score = min(result.profit_factor / 2.0, 1.0)  # 2.0 is excellent
-    win_rate_score = result.win_rate / 60.0  # 60% is excellent
-    sharpe_score = min((result.sharpe_ratio + 2) / 4.0, 1.0)  # 2.0 is excellent
-    drawdown_penalty = min(result.max_drawdown / 1000.0, 1.0)  # $1000 drawdown
+    profit_factor_score = np.minimum(profit_factor / 2.0, 1.0)  # 2.0 is excellent
+    win_rate_score = win_rate / 60.0  # 60% is excellent
+    sharpe_score = np.minimum((sharpe + 2) / 4.0, 1.0)  # 2.0 is excellent
+    drawdown_penalty = np.minimum(drawdown / 1000.0, 1.0)  # $1000 drawdown
 
     # Weighted combination
-    score = (
+    scores = (
         profit_factor_score * 0.40 +
         win_rate_score * 0.25 +
         sharpe_score * 0.20 +
         (1.0 - drawdown_penalty) * 0.15
     )
 
-    return score * 100  # Scale to 0-100
+    return scores * 100  # Scale to 0-100
+
+
+def calculate_score(result: BacktestResult) -> float:
+    """Calculate the score of one backtest result (see calculate_scores)."""
+    return float(calculate_scores([result])[0])
 
 
 def print_comparison(results: list):
@@ -178,6 +326,12 @@ if __name__ == "__main__":
                        help="Number of top results to show")
     parser.add_argument("--quick", action="store_true",
                        help="Quick test with fewer combinations")
+    parser.add_argument("--workers", type=int, default=None,
+                       help="Worker processes (default: CPU count)")
+    parser.add_argument("--seed", type=int, default=None,
+                       help="Seed for the test data")
+    parser.add_argument("--cache-dir", default=None,
+                       help="Cache test data here and reuse it on later runs")
 
     args = parser.parse_args()
 
@@ -196,6 +350,9 @@ if __name__ == "__main__":
         z_entry_range=z_entry_range,
         z_exit_range=z_exit_range,
         top_n=args.top,
+        workers=args.workers,
+        seed=args.seed,
+        cache_dir=args.cache_dir,
     )
 
     # Print comparison table
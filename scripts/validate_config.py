@@ -18,9 +18,47 @@ class ConfigValidator:
     WARNINGS = "WARNING"
     INFO = "INFO"
 
+    # Single-field range checks per section, built once:
+    # (key, default, (low, level, message), (high, level, message)).
+    # Fires when value < low or value > high; None skips that bound.
+    RANGE_RULES = {
+        "strategy": (
+            ("lookback_period", 0,
+             (5, WARNINGS, "Lookback period ({}) is very low, recommend 15+"),
+             (50, WARNINGS, "Lookback period ({}) is very high, recommend 30 or less")),
+            ("z_threshold_entry", 0,
+             (1.0, WARNINGS, "Z-Entry ({}) is very low, will trigger often"),
+             (3.0, WARNINGS, "Z-Entry ({}) is very high, may miss opportunities")),
+            ("z_threshold_exit", 0,
+             (0.1, WARNINGS, "Z-Exit ({}) is very low, may exit too early"),
+             None),
+        ),
+        "risk": (
+            ("max_position_size", 0,
+             (1, ERRORS, "Max position size ({}) must be at least 1"),
+             (5, WARNINGS, "Max position size ({}) is high for paper trading")),
+            ("stop_loss_dollars", 0,
+             (0, ERRORS, "Stop loss ({}) must be positive"),
+             None),
+            ("take_profit_dollars", 0,
+             (0, ERRORS, "Take profit ({}) must be positive"),
+             None),
+            ("max_daily_loss", 0,
+             (0, ERRORS, "Daily loss limit ({}) must be positive"),
+             (1000, WARNINGS, "Daily loss limit (${}) is high for paper trading")),
+            ("max_consecutive_losses", 0,
+             (2, WARNINGS, "Max consecutive losses ({}) is low"),
+             (5, WARNINGS, "Max consecutive losses ({}) is high")),
+            ("max_position_duration_hours", 0,
+             (0.5, WARNINGS, "Position duration ({}h) is very short"),
+             (8, WARNINGS, "Position duration ({}h) is very long")),
+        ),
+    }
+
     def __init__(self, config_path: str):
         self.config_path = config_path
-        self.issues = []
+        # Issue messages bucketed by level as they are added
+        self.buckets = {self.ERRORS: [], self.WARNINGS: [], self.INFO: []}
 
     def validate(self) -> bool:
         """Run all validations and return True if valid."""
@@ -47,9 +85,9 @@ class ConfigValidator:
             print("VALIDATION SUMMARY")
             print("=" * 60)
 
-            errors = [i for i in self.issues if i[0] == self.ERRORS]
-            warnings = [i for i in self.issues if i[0] == self.WARNINGS]
-            info = [i for i in self.issues if i[0] == self.INFO]
+            errors = self.buckets[self.ERRORS]
+            warnings = self.buckets[self.WARNINGS]
+            info = self.buckets[self.INFO]
 
             print(f"\n✅ {len(info)} informational messages")
             print(f"⚠️  {len(warnings)} warnings")
@@ -57,14 +95,14 @@ class ConfigValidator:
 
             if errors:
                 print("📋 Errors:")
-                for _, message in errors:
+                for message in errors:
                     print(f"   ❌ {message}")
                 print()
                 return False
 
             if warnings:
                 print("⚠️  Warnings:")
-                for _, message in warnings:
+                for message in warnings:
                     print(f"   ⚠️  {message}")
                 print()
 
@@ -79,8 +117,17 @@ class ConfigValidator:
             return False
 
     def _add_issue(self, level: str, message: str):
-        """Add an issue to the list."""
-        self.issues.append((level, message))
+        """Add an issue to its level's bucket."""
+        self.buckets[level].append(message)
+
+    def _check_ranges(self, section_name: str, section: dict):
+        """Apply RANGE_RULES for one section."""
+        for key, default, low, high in self.RANGE_RULES[section_name]:
+            value = section.get(key, default)
+            if low is not None and value < low[0]:
+                self._add_issue(low[1], low[2].format(value))
+            elif high is not None and value > high[0]:
+                self._add_issue(high[1], high[2].format(value))
 
     def _validate_structure(self, config: dict):
         """Validate required sections exist."""
@@ -98,15 +145,7 @@ class ConfigValidator:
             return
 
         strategy = config['strategy']
-
-        # Lookback period
-        lookback = strategy.get('lookback_period', 0)
-        if lookback < 5:
-            self._add_issue(self.WARNINGS,
-                          f"Lookback period ({lookback}) is very low, recommend 15+")
-        elif lookback > 50:
-            self._add_issue(self.WARNINGS,
-                          f"Lookback period ({lookback}) is very high, recommend 30 or less")
+        self._check_ranges('strategy', strategy)
 
         # Z thresholds
         z_entry = strategy.get('z_threshold_entry', 0)
@@ -116,45 +155,18 @@ class ConfigValidator:
             self._add_issue(self.ERRORS,
                           f"Z-Entry ({z_entry}) must be greater than Z-Exit ({z_exit})")
 
-        if z_entry < 1.0:
-            self._add_issue(self.WARNINGS,
-                          f"Z-Entry ({z_entry}) is very low, will trigger often")
-        elif z_entry > 3.0:
-            self._add_issue(self.WARNINGS,
-                          f"Z-Entry ({z_entry}) is very high, may miss opportunities")
-
-        if z_exit < 0.1:
-            self._add_issue(self.WARNINGS,
-                          f"Z-Exit ({z_exit}) is very low, may exit too early")
-
     def _validate_risk(self, config: dict):
         """Validate risk parameters."""
         if 'risk' not in config:
             return
 
         risk = config['risk']
-
-        # Position size
-        max_pos = risk.get('max_position_size', 0)
-        if max_pos < 1:
-            self._add_issue(self.ERRORS,
-                          f"Max position size ({max_pos}) must be at least 1")
-        elif max_pos > 5:
-            self._add_issue(self.WARNINGS,
-                          f"Max position size ({max_pos}) is high for paper trading")
+        self._check_ranges('risk', risk)
 
         # Stop loss / take profit
         sl = risk.get('stop_loss_dollars', 0)
         tp = risk.get('take_profit_dollars', 0)
 
-        if sl < 0:
-            self._add_issue(self.ERRORS,
-                          f"Stop loss ({sl}) must be positive")
-
-        if tp < 0:
-            self._add_issue(self.ERRORS,
-                          f"Take profit ({tp}) must be positive")
-
         if tp <= sl:
             self._add_issue(self.WARNINGS,
                           f"Take profit ({tp}) <= stop loss ({sl}), risking more than reward")
@@ -164,33 +176,6 @@ class ConfigValidator:
             self._add_issue(self.WARNINGS,
                           f"Risk/Reward ratio ({risk_reward:.2f}) is low, recommend > 1.5")
 
-        # Daily loss limit
-        daily_loss = risk.get('max_daily_loss', 0)
-        if daily_loss < 0:
-            self._add_issue(self.ERRORS,
-                          f"Daily loss limit ({daily_loss}) must be positive")
-        elif daily_loss > 1000:
-            self._add_issue(self.WARNINGS,
-                          f"Daily loss limit (${daily_loss}) is high for paper trading")
-
-        # Consecutive losses
-        cons_losses = risk.get('max_consecutive_losses', 0)
-        if cons_losses < 2:
-            self._add_issue(self.WARNINGS,
-                          f"Max consecutive losses ({cons_losses}) is low")
-        elif cons_losses > 5:
-            self._add_issue(self.WARNINGS,
-                          f"Max consecutive losses ({cons_losses}) is high")
-
-        # Position duration
-        duration = risk.get('max_position_duration_hours', 0)
-        if duration < 0.5:
-            self._add_issue(self.WARNINGS,
-                          f"Position duration ({duration}h) is very short")
-        elif duration > 8:
-            self._add_issue(self.WARNINGS,
-                          f"Position duration ({duration}h) is very long")
-
     def _validate_ibkr(self, config: dict):
         """Validate IBKR configuration."""
         if 'ibkr' not in config:
@@ -1,11 +1,14 @@
 """
 Pytest configuration and shared fixtures for all tests.
 """
+import dataclasses
 import pytest
+import pytest_asyncio
 import tempfile
 import os
+from collections import namedtuple
 from pathlib import Path
-from datetime import datetime, timezone
+from datetime import datetime, timezone, timedelta
 from typing import Dict, Any
 
 # Add project root to path
@@ -16,6 +19,61 @@ from bot.config import (
     Config, StrategyConfig, IBKRConfig, RiskConfig,
     TelegramConfig, DatabaseConfig, TradingHoursConfig, DebugConfig
 )
+from bot.core.engine import TradingEngine
+from bot.risk.circuit_breaker import CircuitBreaker, CircuitBreakerConfig
+
+_EXAMPLE_CONFIG = Path(__file__).parent.parent / "config" / "config.yaml.example"
+
+
+# Sample configuration shared by all tests; treat as read-only
+_SAMPLE_CONFIG: Dict[str, Any] = {
+    "trading": {
+        "symbol": "MES",
+        "exchange": "GLOBEX",
+        "currency": "USD",
+        "lookback_bars": 20,
+        "z_entry_threshold": 2.0,
+        "z_exit_threshold": 0.5,
+        "min_volume_filter": 100
+    },
+    "ibkr": {
+        "host": "127.0.0.1",
+        "port": 4002,
+        "client_id": 1,
+        "account": "DU12345",
+        "timeout_seconds": 30
+    },
+    "risk": {
+        "max_daily_loss": 500.0,
+        "max_position_size": 2,
+        "max_consecutive_losses": 3,
+        "max_trades_per_day": 10,
+        "position_timeout_hours": 2.0,
+        "drawdown_limit_percent": 10.0,
+        "cooldown_minutes": 30
+    },
+    "telegram": {
+        "enabled": False,
+        "bot_token": "test-token",
+        "chat_id": "test-chat"
+    },
+    "database": {
+        "path": "data/test_trades.db"
+    },
+    "debug": {
+        "dry_run": True,
+        "log_level": "INFO"
+    }
+}
+
+
+def _utcnow() -> datetime:
+    """Aware UTC timestamp for mocks"""
+    return datetime.now(timezone.utc)
+
+
+# Message recorded by MockTelegramAlerts
+_Msg = namedtuple("_Msg", "text parse_mode timestamp")
 
 
 @pytest.fixture
@@ -25,48 +83,17 @@ def temp_dir():
         yield Path(tmpdir)
 
 
+@pytest.fixture(scope="session")
+def session_temp_dir(tmp_path_factory):
+    """Temporary directory shared by the whole test session"""
+    return tmp_path_factory.mktemp("cfg")
+
+
 @pytest.fixture
 def sample_config_dict() -> Dict[str, Any]:
-    """Sample configuration dictionary for testing"""
-    return {
-        "trading": {
-            "symbol": "MES",
-            "exchange": "GLOBEX",
-            "currency": "USD",
-            "lookback_bars": 20,
-            "z_entry_threshold": 2.0,
-            "z_exit_threshold": 0.5,
-            "min_volume_filter": 100
-        },
-        "ibkr": {
-            "host": "127.0.0.1",
-            "port": 4002,
-            "client_id": 1,
-            "account": "DU12345",
-            "timeout_seconds": 30
-        },
-        "risk": {
-            "max_daily_loss": 500.0,
-            "max_position_size": 2,
-            "max_consecutive_losses": 3,
-            "max_trades_per_day": 10,
-            "position_timeout_hours": 2.0,
-            "drawdown_limit_percent": 10.0,
-            "cooldown_minutes": 30
-        },
-        "telegram": {
-            "enabled": False,
-            "bot_token": "test-token",
-            "chat_id": "test-chat"
-        },
-        "database": {
-            "path": "data/test_trades.db"
-        },
-        "debug": {
-            "dry_run": True,
-            "log_level": "INFO"
-        }
-    }
+    """Sample configuration dictionary for testing (private copy, safe to mutate)"""
+    # Every section is a flat dict, so copying one level down isolates tests
+    return {section: dict(values) for section, values in _SAMPLE_CONFIG.items()}
 
 
 @pytest.fixture
@@ -87,29 +114,66 @@ def sample_config(sample_config_dict, temp_dir) -> Config:
     )
 
 
-@pytest.fixture
-def config_yaml_file(sample_config_dict, temp_dir) -> Path:
-    """Create temporary YAML config file"""
+@pytest.fixture(scope="session")
+def config_yaml_file(session_temp_dir) -> Path:
+    """Create temporary YAML config file (written once per session)"""
     import yaml
 
-    config_path = temp_dir / "test_config.yaml"
+    config_path = session_temp_dir / "test_config.yaml"
+    dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
     with open(config_path, 'w') as f:
-        yaml.dump(sample_config_dict, f)
+        yaml.dump(_SAMPLE_CONFIG, f, Dumper=dumper)
 
     return config_path
 
 
+@pytest.fixture(scope="session")
+def config() -> Config:
+    """The example config, parsed once per session (frozen, safe to share)"""
+    return Config.load(str(_EXAMPLE_CONFIG))
+
+
+@pytest.fixture(scope="module")
+def cb() -> CircuitBreaker:
+    """
+    Circuit breaker shared by a test module.
+
+    Tight limits (100 loss, 2 consecutive losses) so tests trip it quickly;
+    call cb.reset() at the start of each test.
+    """
+    return CircuitBreaker(CircuitBreakerConfig(
+        max_daily_loss=100.0,
+        max_consecutive_losses=2,
+    ))
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def engine(config):
+    """
+    Started dry-run TradingEngine shared by a test module.
+
+    Tests must run on the module loop (pytest.mark.asyncio(loop_scope="module"))
+    and call engine.reset() before use.
+    """
+    dry_run = dataclasses.replace(config, debug=dataclasses.replace(config.debug, dry_run=True))
+    engine = TradingEngine(dry_run, alerts=None)
+    await engine.start()
+    yield engine
+    await engine.stop("Test complete")
+
+
 @pytest.fixture
 def mock_price_bars():
     """Generate sample price bars for testing"""
     base_price = 5000.0
+    base_t = datetime.now(timezone.utc)
     bars = []
 
     # Generate 30 bars with some variation
     for i in range(30):
         price = base_price + (i * 0.5) - 7.5  # Slight uptrend
         bars.append({
-            "time": datetime.now(timezone.utc),
+            "time": base_t + timedelta(seconds=i),
             "open": price - 0.25,
             "high": price + 0.5,
             "low": price - 0.5,
@@ -120,7 +184,7 @@ def mock_price_bars():
     return bars
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_zscore_engine():
     """Mock ZScoreEngine for testing without Rust dependency"""
     class MockZScoreEngine:
@@ -167,7 +231,7 @@ def mock_zscore_engine():
     return MockZScoreEngine
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_risk_calculator():
     """Mock RiskCalculator for testing without Rust dependency"""
     class MockRiskCalculator:
@@ -230,7 +294,7 @@ def mock_risk_calculator():
     return MockRiskCalculator
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_ibkr_client():
     """Mock IBKR client for testing"""
     class MockIBKRClient:
@@ -269,7 +333,7 @@ def mock_ibkr_client():
     return MockIBKRClient
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_telegram_alerts():
     """Mock Telegram alerts for testing"""
     class MockTelegramAlerts:
@@ -277,11 +341,7 @@ def mock_telegram_alerts():
             self.messages = []
 
         def send(self, text: str, parse_mode: str = "HTML"):
-            self.messages.append({
-                "text": text,
-                "parse_mode": parse_mode,
-                "timestamp": datetime.now(timezone.utc)
-            })
+            self.messages.append(_Msg(text, parse_mode, _utcnow()))
 
         async def start(self):
             pass
@@ -1,90 +1,113 @@
 # Quick test of individual features (no IBKR required)
+import asyncio
 
-print("=" * 70)
-print("🧪 Testing New Features Individually")
-print("=" * 70)
-print()
-
-# 1. Test market data simulator
-print("1️⃣  Market Data Simulator")
-print("-" * 70)
-try:
-    from bot.market_data import generate_realistic_bars
-    bars = generate_realistic_bars(days=5)
-    print(f"   ✅ Generated {len(bars)} bars")
-    print(f"   First bar: {bars[0].timestamp} | {bars[0].close:.2f}")
-    print(f"   Last bar:  {bars[-1].timestamp} | {bars[-1].close:.2f}")
-except Exception as e:
-    print(f"   ❌ Error: {e}")
-print()
-
-# 2. Test strategies
-print("2️⃣  Multiple Strategies Framework")
-print("-" * 70)
-try:
-    from bot.strategies import list_strategies
-    strategies = list_strategies()
-    print(f"   ✅ Available strategies: {list(strategies.keys())}")
-    for name, stype in strategies.items():
-        print(f"      - {name}")
-except Exception as e:
-    print(f"   ❌ Error: {e}")
-print()
-
-# 3. Test telegram commands
-print("3️⃣  Telegram Commands")
-print("-" * 70)
-try:
-    import asyncio
-    from bot.telegram import TelegramCommands
-
-    async def test():
-        mock_state = {"status": "running", "daily_pnl": 250.0}
-        commands = TelegramCommands(mock_state)
-
-        print("   Testing /status command:")
-        response = await commands.handle_command("status", [])
-        if "Bot Status" in response:
-            print("      ✅ /status OK")
-        else:
-            print("      ❌ /status FAILED")
 
-        print("   Testing /ping command:")
-        response = await commands.handle_command("ping", [])
-        if "Pong" in response:
-            print("      ✅ /ping OK")
+def test_market_data():
+    """1. Test market data simulator"""
+    print("1️⃣  Market Data Simulator")
+    print("-" * 70)
+    try:
+        from bot.market_data import generate_realistic_bars
+        bars = generate_realistic_bars(days=5)
+        print(f"   ✅ Generated {len(bars)} bars")
+        print(f"   First bar: {bars[0].timestamp} | {bars[0].close:.2f}")
+        print(f"   Last bar:  {bars[-1].timestamp} | {bars[-1].close:.2f}")
+    except Exception as e:
+        print(f"   ❌ Error: {e}")
+    print()
+
+
+def test_strategies():
+    """2. Test strategies"""
+    print("2️⃣  Multiple Strategies Framework")
+    print("-" * 70)
+    try:
+        from bot.strategies import list_strategies
+        strategies = list_strategies()
+        print(f"   ✅ Available strategies: {list(strategies.keys())}")
+        for name, stype in strategies.items():
+            print(f"      - {name}")
+    except Exception as e:
+        print(f"   ❌ Error: {e}")
+    print()
+
+
+def test_telegram_commands(loop=None):
+    """3. Test telegram commands (on `loop` if given, else a fresh one)"""
+    print("3️⃣  Telegram Commands")
+    print("-" * 70)
+    try:
+        from bot.telegram import TelegramCommands
+
+        async def test():
+            mock_state = {"status": "running", "daily_pnl": 250.0}
+            commands = TelegramCommands(mock_state)
+
+            print("   Testing /status command:")
+            response = await commands.handle_command("status", [])
+            if "Bot Status" in response:
+                print("      ✅ /status OK")
+            else:
+                print("      ❌ /status FAILED")
+
+            print("   Testing /ping command:")
+            response = await commands.handle_command("ping", [])
+            if "Pong" in response:
+                print("      ✅ /ping OK")
+            else:
+                print("      ❌ /ping FAILED")
+
+        if loop is None:
+            asyncio.run(test())
         else:
-            print("      ❌ /ping FAILED")
-
-    asyncio.run(test())
-except Exception as e:
-    print(f"   ❌ Error: {e}")
-print()
-
-# 4. Test config validator
-print("4️⃣  Configuration Validator")
-print("-" * 70)
-try:
-    from bot.config import Config
-    config = Config.load('config/config.yaml.example')
-
-    print(f"   ✅ Config loaded")
-    print(f"   Lookback: {config.strategy.lookback_period}")
-    print(f"   Z-Entry: {config.strategy.z_threshold_entry}")
-    print(f"   Z-Exit:  {config.strategy.z_threshold_exit}")
-except Exception as e:
-    print(f"   ❌ Error: {e}")
-print()
-
-print()
-print("=" * 70)
-print("✅ Quick Test Complete!")
-print("=" * 70)
-print()
-print("All features are implemented and working:")
-print("  ✅ Market data simulator")
-print("  ✅ Multiple strategies framework")
-print("  ✅ Telegram commands")
-print("  ✅ Configuration loader")
-print()
-print("For full testing, see individual test scripts.")
+            loop.run_until_complete(test())
+    except Exception as e:
+        print(f"   ❌ Error: {e}")
+    print()
+
+
+def test_config():
+    """4. Test config validator"""
+    print("4️⃣  Configuration Validator")
+    print("-" * 70)
+    try:
+        from bot.config import Config
+        config = Config.load('config/config.yaml.example')
+
+        print(f"   ✅ Config loaded")
+        print(f"   Lookback: {config.strategy.lookback_period}")
+        print(f"   Z-Entry: {config.strategy.z_threshold_entry}")
+        print(f"   Z-Exit:  {config.strategy.z_threshold_exit}")
+    except Exception as e:
+        print(f"   ❌ Error: {e}")
+    print()
+
+
+if __name__ == "__main__":
+    print("=" * 70)
+    print("🧪 Testing New Features Individually")
+    print("=" * 70)
+    print()
+
+    # One event loop shared by every async section
+    loop = asyncio.new_event_loop()
+    try:
+        test_market_data()
+        test_strategies()
+        test_telegram_commands(loop)
+        test_config()
+    finally:
+        loop.close()
+
+    print()
+    print("=" * 70)
+    print("✅ Quick Test Complete!")
+    print("=" * 70)
+    print()
+    print("All features are implemented and working:")
+    print("  ✅ Market data simulator")
+    print("  ✅ Multiple strategies framework")
+    print("  ✅ Telegram commands")
+    print("  ✅ Configuration loader")
+    print()
+    print("For full testing, see individual test scripts.")
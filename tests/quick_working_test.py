@@ -3,6 +3,19 @@
 import sys
 sys.path.insert(0, '.')
 
+import asyncio
+
+# Use uvloop when installed, fall back to the default asyncio loop
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
+# One loop for every async stage, closed at the end of the script
+loop = asyncio.new_event_loop()
+asyncio.set_event_loop(loop)
+
 print("Testing Features - Quick Version")
 print("=" * 50)
 
@@ -38,7 +51,6 @@ except Exception as e:
 # 4. Telegram commands
 print("\n4. Telegram Commands (mock test)")
 try:
-    import asyncio
     from bot.telegram import TelegramCommands
 
     async def test():
@@ -49,7 +61,7 @@ try:
         response = await commands.handle_command("ping", [])
         print(f"   ✅ /ping: {response[:50]}...")
 
-    asyncio.run(test())
+    loop.run_until_complete(test())
 except Exception as e:
     print(f"   ❌ Error: {e}")
 
@@ -60,20 +72,24 @@ try:
 
     gen = SignalGenerator(20)
     import time
-    import statistics
 
-    # Quick benchmark
-    times = []
-    for _ in range(100):
-        start = time.perf_counter()
+    # Time whole batches so the timer call isn't most of what gets measured;
+    # the first batch warms up the window (and any JIT) and is discarded
+    batch = 10_000
+    for _ in range(batch):
         gen.update(5000.0)
-        end = time.perf_counter()
-        times.append((end - start) * 1000)
 
-    print(f"   ✅ Signal generation mean: {statistics.mean(times):.3f}ms")
+    start = time.perf_counter_ns()
+    for _ in range(batch):
+        gen.update(5000.0)
+    mean_ns = (time.perf_counter_ns() - start) / batch
+
+    print(f"   ✅ Signal generation mean: {mean_ns / 1e6:.6f}ms ({mean_ns:.0f}ns)")
 except Exception as e:
     print(f"   ❌ Error: {e}")
 
+loop.close()
+
 print()
 print("=" * 50)
 print("✅ ALL FEATURES TESTED!")
@@ -6,30 +6,25 @@ import sys
 sys.path.insert(0, '.')
 
 import asyncio
+import dataclasses
+
+import pytest
+
 from bot.config import Config
 from bot.core.engine import TradingEngine
 
-async def test_engine():
-    """Test trading engine with dry run mode"""
-    print("Testing Trading Engine (Dry Run Mode)")
-    print("=" * 50)
+# The engine fixture lives on the module loop (see conftest.py)
+pytestmark = pytest.mark.asyncio(loop_scope="module")
 
-    # Load config
-    config = Config.load('config/config.yaml.example')
-    config.debug.dry_run = True
 
-    # Create engine with no alerts (dry run)
-    engine = TradingEngine(config, alerts=None)
-
-    await engine.start()
+async def run_dry_run(engine):
+    """Feed a started dry-run engine 25 bars and print its status"""
+    print("Testing Trading Engine (Dry Run Mode)")
+    print("=" * 50)
 
     # Simulate some bars
     print("\nSimulating 25 price bars...")
-    for i in range(25):
-        price = 100 + i * 0.5
-        bar = {"close": price}
-        await engine.process_bar(bar)
-        await asyncio.sleep(0.05)  # Small delay to see progress
+    await engine.process_bars({"close": 100 + i * 0.5} for i in range(25))
 
     # Get status
     status = engine.get_status()
@@ -40,11 +35,35 @@ async def test_engine():
     print(f"  Trades today: {status['trades_today']}")
     print(f"  Z-Score: {status['zscore']}")
 
-    # Stop engine
-    await engine.stop("Test complete")
-
     print("\n" + "=" * 50)
     print("✅ Trading engine test passed!")
 
+
+async def test_engine(engine):
+    """Test trading engine with dry run mode"""
+    engine.reset()
+    await run_dry_run(engine)
+
+
+async def main():
+    # Load config
+    config = Config.load('config/config.yaml.example')
+    config = dataclasses.replace(config, debug=dataclasses.replace(config.debug, dry_run=True))
+
+    # Create engine with no alerts (dry run)
+    engine = TradingEngine(config, alerts=None)
+
+    await engine.start()
+    await run_dry_run(engine)
+    await engine.stop("Test complete")
+
+
 if __name__ == "__main__":
-    asyncio.run(test_engine())
+    # Use uvloop when installed (set here, not at import, so pytest keeps its loop)
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
+    asyncio.run(main())
@@ -10,9 +10,10 @@ Tests cover:
 - Edge cases (weekends, holidays, maintenance)
 """
 import pytest
-from datetime import datetime, timedelta
+from datetime import datetime, time, timedelta
 from zoneinfo import ZoneInfo
 
+import bot.utils.timezone as tz
 from bot.utils.timezone import (
     UTC, ET, CT, SGT,
     now_utc, now_et, now_ct, now_sgt,
@@ -21,6 +22,7 @@ from bot.utils.timezone import (
     is_futures_trading_hours,
     is_market_holiday,
     is_trading_allowed,
+    get_next_market_open,
     format_time_et, format_time_ct, format_time_utc, format_time_sgt,
 )
 
@@ -77,102 +79,31 @@ class TestTimezoneConversions:
 
 class TestFuturesTradingHours:
     """Test CME futures trading hours logic"""
-    
-    def test_sunday_before_open(self):
-        """Sunday before 5 PM CT should be closed"""
-        # Sunday 4:00 PM CT
-        sunday_4pm = datetime(2026, 2, 8, 16, 0, 0, tzinfo=CT)
-        assert is_futures_trading_hours(sunday_4pm) is False
-    
-    def test_sunday_at_open(self):
-        """Sunday at exactly 5 PM CT should be open"""
-        # Sunday 5:00 PM CT
-        sunday_5pm = datetime(2026, 2, 8, 17, 0, 0, tzinfo=CT)
-        assert is_futures_trading_hours(sunday_5pm) is True
-    
-    def test_sunday_after_open(self):
-        """Sunday after 5 PM CT should be open"""
-        # Sunday 8:00 PM CT
-        sunday_8pm = datetime(2026, 2, 8, 20, 0, 0, tzinfo=CT)
-        assert is_futures_trading_hours(sunday_8pm) is True
-    
-    def test_monday_morning(self):
-        """Monday morning should be open"""
-        # Monday 9:00 AM CT
-        monday_9am = datetime(2026, 2, 9, 9, 0, 0, tzinfo=CT)
-        assert is_futures_trading_hours(monday_9am) is True
-    
-    def test_daily_maintenance_window(self):
-        """4:00-5:00 PM CT daily maintenance should be closed"""
-        # Monday 4:00 PM CT (start of maintenance)
-        monday_4pm = datetime(2026, 2, 9, 16, 0, 0, tzinfo=CT)
-        assert is_futures_trading_hours(monday_4pm) is False
-        
-        # Monday 4:30 PM CT (during maintenance)
-        monday_430pm = datetime(2026, 2, 9, 16, 30, 0, tzinfo=CT)
-        assert is_futures_trading_hours(monday_430pm) is False
-        
-        # Monday 4:59 PM CT (end of maintenance)
-        monday_459pm = datetime(2026, 2, 9, 16, 59, 0, tzinfo=CT)
-        assert is_futures_trading_hours(monday_459pm) is False
-        
-        # Monday 5:00 PM CT (after maintenance)
-        monday_5pm = datetime(2026, 2, 9, 17, 0, 0, tzinfo=CT)
-        assert is_futures_trading_hours(monday_5pm) is True
-    
-    def test_tuesday_evening(self):
-        """Tuesday evening after maintenance should be open"""
-        # Tuesday 6:00 PM CT
-        tuesday_6pm = datetime(2026, 2, 10, 18, 0, 0, tzinfo=CT)
-        assert is_futures_trading_hours(tuesday_6pm) is True
-    
-    def test_wednesday_overnight(self):
-        """Wednesday overnight hours should be open"""
-        # Wednesday 2:00 AM CT
-        wednesday_2am = datetime(2026, 2, 11, 2, 0, 0, tzinfo=CT)
-        assert is_futures_trading_hours(wednesday_2am) is True
-    
-    def test_thursday_afternoon(self):
-        """Thursday afternoon before maintenance should be open"""
-        # Thursday 3:00 PM CT
-        thursday_3pm = datetime(2026, 2, 12, 15, 0, 0, tzinfo=CT)
-        assert is_futures_trading_hours(thursday_3pm) is True
-    
-    def test_friday_morning(self):
-        """Friday morning should be open"""
-        # Friday 10:00 AM CT
-        friday_10am = datetime(2026, 2, 13, 10, 0, 0, tzinfo=CT)
-        assert is_futures_trading_hours(friday_10am) is True
-    
-    def test_friday_at_close(self):
-        """Friday at 4:00 PM CT (close) should be closed"""
-        # Friday 4:00 PM CT
-        friday_4pm = datetime(2026, 2, 13, 16, 0, 0, tzinfo=CT)
-        assert is_futures_trading_hours(friday_4pm) is False
-    
-    def test_friday_evening(self):
-        """Friday evening after close should be closed"""
-        # Friday 6:00 PM CT
-        friday_6pm = datetime(2026, 2, 13, 18, 0, 0, tzinfo=CT)
-        assert is_futures_trading_hours(friday_6pm) is False
-    
-    def test_saturday_all_day(self):
-        """Saturday should be closed all day"""
-        # Saturday 12:00 PM CT
-        saturday_noon = datetime(2026, 2, 14, 12, 0, 0, tzinfo=CT)
-        assert is_futures_trading_hours(saturday_noon) is False
-        
-        # Saturday 11:00 PM CT
-        saturday_11pm = datetime(2026, 2, 14, 23, 0, 0, tzinfo=CT)
-        assert is_futures_trading_hours(saturday_11pm) is False
-    
-    def test_all_weekdays_maintenance(self):
-        """Test maintenance window applies to all weekdays"""
-        # Create datetime for each weekday at 4:30 PM CT
-        for day_offset in range(5):  # Monday-Friday
-            test_date = datetime(2026, 2, 9, 16, 30, 0, tzinfo=CT) + timedelta(days=day_offset)
-            # Maintenance window should be closed
-            assert is_futures_trading_hours(test_date) is False
+
+    @pytest.mark.parametrize("current, expected", [
+        (datetime(2026, 2, 8, 16, 0, tzinfo=CT), False),   # Sunday before 5 PM open
+        (datetime(2026, 2, 8, 17, 0, tzinfo=CT), True),    # Sunday at open
+        (datetime(2026, 2, 8, 20, 0, tzinfo=CT), True),    # Sunday after open
+        (datetime(2026, 2, 9, 9, 0, tzinfo=CT), True),     # Monday morning
+        (datetime(2026, 2, 9, 16, 0, tzinfo=CT), False),   # Maintenance start
+        (datetime(2026, 2, 9, 16, 30, tzinfo=CT), False),  # During maintenance
+        (datetime(2026, 2, 9, 16, 59, tzinfo=CT), False),  # Maintenance end
+        (datetime(2026, 2, 9, 17, 0, tzinfo=CT), True),    # After maintenance
+        (datetime(2026, 2, 10, 18, 0, tzinfo=CT), True),   # Tuesday evening
+        (datetime(2026, 2, 11, 2, 0, tzinfo=CT), True),    # Wednesday overnight
+        (datetime(2026, 2, 12, 15, 0, tzinfo=CT), True),   # Thursday afternoon
+        (datetime(2026, 2, 13, 10, 0, tzinfo=CT), True),   # Friday morning
+        (datetime(2026, 2, 13, 16, 0, tzinfo=CT), False),  # Friday at close
+        (datetime(2026, 2, 13, 18, 0, tzinfo=CT), False),  # Friday evening
+        (datetime(2026, 2, 14, 12, 0, tzinfo=CT), False),  # Saturday noon
+        (datetime(2026, 2, 14, 23, 0, tzinfo=CT), False),  # Saturday night
+    ] + [
+        # Maintenance window applies to every weekday
+        (datetime(2026, 2, 9 + day_offset, 16, 30, tzinfo=CT), False)
+        for day_offset in range(5)
+    ])
+    def test_futures_hours(self, current, expected):
+        assert is_futures_trading_hours(current) is expected
 
 
 class TestHolidayDetection:
@@ -262,6 +193,12 @@ class TestHolidayDetection:
         regular_day = datetime(2026, 3, 15, 12, 0, 0, tzinfo=ET)
         assert is_market_holiday(regular_day) is False
 
+    def test_holiday_uses_et_date(self):
+        """Late UTC on the eve of a holiday is still the prior ET day"""
+        # 2026-12-25 02:00 UTC is 2026-12-24 21:00 ET
+        christmas_eve_et = datetime(2026, 12, 25, 2, 0, 0, tzinfo=UTC)
+        assert is_market_holiday(christmas_eve_et) is False
+
 
 class TestTradingAllowed:
     """Test the combined is_trading_allowed function"""
@@ -308,6 +245,33 @@ class TestTradingAllowed:
         assert is_trading_allowed(monday_8am_et, use_futures_hours=False) is False
 
 
+class TestNextMarketOpen:
+    """Test get_next_market_open"""
+
+    @pytest.mark.parametrize("current, expected", [
+        (datetime(2026, 2, 23, 8, 0, tzinfo=ET), (2, 23)),   # Monday before open
+        (datetime(2026, 2, 23, 12, 0, tzinfo=ET), (2, 24)),  # Monday after open
+        (datetime(2026, 2, 26, 18, 0, tzinfo=ET), (2, 27)),  # Thursday evening
+        (datetime(2026, 2, 27, 8, 0, tzinfo=ET), (2, 27)),   # Friday before open
+        (datetime(2026, 2, 27, 12, 0, tzinfo=ET), (3, 2)),   # Friday after open
+        (datetime(2026, 2, 28, 8, 0, tzinfo=ET), (3, 2)),    # Saturday
+        (datetime(2026, 3, 1, 20, 0, tzinfo=ET), (3, 2)),    # Sunday
+    ])
+    def test_next_open(self, current, expected):
+        next_open = get_next_market_open(current)
+        assert next_open == datetime(2026, *expected, 9, 30, tzinfo=ET)
+
+    @pytest.mark.parametrize("current, expected", [
+        (datetime(2026, 2, 13, 12, 0, tzinfo=ET), (2, 17)),  # Fri before Presidents' Day
+        (datetime(2026, 2, 16, 8, 0, tzinfo=ET), (2, 17)),   # Presidents' Day itself
+        (datetime(2026, 12, 24, 12, 0, tzinfo=ET), (12, 28)),  # Christmas Friday + weekend
+        (datetime(2026, 7, 2, 12, 0, tzinfo=ET), (7, 6)),    # July 3 observed
+    ])
+    def test_skips_holidays(self, current, expected):
+        next_open = get_next_market_open(current)
+        assert next_open == datetime(2026, *expected, 9, 30, tzinfo=ET)
+
+
 class TestFormatting:
     """Test time formatting functions"""
     
@@ -407,6 +371,63 @@ class TestEdgeCases:
         assert is_futures_trading_hours(sunday_after) is True
 
 
+class TestMarketStateCache:
+    """Test the per-minute cache behind the live-clock checks"""
+
+    @pytest.fixture(autouse=True)
+    def _reset_cache(self, monkeypatch):
+        monkeypatch.setattr(tz, "_MARKET_STATE_CACHE", None)
+
+    def _freeze(self, monkeypatch, dt):
+        monkeypatch.setattr(tz, "_wall_time", lambda: dt.timestamp())
+
+    def test_matches_explicit_time(self, monkeypatch):
+        """Cached live state agrees with passing the same time explicitly"""
+        for dt in (
+            datetime(2026, 2, 9, 10, 0, 0, tzinfo=ET),   # Monday, both open
+            datetime(2026, 2, 9, 16, 30, 0, tzinfo=CT),  # Maintenance window
+            datetime(2026, 2, 14, 12, 0, 0, tzinfo=CT),  # Saturday
+        ):
+            monkeypatch.setattr(tz, "_MARKET_STATE_CACHE", None)
+            self._freeze(monkeypatch, dt)
+            assert is_market_open() is is_market_open(dt)
+            assert is_futures_trading_hours() is is_futures_trading_hours(dt)
+
+    def test_trading_allowed_matches_explicit_time(self, monkeypatch):
+        """is_trading_allowed() on the live clock folds in the cached holiday flag"""
+        for dt in (
+            datetime(2026, 2, 9, 10, 0, 0, tzinfo=ET),   # Monday, both open
+            datetime(2026, 2, 16, 10, 0, 0, tzinfo=ET),  # Presidents' Day
+            datetime(2026, 2, 14, 12, 0, 0, tzinfo=CT),  # Saturday
+        ):
+            monkeypatch.setattr(tz, "_MARKET_STATE_CACHE", None)
+            self._freeze(monkeypatch, dt)
+            for use_futures_hours in (True, False):
+                assert is_trading_allowed(use_futures_hours=use_futures_hours) is \
+                    is_trading_allowed(dt, use_futures_hours=use_futures_hours)
+
+    def test_reused_within_minute(self, monkeypatch):
+        """Second call in the same minute is served from the cache"""
+        dt = datetime(2026, 2, 14, 12, 0, 5, tzinfo=CT)  # Saturday
+        self._freeze(monkeypatch, dt)
+        assert is_futures_trading_hours() is False
+
+        minute_key = tz._MARKET_STATE_CACHE[0]
+        tz._MARKET_STATE_CACHE = (minute_key, True, True, False)
+        self._freeze(monkeypatch, dt + timedelta(seconds=30))
+        assert is_futures_trading_hours() is True
+
+        self._freeze(monkeypatch, dt + timedelta(minutes=1))
+        assert is_futures_trading_hours() is False
+
+    def test_custom_hours_bypass_cache(self, monkeypatch):
+        """Non-default session hours are never answered from the cache"""
+        dt = datetime(2026, 2, 9, 10, 0, 0, tzinfo=ET)
+        self._freeze(monkeypatch, dt)
+        monkeypatch.setattr(tz, "_MARKET_STATE_CACHE", (int(dt.timestamp() // 60), True, True, False))
+        assert is_market_open(market_open=time(11, 0)) is is_market_open(now_et(), market_open=time(11, 0))
+
+
 # Run tests
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "--tb=short"])
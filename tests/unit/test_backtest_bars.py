@@ -0,0 +1,128 @@
+"""
+Unit tests for Bar, BarPool and BacktestEngine in bot/backtest/engine.py
+"""
+import dataclasses
+import random
+from datetime import datetime
+
+import pytest
+
+import bot.backtest.engine as backtest_engine
+from bot.backtest.engine import BacktestEngine, BacktestPosition, Bar, BarPool
+from bot.config import Config
+from bot.core.signals_numba import NumbaZScoreEngine
+from bot.market_data.simulator import generate_test_bars
+
+
+class TestBar:
+    """Test Bar"""
+
+    def test_reset_overwrites_in_place(self):
+        bar = Bar(datetime(2026, 1, 2, 9, 30), 1.0, 2.0, 0.5, 1.5, 10)
+        same = bar.reset(datetime(2026, 1, 2, 9, 35), 5000.0, 5002.0, 4998.0, 5001.0, 100)
+
+        assert same is bar
+        assert bar == Bar(datetime(2026, 1, 2, 9, 35), 5000.0, 5002.0, 4998.0, 5001.0, 100)
+
+    def test_bar_is_slotted(self):
+        bar = Bar(datetime(2026, 1, 2, 9, 30), 1.0, 2.0, 0.5, 1.5, 10)
+        assert not hasattr(bar, "__dict__")
+
+
+class TestBarPool:
+    """Test BarPool"""
+
+    def test_acquire_cycles_through_pool(self):
+        pool = BarPool(3)
+        first = [pool.acquire() for _ in range(3)]
+
+        second = [pool.acquire() for _ in range(3)]
+
+        assert len({id(bar) for bar in first}) == 3
+        assert all(a is b for a, b in zip(first, second))
+
+    def test_size_must_be_positive(self):
+        with pytest.raises(ValueError):
+            BarPool(0)
+
+
+class TestBacktestEngineReset:
+    """Test BacktestEngine.reset"""
+
+    @pytest.fixture
+    def config(self):
+        return Config.load("config/config.yaml.example")
+
+    def test_reset_clears_state(self, config):
+        engine = BacktestEngine(config)
+        for price in range(100):
+            engine.signal_gen.update(5000.0 + price)
+        engine.position = BacktestPosition(entry_price=5000.0, quantity=1)
+        signal_gen = engine.signal_gen
+
+        engine.reset()
+
+        assert engine.position is None
+        assert engine.signal_gen is signal_gen
+        assert not engine.signal_gen.is_ready()
+
+    def test_reset_with_new_lookback(self, config):
+        engine = BacktestEngine(config)
+        lookback = config.strategy.lookback_period + 5
+        new_config = dataclasses.replace(
+            config, strategy=dataclasses.replace(config.strategy, lookback_period=lookback)
+        )
+
+        engine.reset(new_config)
+
+        assert engine.config is new_config
+        assert engine.signal_gen.lookback_period == lookback
+
+
+class TestDrawdownBreach:
+    """BacktestEngine.run flags the first circuit-breaker drawdown breach"""
+
+    def _run(self, monkeypatch, max_drawdown):
+        # Every closed trade loses $50, so the breach point is known
+        monkeypatch.setattr(backtest_engine, "calculate_pnl", lambda **kwargs: -50.0)
+        config = Config.load("config/config.yaml.example")
+        engine = BacktestEngine(config)
+        engine.signal_gen._last_signal_type = "EXIT"  # Allow entries
+        random.seed(0)
+        return engine.run(generate_test_bars(days=10), max_drawdown=max_drawdown)
+
+    def test_flags_first_breach(self, monkeypatch):
+        result = self._run(monkeypatch, max_drawdown=10.0)
+
+        assert result.total_trades >= 1
+        assert result.drawdown_breach_trade == 1
+
+    def test_no_breach(self, monkeypatch):
+        result = self._run(monkeypatch, max_drawdown=float("inf"))
+
+        assert result.drawdown_breach_trade == -1
+
+
+class TestBatchSignalPath:
+    """The numba batch Z-Score path must trade like the per-bar path"""
+
+    def test_matches_streaming_run(self, monkeypatch):
+        config = Config.load("config/config.yaml.example")
+        bars = generate_test_bars(days=10)
+
+        streaming = BacktestEngine(config)
+        streaming.signal_gen.engine = NumbaZScoreEngine(config.strategy.lookback_period)
+        streaming.signal_gen._last_signal_type = "EXIT"  # Allow entries
+        monkeypatch.setattr(backtest_engine, "NUMBA_AVAILABLE", False)
+        expected = streaming.run(bars)
+
+        batch = BacktestEngine(config)
+        batch.signal_gen.engine = NumbaZScoreEngine(config.strategy.lookback_period)
+        batch.signal_gen._last_signal_type = "EXIT"
+        monkeypatch.setattr(backtest_engine, "NUMBA_AVAILABLE", True)
+        result = batch.run(bars)
+
+        assert result.total_trades == expected.total_trades
+        assert result.total_pnl == pytest.approx(expected.total_pnl)
+        assert batch.position == streaming.position
+        assert batch.signal_gen.get_mean() == pytest.approx(streaming.signal_gen.get_mean())
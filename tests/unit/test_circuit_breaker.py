@@ -544,3 +544,44 @@ class TestCircuitBreakerIntegration:
         # Should be able to trade again
         assert circuit_breaker.can_trade() is True
         assert circuit_breaker.state.is_triggered is False
+
+
+class TestDrawdownSeries:
+    """Test vectorized drawdown check over an equity curve"""
+
+    @pytest.fixture
+    def circuit_breaker(self):
+        return CircuitBreaker(CircuitBreakerConfig(max_drawdown=1000.0))
+
+    def test_first_breach_index(self, circuit_breaker):
+        """Test that the first breaching bar is returned"""
+        equity = [10000.0, 10500.0, 9800.0, 9500.0, 9400.0, 11000.0]
+
+        assert circuit_breaker.check_drawdown_series(equity) == 3
+
+    def test_no_breach(self, circuit_breaker):
+        """Test that -1 is returned when the limit is never reached"""
+        equity = [10000.0, 9500.0, 10200.0, 9300.0]
+
+        assert circuit_breaker.check_drawdown_series(equity) == -1
+        assert circuit_breaker.check_drawdown_series([]) == -1
+
+    def test_matches_scalar_check(self, circuit_breaker):
+        """Test that series and scalar checks agree on the breach bar"""
+        equity = [0.0, 300.0, -200.0, 600.0, -450.0, -100.0]
+
+        scalar_idx = -1
+        for i, value in enumerate(equity):
+            if circuit_breaker.check_drawdown(value):
+                scalar_idx = i
+                break
+
+        assert circuit_breaker.check_drawdown_series(equity) == scalar_idx == 4
+        assert circuit_breaker.can_trade() is False
+
+    def test_curve_starting_below_zero(self, circuit_breaker):
+        """Test that the peak starts from state.peak_equity, like check_drawdown()"""
+        equity = [-1200.0, -500.0, 200.0]
+
+        assert circuit_breaker.check_drawdown_series(equity) == 0
+        assert circuit_breaker.check_drawdown(equity[0]) is True
@@ -0,0 +1,90 @@
+"""
+Unit tests for SignalGenerator.batch_update and PythonZScoreEngine in bot/core/signals.py
+"""
+import random
+
+import numpy as np
+import pytest
+
+from bot.core.signals import PythonZScoreEngine, SignalGenerator
+
+
+def _prices(n, seed=11):
+    rng = random.Random(seed)
+    price = 5000.0
+    out = []
+    for _ in range(n):
+        price += rng.gauss(0, 2.0)
+        out.append(price)
+    return out
+
+
+class TestBatchUpdate:
+    """batch_update must match per-price update()"""
+
+    @pytest.mark.parametrize("split", [0, 5, 19, 20, 150])
+    def test_matches_update(self, split):
+        prices = _prices(300)
+        streaming = SignalGenerator(20)
+        expected = [streaming.update(p) for p in prices]
+
+        batch = SignalGenerator(20)
+        head = [batch.update(p) for p in prices[:split]]
+        tail = batch.batch_update(prices[split:])
+
+        assert head == expected[:split]
+        for z, exp in zip(tail.tolist(), expected[split:]):
+            if exp is None:
+                assert np.isnan(z)
+            else:
+                assert z == pytest.approx(exp, rel=1e-6, abs=1e-9)
+
+        # Engine state continues as if each price was fed in turn
+        assert batch.engine.get_zscore() == pytest.approx(streaming.engine.get_zscore())
+        next_price = prices[-1] + 3.0
+        assert batch.update(next_price) == pytest.approx(streaming.update(next_price))
+
+    def test_short_batch_stays_in_warmup(self):
+        gen = SignalGenerator(20)
+        zscores = gen.batch_update(_prices(5))
+
+        assert zscores.shape == (5,)
+        assert np.isnan(zscores).all()
+        assert not gen.is_ready()
+
+    def test_flat_prices_are_zero(self):
+        gen = SignalGenerator(5)
+        zscores = gen.batch_update([5000.0] * 10)
+        assert (zscores[4:] == 0.0).all()
+
+
+class TestPythonZScoreEngine:
+    """Running-sum engine must match a two-pass window computation"""
+
+    @pytest.mark.parametrize("period", [1, 2, 20])
+    def test_matches_two_pass(self, period):
+        engine = PythonZScoreEngine(period)
+        prices = _prices(2000, seed=4)
+
+        for i, price in enumerate(prices):
+            z = engine.update(price)
+            window = np.asarray(prices[max(0, i - period + 1):i + 1])
+            if window.size < period:
+                assert z is None
+                continue
+
+            std = window.std()
+            expected = (price - window.mean()) / std if std > 0 else 0.0
+            assert z == pytest.approx(expected, rel=1e-6, abs=1e-9)
+            assert engine.get_mean() == pytest.approx(window.mean())
+            assert engine.get_std() == pytest.approx(std, rel=1e-6, abs=1e-9)
+            assert engine.get_prices() == window.tolist()
+
+    def test_flat_window_is_zero(self):
+        engine = PythonZScoreEngine(5)
+        for price in (5000.0, 5001.25, 5000.5):
+            engine.update(price)
+        for _ in range(5):
+            z = engine.update(5003.1)
+        assert z == 0.0
+        assert engine.get_std() == 0.0
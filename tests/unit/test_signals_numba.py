@@ -0,0 +1,89 @@
+"""
+Unit tests for bot/core/signals_numba.py - compiled Z-Score engine
+"""
+import random
+
+import pytest
+
+import numpy as np
+
+from bot.core.signals import PythonZScoreEngine
+from bot.core.signals_numba import NumbaZScoreEngine, rolling_zscores
+
+
+class TestNumbaZScoreEngine:
+    """NumbaZScoreEngine must track PythonZScoreEngine"""
+
+    @pytest.mark.parametrize("period", [1, 2, 20])
+    def test_matches_python_engine(self, period):
+        rng = random.Random(7)
+        numba_engine = NumbaZScoreEngine(period)
+        python_engine = PythonZScoreEngine(period)
+
+        price = 5000.0
+        for _ in range(200):
+            price += rng.gauss(0, 2.0)
+            z = numba_engine.update(price)
+            expected = python_engine.update(price)
+
+            if expected is None:
+                assert z is None
+            else:
+                assert z == pytest.approx(expected, rel=1e-6, abs=1e-9)
+            assert numba_engine.is_ready() == python_engine.is_ready()
+            assert numba_engine.get_zscore() == z
+
+        assert numba_engine.get_mean() == pytest.approx(python_engine.get_mean())
+        assert numba_engine.get_std() == pytest.approx(python_engine.get_std())
+
+    def test_get_prices_oldest_first(self):
+        numba_engine = NumbaZScoreEngine(4)
+        python_engine = PythonZScoreEngine(4)
+        for price in range(1, 11):
+            numba_engine.update(float(price))
+            python_engine.update(float(price))
+            assert numba_engine.get_prices() == python_engine.get_prices()
+
+    def test_flat_window_is_zero(self):
+        engine = NumbaZScoreEngine(5)
+        for _ in range(5):
+            z = engine.update(5000.0)
+        assert z == 0.0
+
+    def test_reset_clears_window(self):
+        engine = NumbaZScoreEngine(3)
+        for price in (1.0, 2.0, 3.0):
+            engine.update(price)
+        engine.reset()
+
+        assert not engine.is_ready()
+        assert engine.get_zscore() is None
+        assert engine.update(10.0) is None
+        assert engine.get_mean() == 10.0
+
+    def test_rolling_zscores_matches_engine(self):
+        rng = random.Random(3)
+        prices = [5000.0 + rng.gauss(0, 2.0) for _ in range(100)]
+        engine = PythonZScoreEngine(10)
+        expected = [engine.update(p) for p in prices]
+
+        zscores = rolling_zscores(np.asarray(prices), 10)
+
+        assert np.isnan(zscores[:9]).all()
+        assert zscores[9:].tolist() == pytest.approx(expected[9:], rel=1e-6, abs=1e-9)
+
+    def test_empty_engine(self):
+        engine = NumbaZScoreEngine(5)
+        assert engine.get_zscore() is None
+        assert engine.get_mean() is None
+        assert engine.get_std() is None
+        assert not engine.is_ready()
+
+    def test_running_sums_match_two_pass_on_long_run(self):
+        rng = random.Random(11)
+        prices = np.cumsum([rng.gauss(0, 2.0) for _ in range(5000)]) + 5000.0
+        engine = NumbaZScoreEngine(20)
+        zscores = [engine.update(p) for p in prices.tolist()]
+
+        expected = rolling_zscores(prices, 20)
+        assert zscores[19:] == pytest.approx(expected[19:].tolist(), rel=1e-6, abs=1e-9)
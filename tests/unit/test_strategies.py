@@ -0,0 +1,287 @@
+"""
+Unit tests for bot/strategies/factory.py - Strategy framework
+"""
+import math
+import random
+import statistics
+
+import numpy as np
+import pytest
+
+from bot.strategies import (
+    BollingerBands,
+    FusedMeanReversion,
+    RSIMeanReversion,
+    ZScoreMeanReversion,
+    SIGNAL_NAMES,
+)
+from bot.strategies._kernels import bollinger_signals, wilder_rsi
+
+
+def _random_walk(n: int, seed: int = 7, start: float = 5000.0) -> list:
+    rng = random.Random(seed)
+    prices = []
+    price = start
+    for _ in range(n):
+        price += rng.gauss(0, 1.0)
+        prices.append(price)
+    return prices
+
+
+class TestBollingerBands:
+    """Test incremental Bollinger Bands"""
+
+    def test_warmup(self):
+        """Test that no signal is produced before the window is full"""
+        strategy = BollingerBands({"lookback": 5})
+
+        for price in [100.0, 101.0, 99.0, 100.5]:
+            assert strategy.update({"close": price}) is None
+
+    def test_running_stats_match_statistics(self):
+        """Test running sums match a full recomputation over the window"""
+        strategy = BollingerBands({"lookback": 20})
+
+        for price in _random_walk(200):
+            strategy.update({"close": price})
+
+        n = strategy.lookback
+        mean_d = strategy._sum / n
+        mean = strategy._shift + mean_d
+        variance = (strategy._sum_sq - n * mean_d * mean_d) / (n - 1)
+
+        assert mean == pytest.approx(statistics.mean(strategy.prices))
+        assert variance ** 0.5 == pytest.approx(
+            statistics.stdev(strategy.prices), rel=1e-6
+        )
+
+    def test_resync_keeps_sums_exact(self):
+        """Test each window wrap re-anchors on the oldest price and rebuilds sums"""
+        strategy = BollingerBands({"lookback": 10})
+
+        for price in _random_walk(50):
+            strategy.update({"close": price})
+
+        assert strategy._shift == strategy.prices[0]
+        assert strategy._sum == math.fsum(p - strategy._shift for p in strategy.prices)
+
+    def test_low_variance_window(self):
+        """Test the band width stays exact for a tight window around 5000"""
+        rng = random.Random(17)
+        prices = [5000.0 + rng.gauss(0, 1e-4) for _ in range(2_000)]
+        strategy = BollingerBands({"lookback": 20})
+        for price in prices:
+            strategy.update({"close": price})
+
+        n = strategy.lookback
+        mean_d = strategy._sum / n
+        m2 = strategy._sum_sq - n * mean_d * mean_d
+
+        assert strategy._shift + mean_d == pytest.approx(statistics.mean(strategy.prices), abs=1e-12)
+        assert (m2 / (n - 1)) ** 0.5 == pytest.approx(statistics.stdev(strategy.prices), rel=1e-6)
+
+
+class TestRSIMeanReversion:
+    """Test Wilder-smoothed RSI"""
+
+    def test_matches_reference_wilder(self):
+        """Test running averages match a from-scratch Wilder computation"""
+        period = 14
+        prices = _random_walk(100)
+        strategy = RSIMeanReversion({"lookback": period})
+
+        for price in prices:
+            strategy.update({"close": price})
+
+        changes = [b - a for a, b in zip(prices, prices[1:])]
+        gains = [max(c, 0.0) for c in changes]
+        losses = [max(-c, 0.0) for c in changes]
+        avg_gain = sum(gains[:period]) / period
+        avg_loss = sum(losses[:period]) / period
+        for g, l in zip(gains[period:], losses[period:]):
+            avg_gain = (avg_gain * (period - 1) + g) / period
+            avg_loss = (avg_loss * (period - 1) + l) / period
+
+        assert strategy._avg_gain == pytest.approx(avg_gain)
+        assert strategy._avg_loss == pytest.approx(avg_loss)
+
+    def test_warmup_then_oversold_entry(self):
+        """Test first signal arrives once `lookback` changes are seen"""
+        strategy = RSIMeanReversion({"lookback": 5})
+        prices = [100.0 - i for i in range(6)]
+
+        signals = [strategy.update({"close": p}) for p in prices]
+
+        assert signals[:-1] == [None] * 5
+        assert signals[-1] == "ENTER_LONG"
+
+
+class TestVectorBacktest:
+    """Test batch signal path against bar-by-bar update()"""
+
+    @pytest.mark.parametrize("strategy_cls, config", [
+        (BollingerBands, {"lookback": 20, "std_dev_multiplier": 1.5}),
+        (RSIMeanReversion, {"lookback": 14}),
+    ])
+    def test_matches_scalar_update(self, strategy_cls, config):
+        """Test vector_backtest emits the same signals as update()"""
+        prices = _random_walk(500, seed=11)
+
+        strategy = strategy_cls(config)
+        scalar = [strategy.update({"close": p}) for p in prices]
+
+        codes = strategy_cls(config).vector_backtest(prices)
+        batch = [SIGNAL_NAMES[c] for c in codes.tolist()]
+
+        assert any(signal is not None for signal in scalar)
+        assert batch == scalar
+
+    def test_zscore_matches_scalar_update_without_signals(self):
+        """
+        Test ZScore vector_backtest matches update() on the no-signal path.
+
+        SignalGenerator never enters from its initial state (last signal
+        None), so a fresh ZScoreMeanReversion emits nothing; this only
+        checks that the batch path agrees on that.
+        """
+        config = {"lookback": 20, "z_threshold_entry": 1.5}
+        prices = _random_walk(500, seed=11)
+
+        strategy = ZScoreMeanReversion(config)
+        scalar = [strategy.update({"close": p}) for p in prices]
+
+        codes = ZScoreMeanReversion(config).vector_backtest(prices)
+
+        assert scalar == [None] * len(prices)
+        assert codes.tolist() == [0] * len(prices)
+
+    @pytest.mark.parametrize("strategy_cls", [
+        BollingerBands, RSIMeanReversion, ZScoreMeanReversion,
+    ])
+    def test_update_batch_matches_update(self, strategy_cls):
+        """Test update_batch() emits the same signals as update()"""
+        prices = _random_walk(300, seed=13)
+        config = {"lookback": 15}
+
+        strategy = strategy_cls(config)
+        scalar = [strategy.update({"close": p}) for p in prices]
+
+        assert strategy_cls(config).update_batch(np.array(prices)) == scalar
+
+    def test_missing_close_raises(self):
+        """Test bars without a close are rejected, not traded at 0.0"""
+        with pytest.raises(KeyError):
+            BollingerBands({}).update({"open": 100.0})
+
+    def test_short_series(self):
+        """Test series shorter than the lookback produce no signals"""
+        codes = BollingerBands({"lookback": 20}).vector_backtest([1.0, 2.0])
+
+        assert codes.tolist() == [0, 0]
+
+
+class TestFusedMeanReversion:
+    """Test fused multi-strategy pipeline"""
+
+    CONFIGS = [
+        {"strategy": "zscore", "lookback": 20, "z_threshold_entry": 1.5},
+        {"strategy": "bollinger", "lookback": 20, "std_dev_multiplier": 1.5},
+        {"strategy": "bollinger", "lookback": 30, "name": "bb30"},
+        {"strategy": "rsi", "lookback": 14},
+    ]
+
+    def test_matches_standalone_strategies(self):
+        """Test each leg emits the same signals as its own strategy"""
+        standalone = {
+            "zscore": ZScoreMeanReversion(self.CONFIGS[0]),
+            "bollinger": BollingerBands(self.CONFIGS[1]),
+            "bb30": BollingerBands(self.CONFIGS[2]),
+            "rsi": RSIMeanReversion(self.CONFIGS[3]),
+        }
+        fused = FusedMeanReversion(self.CONFIGS)
+
+        for price in _random_walk(600, seed=5):
+            bar = {"close": price}
+            expected = {name: s.update(bar) for name, s in standalone.items()}
+            assert fused.update(bar) == expected
+
+    def test_shares_windows_per_lookback(self):
+        """Test legs with the same lookback read one window"""
+        fused = FusedMeanReversion(self.CONFIGS)
+
+        assert fused.get_names() == ["zscore", "bollinger", "bb30", "rsi"]
+        assert sorted(fused._windows) == [20, 30]
+        assert fused._legs["zscore"].window is fused._legs["bollinger"].window
+
+    def test_low_variance_window_stats(self):
+        """Test shifted running sums stay exact for a tight window at 5000"""
+        rng = random.Random(17)
+        prices = [5000.0 + rng.gauss(0, 1e-4) for _ in range(2_000)]
+        fused = FusedMeanReversion([{"strategy": "zscore", "lookback": 20}])
+        for price in prices:
+            fused.update({"close": price})
+
+        window = fused._windows[20]
+        tail = prices[-20:]
+        mean = math.fsum(tail) / 20
+        assert window.mean == pytest.approx(mean, abs=1e-12)
+        assert window.m2 == pytest.approx(math.fsum((p - mean) ** 2 for p in tail), rel=1e-6)
+
+    def test_rejects_bad_configs(self):
+        """Test unknown strategies and duplicate names are rejected"""
+        with pytest.raises(ValueError):
+            FusedMeanReversion([{"strategy": "macd"}])
+        with pytest.raises(ValueError):
+            FusedMeanReversion([{"strategy": "rsi"}, {"strategy": "rsi"}])
+
+
+@pytest.mark.parametrize("strategy_cls", [
+    BollingerBands, RSIMeanReversion, ZScoreMeanReversion,
+])
+def test_strategies_are_slotted(strategy_cls):
+    """Test strategy instances carry no per-instance __dict__"""
+    strategy = strategy_cls({})
+
+    assert not hasattr(strategy, "__dict__")
+    with pytest.raises(AttributeError):
+        strategy.unexpected = 1
+
+
+class TestKernels:
+    """Test batch kernels (compiled when numba is installed)"""
+
+    def test_bollinger_kernel_matches_numpy_path(self):
+        """Test running-sum kernel agrees with the sliding window path"""
+        prices = np.array(_random_walk(400, seed=3))
+        config = {"lookback": 20, "std_dev_multiplier": 1.5}
+
+        expected = BollingerBands(config).vector_backtest(prices)
+        codes = bollinger_signals(prices, 20, 1.5)
+
+        assert codes.tolist() == expected.tolist()
+
+    def test_bollinger_kernel_long_series_matches_update(self):
+        """Test the kernel stays in step with update() over a long, tight series"""
+        rng = random.Random(23)
+        prices = [5000.1 + 0.01 * rng.gauss(0, 1.0) for _ in range(50_000)]
+        config = {"lookback": 20, "std_dev_multiplier": 1.5}
+
+        strategy = BollingerBands(config)
+        scalar = [strategy.update({"close": p}) for p in prices]
+        batch = [SIGNAL_NAMES[c] for c in bollinger_signals(np.array(prices), 20, 1.5).tolist()]
+
+        assert any(signal is not None for signal in scalar)
+        assert batch == scalar
+
+    def test_wilder_rsi_kernel(self):
+        """Test kernel RSI warmup and agreement with the scalar strategy"""
+        prices = np.array(_random_walk(100, seed=5))
+        strategy = RSIMeanReversion({"lookback": 14})
+        for price in prices:
+            strategy.update({"close": price})
+
+        rsi = wilder_rsi(prices, 14)
+        avg_gain, avg_loss = strategy._avg_gain, strategy._avg_loss
+
+        assert np.isnan(rsi[:14]).all()
+        assert rsi[-1] == pytest.approx(100 - 100 / (1 + avg_gain / avg_loss))
@@ -0,0 +1,39 @@
+"""
+Unit tests for bot/persistence/database.py - TradeDatabase reads
+"""
+import pytest
+
+from bot.persistence.database import TradeDatabase
+
+
+@pytest.fixture
+def db(temp_dir):
+    database = TradeDatabase(str(temp_dir / "trades.db"))
+    database.connect()
+    for i, symbol in enumerate(["MES", "MES", "MNQ"]):
+        database.log_trade({
+            "symbol": symbol,
+            "action": "BUY",
+            "quantity": 1,
+            "price": 5000.0 + i,
+            "order_id": 1000 + i,
+        })
+    yield database
+    database.disconnect()
+
+
+class TestTradeDatabaseReads:
+    """count_trades / iter_trades agree with get_trades"""
+
+    def test_count_trades(self, db):
+        assert db.count_trades() == 3
+        assert db.count_trades(symbol="MES") == 2
+        assert db.count_trades(symbol="ES") == 0
+
+    def test_iter_trades_matches_get_trades(self, db):
+        streamed = list(db.iter_trades(symbol="MES"))
+        assert streamed == db.get_trades(symbol="MES")
+        assert sorted(t.order_id for t in streamed) == [1000, 1001]
+
+    def test_iter_trades_limit(self, db):
+        assert len(list(db.iter_trades(limit=2))) == 2